@@ -0,0 +1,83 @@
+################################################################################
+# Crypto Batch Benchmark
+##
+# @file bench_en_de_crypt.py
+# @date: 2025
+################################################################################
+"""
+Benchmark for the batch encrypt/decrypt helpers in src.utils.en_de_crypt.
+
+Generates a throwaway RSA key pair, encrypts a set of tokens and reports the
+decryption throughput (tokens/sec) of decrypt_out() on a single core against
+decrypt_many() with an increasing number of worker processes.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_en_de_crypt --tokens 2000
+"""
+
+# Native imports
+import os
+import time
+import argparse
+
+# Third-party imports
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+BENCH_PASSWORD = b"benchmark-only"
+
+def generate_keys_into_env() -> None:
+    """Generate a temporary key pair and expose it through the expected environment variables."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    os.environ["E_PRIVATE_KEY"] = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.BestAvailableEncryption(BENCH_PASSWORD)
+    ).decode()
+    os.environ["E_PRIVATE_PASSWORD"] = BENCH_PASSWORD.decode()
+    os.environ["E_PUBLIC_KEY"] = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch RSA decryption")
+    parser.add_argument("--tokens", type=int, default=2000, help="Number of tokens to decrypt")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="Highest worker count to benchmark")
+    args = parser.parse_args()
+
+    generate_keys_into_env()
+    # Imported after the keys exist, the module loads them at import time
+    from src.utils import en_de_crypt
+
+    messages = [f"secret-{i}" for i in range(args.tokens)]
+    tokens = en_de_crypt.encrypt_many(messages)
+
+    start = time.perf_counter()
+    serial = [en_de_crypt.decrypt_out(token) for token in tokens]
+    serial_elapsed = time.perf_counter() - start
+    assert serial == messages
+    print(f"cores: {os.cpu_count()}  tokens: {args.tokens}")
+    print(f"{'mode':<18}{'seconds':>10}{'tokens/sec':>14}{'speedup':>10}")
+    serial_rate = args.tokens / serial_elapsed
+    print(f"{'decrypt_out':<18}{serial_elapsed:>10.3f}{serial_rate:>14.1f}{1.0:>10.2f}")
+
+    for workers in range(1, args.max_workers + 1):
+        # Warm the pool so process start-up is not part of the measurement
+        warmup_tokens = tokens[:en_de_crypt.BATCH_CHUNK_SIZE * workers * 2]
+        en_de_crypt.decrypt_many(warmup_tokens, max_workers=workers)
+
+        start = time.perf_counter()
+        result = en_de_crypt.decrypt_many(tokens, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        assert result == messages
+
+        label = f"decrypt_many x{workers}"
+        rate, speedup = args.tokens / elapsed, serial_elapsed / elapsed
+        print(f"{label:<18}{elapsed:>10.3f}{rate:>14.1f}{speedup:>10.2f}")
+
+    en_de_crypt.shutdown_process_pool()
+
+if __name__ == "__main__":
+    main()
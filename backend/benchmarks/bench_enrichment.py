@@ -0,0 +1,178 @@
+################################################################################
+# Job Link Enrichment Benchmark
+##
+# @file bench_enrichment.py
+# @date: 2025
+################################################################################
+"""
+Benchmark for the job link crawler against local stand-in job boards.
+
+Starts one http.server per simulated host (each on its own port, so each is
+a separate host for the per-host pools and limits) serving job pages with
+JSON-LD, ETags and an artificial latency; every 10th posting is gone (404)
+and every 7th is closed. The crawler then runs three times:
+
+    cold:        every page is downloaded
+    revalidate:  recheck_seconds=0, every page is revalidated (304 Not Modified)
+    restart:     a new store reading the on-disk cache, nothing is fetched
+
+and pages/sec (links/sec for the restart run) are reported.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_enrichment --pages 2000 --hosts 4
+    python -m benchmarks.bench_enrichment --pages 500 --latency-ms 50 --delay 0.01
+"""
+
+# Native imports
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Other files imports
+from src.api_endpoints.routers.jobs_info.jobs_enrichment import (
+    LinkCrawler, EnrichmentStore, ResponseCache
+)
+
+"""STAND-IN JOB BOARD-----------------------------------------------------------"""
+def job_page(posting_id: int) -> str:
+    """HTML of a job page with a schema.org JobPosting."""
+    sentence = "We are looking for a <b>backend engineer</b> to build data pipelines. "
+    posting = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": f"Backend Engineer {posting_id}",
+        "description": f"<p>{sentence}" * 8 + "</p>",
+        "jobLocation": {"@type": "Place",
+                        "address": {"addressLocality": "Berlin", "addressCountry": "DE"}}
+    }
+    closed = "<p>This position has been filled.</p>" if posting_id % 7 == 0 else ""
+    return (f"<html><head><title>Job {posting_id}</title>"
+            f"<script type=\"application/ld+json\">{json.dumps(posting)}</script></head>"
+            f"<body><h1>Backend Engineer {posting_id}</h1>{closed}</body></html>")
+
+def make_handler(latency: float):
+    class JobBoardHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if self.path == "/robots.txt":
+                body = b"User-agent: *\nDisallow: /private/\n"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            time.sleep(latency)
+            posting_id = int(self.path.rsplit("/", 1)[-1])
+            if posting_id % 10 == 0:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            etag = f'"{posting_id}-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            body = job_page(posting_id).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return JobBoardHandler
+
+def start_servers(hosts: int, latency: float) -> list:
+    """Start the stand-in hosts on free local ports."""
+    servers = []
+    for _ in range(hosts):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(latency))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+"""BENCHMARK-----------------------------------------------------------"""
+async def run(args: argparse.Namespace) -> None:
+    servers = start_servers(args.hosts, args.latency_ms / 1000)
+    links = [f"http://127.0.0.1:{servers[i % args.hosts].server_port}/jobs/{i}"
+             for i in range(1, args.pages + 1)]
+
+    settings = {
+        "max_concurrency": args.concurrency,
+        "per_host_concurrency": args.per_host,
+        "per_host_delay_seconds": args.delay,
+        "timeout_seconds": 10,
+        "recheck_seconds": 86400,
+        "error_retry_seconds": 900,
+        "max_body_bytes": 524288,
+        "snippet_chars": 300,
+        "publish_every": 100,
+        "max_records": args.pages,
+        "max_cache_bytes": 1073741824,
+        # The stand-in hosts listen on 127.0.0.1
+        "allow_private_addresses": True,
+        "user_agent": "Job-Scraper-Backend/1.0 (benchmark)"
+    }
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = EnrichmentStore(settings["max_records"])
+        crawler = LinkCrawler(settings, store,
+                              ResponseCache(cache_dir, settings["max_cache_bytes"]))
+
+        cold = await crawler.crawl(links)
+        liveness = Counter(record["liveness"] for record in store.records.values())
+        print(f"{'cold':<12}{cold['seconds']:8.3f} s  "
+              f"{cold['pages_per_second']:>10} pages/sec  "
+              f"fetched={cold['fetched']} errors={cold['errors']} liveness={dict(liveness)}")
+
+        crawler.settings = {**settings, "recheck_seconds": 0}
+        revalidate = await crawler.crawl(links)
+        print(f"{'revalidate':<12}{revalidate['seconds']:8.3f} s  "
+              f"{revalidate['pages_per_second']:>10} pages/sec  "
+              f"not_modified={revalidate['not_modified']} fetched={revalidate['fetched']}")
+        crawler.close()
+
+        restarted = LinkCrawler(settings, EnrichmentStore(settings["max_records"]),
+                                ResponseCache(cache_dir, settings["max_cache_bytes"]))
+        restart = await restarted.crawl(links)
+        print(f"{'restart':<12}{restart['seconds']:8.3f} s  "
+              f"{restart['links'] / restart['seconds']:>10.1f} links/sec  "
+              f"skipped={restart['skipped']} fetched={restart['fetched']}")
+        restarted.close()
+
+    for server in servers:
+        server.shutdown()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the job link crawler against local servers"
+    )
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20.0,
+                        help="Simulated server latency per request")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host")
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Politeness delay per host in seconds")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
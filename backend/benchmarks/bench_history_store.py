@@ -0,0 +1,119 @@
+################################################################################
+# Jobs History Benchmark
+##
+# @file bench_history_store.py
+# @date: 2025
+################################################################################
+"""
+Benchmark for the SQLite jobs history store.
+
+Seeds a temporary database with a large history (1M postings by default, spread
+over a year), then measures refresh write throughput (one transaction per
+snapshot with a share of new postings) and the latency of the company and
+time range queries.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_history_store --history-rows 1000000 --snapshot-rows 20000
+"""
+
+# Native imports
+import os
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from typing import Callable, Dict, List
+
+# Other files imports
+from src.api_endpoints.routers.jobs_info.jobs_history import JobsHistoryStore
+
+DAY = 86400
+
+def make_job(company_id: int, index: int) -> Dict[str, str]:
+    """Generate a synthetic posting."""
+    return {
+        "company": f"Company {company_id}",
+        "job_title": f"Software Engineer {index}",
+        "link": f"https://jobs.example.com/{company_id}/{index}"
+    }
+
+def seed_history(store: JobsHistoryStore, rows: int, companies: int, batch: int = 50000) -> float:
+    """Insert historical postings spread over the last year, returns rows/sec."""
+    now = time.time()
+    start = time.perf_counter()
+    for batch_start in range(0, rows, batch):
+        taken_at = now - 365 * DAY + (batch_start / rows) * 365 * DAY
+        batch_end = min(batch_start + batch, rows)
+        jobs = [make_job(i % companies, i) for i in range(batch_start, batch_end)]
+        store.record_snapshot(jobs, taken_at=taken_at)
+    return rows / (time.perf_counter() - start)
+
+def time_query(query: Callable[[], object], runs: int) -> List[float]:
+    """Run a query several times and return latencies in ms."""
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        query()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the jobs history store")
+    parser.add_argument("--history-rows", type=int, default=1_000_000)
+    parser.add_argument("--snapshot-rows", type=int, default=20_000)
+    parser.add_argument("--new-ratio", type=float, default=0.1,
+                        help="Share of new postings per snapshot")
+    parser.add_argument("--companies", type=int, default=2_000)
+    parser.add_argument("--refreshes", type=int, default=5)
+    parser.add_argument("--query-runs", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = JobsHistoryStore(os.path.join(directory, "history.sqlite3"))
+
+        seed_rate = seed_history(store, args.history_rows, args.companies)
+        print(f"seeded {args.history_rows} postings at {seed_rate:,.0f} rows/sec")
+
+        # Refreshes: most postings already known (last_seen update), a share is new
+        known = args.snapshot_rows - int(args.snapshot_rows * args.new_ratio)
+        next_index = args.history_rows
+        write_rates = []
+        new_rows = args.snapshot_rows - known
+        for _ in range(args.refreshes):
+            jobs = [make_job(i % args.companies, i)
+                    for i in range(args.history_rows - known, args.history_rows)]
+            jobs += [make_job(i % args.companies, i)
+                     for i in range(next_index, next_index + new_rows)]
+            next_index += new_rows
+            result = store.record_snapshot(jobs)
+            write_rates.append(result["rows"] / result["seconds"])
+        print(f"refresh of {args.snapshot_rows} rows: "
+              f"{statistics.median(write_rates):,.0f} rows/sec (median)")
+
+        now = time.time()
+        month_ago = now - 30 * DAY
+
+        def random_company() -> str:
+            return f"Company {random.randrange(args.companies)}"
+
+        queries = {
+            "company, last 30 days": lambda: store.query_postings(
+                company=random_company(), since=month_ago, until=now),
+            "company, new in 30 days": lambda: store.query_postings(
+                company=random_company(), since=month_ago, until=now, new_only=True),
+            "all, new in last day": lambda: store.query_postings(
+                since=now - DAY, until=now, new_only=True),
+            "company counts, 30 days": lambda: store.company_counts(
+                since=month_ago, until=now, new_only=True),
+        }
+        print(f"{'query':<28}{'p50 ms':>10}{'p95 ms':>10}")
+        for name, query in queries.items():
+            latencies = sorted(time_query(query, args.query_runs))
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(f"{name:<28}{statistics.median(latencies):>10.2f}{p95:>10.2f}")
+
+        store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+################################################################################
+# Jobs Hot Path Micro-benchmarks
+##
+# @file bench_hot_path.py
+# @date: 2025
+################################################################################
+"""
+Micro-benchmark regression suite for the jobs hot path.
+
+Covers parse_csv_to_jobs() on generated sheets (plain, quoted and
+unicode-heavy data, 1k to 1M rows), the cache checks used on every request
+(is_cache_valid()/get_jobs_cache()) and the response construction of
+get_jobs_list_endpoint() (cold encoding and a result cache hit).
+
+Every benchmark is timed in samples that each loop long enough to last at
+least MIN_SAMPLE_SECONDS. Each sample is paired with a run of a fixed reference
+workload right before it, and the sample is also expressed relative to that
+run: the speed of shared or throttled machines drifts by tens of percent
+within seconds, and the ratio cancels that drift out. A result is the median
+time, the median ratio and the spread of the ratios (median absolute deviation
+relative to the median). "run --save" stores them as the baseline in
+benchmarks/baselines/hot_path.json; "compare" runs the suite again and flags a
+benchmark only when its median ratio grew by more than its own allowed change:
+the threshold, or NOISE_FACTOR times the combined spread of baseline and
+current run when the benchmark is noisier than that.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_hot_path run
+    python -m benchmarks.bench_hot_path run --save
+    python -m benchmarks.bench_hot_path compare --threshold 0.25 --noise-factor 3
+    python -m benchmarks.bench_hot_path compare --sizes 1000 10000
+"""
+
+# Native imports
+import io
+import gc
+import os
+import csv
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import statistics
+import platform
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+# Other files imports
+from src.api_endpoints.routers.jobs_info import jobs_utils
+from src.api_endpoints.routers.jobs_info.jobs_result_cache import QueryResultCache
+from src.api_endpoints.routers.jobs_info.jobs_serialization import (
+    JOB_COLUMNS, serialize_jobs_data, build_list_response
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "baselines", "hot_path.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+PROFILES = ("plain", "quoted", "unicode")
+# Every sample loops for at least this long, shorter ones mostly measure timer and scheduler noise
+MIN_SAMPLE_SECONDS = 0.1
+# Samples per benchmark: as many as fit in the budget, within [MIN_SAMPLES, MAX_SAMPLES]
+SAMPLE_BUDGET_SECONDS = 2.0
+MIN_SAMPLES = 3
+MAX_SAMPLES = 15
+NOISE_FACTOR = 3.0
+REFERENCE_LOOPS = 20_000
+
+"""DATA GENERATION-----------------------------------------------------------"""
+UNICODE_WORDS = ["Müller", "Ñandú", "Straße", "Zürich", "東京", "データ", "инженер", "Αθήνα",
+                 "مهندس", "🚀", "Łódź", "Göteborg"]
+ASCII_WORDS = ["Senior", "Python", "Backend", "Data", "Cloud", "Engineer", "Developer",
+               "Platform", "Analyst", "Lead"]
+
+def generate_sheet(rows: int, profile: str, seed: int = 42) -> str:
+    """
+    Generate a CSV export like the Google Sheets one.
+
+    plain:   ASCII values without delimiters
+    quoted:  values containing commas and escaped quotes, so every field is quoted
+    unicode: multi-byte characters from several scripts (and emoji)
+    """
+    generator = random.Random(seed)
+    words = UNICODE_WORDS if profile == "unicode" else ASCII_WORDS
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL if profile == "quoted" else csv.QUOTE_MINIMAL)
+    writer.writerow(JOB_COLUMNS)
+    for index in range(rows):
+        company = f"{generator.choice(words)} {generator.choice(words)} GmbH"
+        title = " ".join(generator.choice(words) for _ in range(4))
+        if profile == "quoted":
+            company = f"{company}, Berlin"
+            title = f'{title} "remote", full-time'
+        writer.writerow([company, title, f"https://jobs.example.com/{index}?ref=sheet"])
+    return buffer.getvalue()
+
+def generate_jobs(rows: int) -> List[Dict[str, str]]:
+    """Job rows as stored in the cache."""
+    return jobs_utils.parse_csv_to_jobs(generate_sheet(rows, "plain"))
+
+"""TIMING-----------------------------------------------------------"""
+def reference_workload() -> int:
+    """
+    Fixed pure-Python work (string handling like the parser).
+
+    Its duration tracks the speed of the machine at the moment it runs.
+    """
+    total = 0
+    for index in range(REFERENCE_LOOPS):
+        total += len(f"{index},Company {index},Title".split(",")[1].strip())
+    return total
+
+def timed(function: Callable[[], object], loops: int) -> float:
+    """Seconds per call over loops calls, with the garbage collector paused as timeit does."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        return (time.perf_counter() - start) / loops
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def measure(function: Callable[[], object]) -> Tuple[float, float, float]:
+    """
+    Time a benchmark against the reference workload.
+
+    A first call calibrates the loop count, so every sample lasts at least
+    MIN_SAMPLE_SECONDS, and the number of samples (bigger inputs get fewer).
+
+    Returns:
+        Tuple of the median seconds per call, the median ratio to the
+        reference workload and the median absolute deviation of the ratios
+        divided by their median
+    """
+    start = time.perf_counter()
+    function()
+    single = max(time.perf_counter() - start, 1e-9)
+    inner_loops = max(1, math.ceil(MIN_SAMPLE_SECONDS / single))
+    budget_samples = int(SAMPLE_BUDGET_SECONDS / (single * inner_loops))
+    samples = min(MAX_SAMPLES, max(MIN_SAMPLES, budget_samples))
+
+    timings, ratios = [], []
+    for _ in range(samples):
+        reference = timed(reference_workload, 1)
+        timing = timed(function, inner_loops)
+        timings.append(timing)
+        ratios.append(timing / reference)
+
+    ratio = statistics.median(ratios)
+    deviation = statistics.median(abs(value - ratio) for value in ratios)
+    return statistics.median(timings), ratio, deviation / ratio
+
+def format_seconds(seconds: float) -> str:
+    """Human readable duration."""
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.3f} us"
+
+"""SUITE-----------------------------------------------------------"""
+def run_suite(sizes: List[int]) -> Dict[str, Tuple[float, float, float]]:
+    """Run every benchmark and return (median seconds, median ratio, spread) per benchmark name."""
+    results: Dict[str, Tuple[float, float, float]] = {}
+
+    def record(name: str, function: Callable[[], object]) -> None:
+        results[name] = measure(function)
+        seconds, ratio, spread = results[name]
+        print(f"{name:<45}{format_seconds(seconds):>12}{ratio:>12.4g}{spread:>10.1%}", flush=True)
+
+    print(f"{'benchmark':<45}{'median':>12}{'ratio':>12}{'spread':>10}")
+
+    for size in sizes:
+        for profile in PROFILES:
+            sheet = generate_sheet(size, profile)
+            record(f"parse_csv_to_jobs/{profile}/{size}",
+                   lambda: jobs_utils.parse_csv_to_jobs(sheet))
+
+    # Cache checks run on every request
+    jobs_utils.update_cache(generate_jobs(1_000))
+    record("is_cache_valid", jobs_utils.is_cache_valid)
+    record("get_jobs_cache", jobs_utils.get_jobs_cache)
+
+    meta = {"count": 0, "last_updated": datetime.now().isoformat(), "cached": True,
+            "cache_duration": 300}
+    for size in sizes:
+        jobs = generate_jobs(size)
+        meta["count"] = len(jobs)
+        for response_format in ("full", "compact"):
+            record(f"list_response/{response_format}/cold/{size}",
+                   lambda: build_list_response(
+                       serialize_jobs_data(jobs, JOB_COLUMNS, response_format), meta, None))
+
+        # Result cache hit: only the metadata is encoded per request
+        query_key = (("", ""), JOB_COLUMNS, "full", 0, None)
+        result_cache = QueryResultCache(max_bytes=1 << 40)
+        encoded = serialize_jobs_data(jobs, JOB_COLUMNS, "full")
+        result_cache.put(size, query_key, encoded, len(jobs), len(jobs))
+        record(f"list_response/full/warm/{size}",
+               lambda: build_list_response(result_cache.get(size, query_key)[0], meta, None))
+
+    return results
+
+"""BASELINE-----------------------------------------------------------"""
+def machine_info() -> Dict[str, str]:
+    """Describe where the numbers come from, baselines only compare well on similar machines."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": str(os.cpu_count())
+    }
+
+def save_baseline(results: Dict[str, Tuple[float, float, float]], path: str) -> None:
+    """Write the median times, ratios and spreads as the new baseline."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"created": datetime.now().isoformat(timespec="seconds"),
+                   "machine": machine_info(),
+                   "results": {name: seconds for name, (seconds, _, _) in results.items()},
+                   "ratios": {name: ratio for name, (_, ratio, _) in results.items()},
+                   "spread": {name: spread for name, (_, _, spread) in results.items()}},
+                  file, indent=4, sort_keys=True)
+        file.write("\n")
+    print(f"Baseline saved to {path}")
+
+def allowed_change(threshold: float, noise_factor: float, baseline_spread: float,
+                   current_spread: float) -> float:
+    """Slowdown a benchmark may show before it is flagged, above the threshold if noisy."""
+    return max(threshold, noise_factor * (baseline_spread + current_spread))
+
+def compare_with_baseline(results: Dict[str, Tuple[float, float, float]], path: str,
+                          threshold: float, noise_factor: float) -> int:
+    """
+    Compare the median ratios to the reference workload with the stored baseline.
+
+    Returns:
+        int: Number of benchmarks slower than the baseline by more than their allowed change.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        stored = json.load(file)
+    if "ratios" not in stored:
+        raise SystemExit(f"{path} has no reference ratios, save it again with 'run --save'")
+    baseline = stored["results"]
+    baseline_ratios, baseline_spreads = stored["ratios"], stored["spread"]
+
+    regressions = 0
+    print(f"\n{'benchmark':<45}{'baseline':>12}{'current':>12}{'change':>10}{'allowed':>10}")
+    for name, (current, ratio, spread) in results.items():
+        if name not in baseline_ratios:
+            continue
+        change = ratio / baseline_ratios[name] - 1
+        allowed = allowed_change(threshold, noise_factor, baseline_spreads[name], spread)
+        flag = ""
+        if change > allowed:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name:<45}{format_seconds(baseline[name]):>12}{format_seconds(current):>12}"
+              f"{change:>+10.1%}{allowed:>+10.1%}{flag}")
+
+    print(f"\n{regressions} regression(s) above the allowed change (threshold {threshold:.0%}, "
+          f"noise factor {noise_factor:g}); change is measured on the ratio to the "
+          f"reference workload")
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Jobs hot path micro-benchmarks")
+    parser.add_argument("command", choices=["run", "compare"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true",
+                        help="Store the results as the new baseline (run only)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before flagging, 0.25 = 25%%")
+    parser.add_argument("--noise-factor", type=float, default=NOISE_FACTOR,
+                        help="Multiple of the measured spread a noisy benchmark may additionally "
+                             "drift")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes)
+    if args.command == "run":
+        if args.save:
+            save_baseline(results, args.baseline)
+        return 0
+    regressions = compare_with_baseline(results, args.baseline, args.threshold, args.noise_factor)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+################################################################################
+# Normalization Benchmark
+##
+# @file bench_normalization.py
+# @date: 2025
+################################################################################
+"""
+Benchmark for the normalization and duplicate detection stage.
+
+Generates job rows with a share of exact duplicates (whitespace, legal suffix
+punctuation, tracking parameters) and near duplicates (title variations), and
+reports rows/sec per size so the scaling up to 1M rows can be checked for
+linearity.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_normalization --sizes 100000 250000 500000 1000000
+"""
+
+# Native imports
+import time
+import random
+import argparse
+from typing import Dict, List
+
+# Other files imports
+from src.api_endpoints.routers.jobs_info.jobs_normalization import normalize_and_deduplicate
+
+TITLE_WORDS = ["Senior", "Junior", "Python", "Backend", "Data", "Cloud", "Engineer", "Developer",
+               "Platform", "Analyst", "Manager", "Frontend", "DevOps", "Machine", "Learning",
+               "Lead"]
+
+def generate_jobs(rows: int, duplicate_ratio: float = 0.2, seed: int = 7) -> List[Dict[str, str]]:
+    """Generate job rows where roughly duplicate_ratio of them are exact or near duplicates."""
+    generator = random.Random(seed)
+    jobs = []
+    while len(jobs) < rows:
+        company = f"Company {generator.randrange(rows // 20 + 1)} GmbH"
+        title = " ".join(generator.sample(TITLE_WORDS, 4)) + f" {generator.randrange(10_000)}"
+        link = f"https://jobs.example.com/{company.split()[1]}/{generator.randrange(10**9)}"
+        jobs.append({"company": company, "job_title": title, "link": link})
+
+        if generator.random() < duplicate_ratio:
+            if generator.random() < 0.5:
+                # Exact duplicate after normalization
+                jobs.append({"company": f" {company}. ", "job_title": f"{title} ",
+                             "link": f"{link}?utm_source=linkedin&gclid=abc"})
+            else:
+                # Near duplicate: same posting, title with an extra token, no link
+                jobs.append({"company": company, "job_title": f"{title} (m/w/d)", "link": "#"})
+    return jobs[:rows]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark job normalization and deduplication")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[100_000, 250_000, 500_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}{'seconds':>10}{'rows/sec':>12}{'exact':>10}{'near':>10}{'sec/100k':>10}")
+    for size in args.sizes:
+        jobs = generate_jobs(size)
+        start = time.perf_counter()
+        _, stats = normalize_and_deduplicate(jobs)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>10}{elapsed:>10.2f}{size / elapsed:>12,.0f}{stats['exact_duplicates']:>10}"
+              f"{stats['near_duplicates']:>10}{elapsed / size * 100_000:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+################################################################################
+# Parallel CSV Parsing Benchmark
+##
+# @file bench_parallel_parse.py
+# @date: 2025
+################################################################################
+"""
+Benchmark for the process pool CSV parser.
+
+Parses the same generated export inline (parse_csv_to_jobs()) and with
+parse_csv_parallel() for an increasing number of workers, and reports rows/sec
+and the speedup over inline parsing. Pool start-up is excluded: each pool is
+warmed up by an untimed run, as the server keeps its pool between refreshes.
+Speedups above 1x need as many free CPU cores as workers.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_parallel_parse --rows 1000000
+    python -m benchmarks.bench_parallel_parse --rows 500000 --workers 1 2 4 8 --profile quoted
+"""
+
+# Native imports
+import time
+import argparse
+
+# Other files imports
+from src.api_endpoints.routers.jobs_info.jobs_utils import (
+    parse_csv_to_jobs, parse_csv_parallel, shutdown_parse_pool, available_cpu_count
+)
+from benchmarks.bench_hot_path import generate_sheet, PROFILES
+
+def default_workers() -> list:
+    """1, 2, 4, ... up to the number of CPUs available to the process."""
+    cpu_count = available_cpu_count()
+    workers = [1]
+    while workers[-1] * 2 <= cpu_count:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cpu_count:
+        workers.append(cpu_count)
+    return workers
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark parallel CSV parsing")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--profile", choices=PROFILES, default="plain")
+    args = parser.parse_args()
+
+    csv_text = generate_sheet(args.rows, args.profile)
+    print(f"rows: {args.rows}  size: {len(csv_text) / 1e6:.1f} M chars  "
+          f"cpu cores: {available_cpu_count()}")
+
+    start = time.perf_counter()
+    expected = parse_csv_to_jobs(csv_text)
+    inline_elapsed = time.perf_counter() - start
+    inline_rate = len(expected) / inline_elapsed
+    print(f"{'inline':<12}{inline_elapsed:8.3f} s  {inline_rate:>12,.0f} rows/sec")
+
+    for workers in args.workers or default_workers():
+        parse_csv_parallel(csv_text, workers)  # Untimed run, starts every worker of the pool
+
+        start = time.perf_counter()
+        jobs = parse_csv_parallel(csv_text, workers)
+        elapsed = time.perf_counter() - start
+
+        assert jobs == expected, "parallel result differs from inline parsing"
+        print(f"{workers:>2} workers {elapsed:8.3f} s  {len(jobs) / elapsed:>12,.0f} rows/sec  "
+              f"{inline_elapsed / elapsed:5.2f}x")
+
+    shutdown_parse_pool()
+
+if __name__ == "__main__":
+    main()
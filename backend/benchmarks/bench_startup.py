@@ -0,0 +1,161 @@
+################################################################################
+# Startup Benchmark
+##
+# @file bench_startup.py
+# @date: 2025
+################################################################################
+"""
+Startup benchmark for the backend.
+
+Reports the import time of main.py broken down per module (using
+`python -X importtime`) and the time-to-first-request of a freshly started
+uvicorn server. Exits with status 1 when a budget from startup_budget.json
+is exceeded, so it can gate CI.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget benchmarks/startup_budget.json --top 20
+"""
+
+# Native imports
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+# Third-party imports
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_PATH = os.path.join(BACKEND_DIR, "benchmarks", "startup_budget.json")
+
+def measure_import_times() -> Tuple[float, List[Tuple[str, float, float]]]:
+    """
+    Import main.py in a fresh interpreter and collect per-module import times.
+
+    Returns:
+        Tuple of the cumulative import time of main in ms and a list of
+        (module, self_ms, cumulative_ms) for every imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+
+    modules = []
+    main_cumulative_ms = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        entry = (module, int(self_us) / 1000, int(cumulative_us) / 1000)
+        modules.append(entry)
+        if module == "main":
+            main_cumulative_ms = entry[2]
+    return main_cumulative_ms, modules
+
+def get_free_port() -> int:
+    """Ask the OS for a free local port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def measure_first_request(timeout: float = 30.0) -> float:
+    """
+    Start uvicorn in a subprocess and time until the root endpoint answers.
+
+    Returns:
+        Milliseconds from process spawn to the first successful response.
+    """
+    port = get_free_port()
+    command = [
+        sys.executable, "-c",
+        "import uvicorn; "
+        f"uvicorn.run('main:app', host='127.0.0.1', port={port}, log_level='warning')"
+    ]
+
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=BACKEND_DIR,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                if requests.get(f"http://127.0.0.1:{port}/", timeout=1).ok:
+                    return (time.perf_counter() - start) * 1000
+            except requests.RequestException:
+                pass
+            if process.poll() is not None:
+                raise RuntimeError("Server process exited before answering")
+            time.sleep(0.01)
+        raise RuntimeError(f"Server did not answer within {timeout} seconds")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+def check_budgets(results: Dict[str, float], slowest_module: Tuple[str, float, float],
+                  budget: Dict[str, float]) -> List[str]:
+    """Return a human readable message for each exceeded budget."""
+    failures = []
+    if results["import_ms"] > budget["import_budget_ms"]:
+        failures.append(
+            f"import main: {results['import_ms']:.1f} ms > {budget['import_budget_ms']} ms"
+        )
+    if slowest_module[1] > budget["module_budget_ms"]:
+        failures.append(
+            f"module {slowest_module[0]}: {slowest_module[1]:.1f} ms"
+            f" > {budget['module_budget_ms']} ms"
+        )
+    if results["first_request_ms"] > budget["first_request_budget_ms"]:
+        failures.append(
+            f"time to first request: {results['first_request_ms']:.1f} ms "
+            f"> {budget['first_request_budget_ms']} ms"
+        )
+    return failures
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark backend import time and time-to-first-request"
+    )
+    parser.add_argument("--budget", default=DEFAULT_BUDGET_PATH,
+                        help="JSON file with the budgets in ms")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to print")
+    args = parser.parse_args()
+
+    with open(args.budget, "r", encoding="utf-8") as file:
+        budget = json.load(file)
+
+    import_ms, modules = measure_import_times()
+    first_request_ms = measure_first_request()
+
+    slowest = sorted(modules, key=lambda module: module[2], reverse=True)
+    # Self time of the backend's own modules is the import-time work done by this repo
+    project_modules = sorted(
+        (module for module in modules if module[0] == "main" or module[0].startswith("src.")),
+        key=lambda module: module[1], reverse=True
+    )
+
+    print(f"{'module':<55}{'self ms':>10}{'cumul. ms':>12}")
+    for module, self_ms, cumulative_ms in slowest[:args.top]:
+        print(f"{module:<55}{self_ms:>10.1f}{cumulative_ms:>12.1f}")
+    print()
+    print("backend modules (self time):")
+    for module, self_ms, cumulative_ms in project_modules[:args.top]:
+        print(f"{module:<55}{self_ms:>10.1f}{cumulative_ms:>12.1f}")
+    print()
+    print(f"import main:           {import_ms:10.1f} ms (budget {budget['import_budget_ms']} ms)")
+    print(f"time to first request: {first_request_ms:10.1f} ms "
+          f"(budget {budget['first_request_budget_ms']} ms)")
+
+    results = {"import_ms": import_ms, "first_request_ms": first_request_ms}
+    failures = check_budgets(results, project_modules[0], budget)
+    for failure in failures:
+        print(f"BUDGET EXCEEDED: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+################################################################################
+# Job Row Validation Benchmark
+##
+# @file bench_validation.py
+# @date: 2025
+################################################################################
+"""
+Benchmark for the batch job row validator.
+
+Builds a CSV export of generated rows (with a share of invalid ones), and
+compares the time of validate_job_rows() with the other ingestion stages
+(parse_csv_to_jobs() and normalize_and_deduplicate()) for the same snapshot,
+i.e. the share validation adds to a refresh.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_validation --rows 100000
+"""
+
+# Native imports
+import csv
+import io
+import time
+import argparse
+
+# Other files imports
+from src.utils.validators import validate_job_rows
+from src.api_endpoints.routers.jobs_info.jobs_utils import parse_csv_to_jobs
+from src.api_endpoints.routers.jobs_info.jobs_normalization import normalize_and_deduplicate
+from benchmarks.bench_normalization import generate_jobs
+
+def build_csv(rows: int) -> str:
+    """CSV export of generated jobs where every 50th row has an invalid link."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["company", "job_title", "link"])
+    for index, job in enumerate(generate_jobs(rows)):
+        link = "not a link" if index % 50 == 0 else job["link"]
+        writer.writerow([job["company"], job["job_title"], link])
+    return buffer.getvalue()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch job row validation")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    csv_text = build_csv(args.rows)
+
+    start = time.perf_counter()
+    jobs = parse_csv_to_jobs(csv_text)
+    parse_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid_jobs, report = validate_job_rows(jobs)
+    validate_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalize_and_deduplicate(valid_jobs)
+    normalize_elapsed = time.perf_counter() - start
+
+    total = parse_elapsed + validate_elapsed + normalize_elapsed
+    print(f"rows: {len(jobs)}  kept: {len(valid_jobs)}  rejections: {report['rejections']}  "
+          f"replaced_links: {report['replaced_links']}")
+    print(f"parse:     {parse_elapsed:8.3f} s")
+    print(f"normalize: {normalize_elapsed:8.3f} s")
+    print(f"validate:  {validate_elapsed:8.3f} s ({validate_elapsed / total:.1%} of ingestion, "
+          f"{len(jobs) / validate_elapsed:,.0f} rows/sec)")
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,13 @@
 
 This module initializes the FastAPI backend locally for development.
 It sets up routers, custom logger, rate limiter, and loads environment variables.
+Importing it has no side effects, file logging and configuration are initialized
+in the lifespan handler.
 """
 
 #Native imports
 import os
+import asyncio
 from contextlib import asynccontextmanager
 
 #Third-party imports
@@ -20,13 +23,12 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
-from dotenv import load_dotenv
-load_dotenv()
 
 #Other files imports
 from src.utils.request_limiter import rate_limit_handler
-from src.utils.custom_logger import log_handler
+from src.utils.custom_logger import log_handler, setup_file_logging
 from src.utils.limiter import limiter
+from src.utils.tracing import TracingMiddleware, setup_tracing, shutdown_tracing
 
 #Json files
 from src.core_specs.configuration.config_loader import config_loader
@@ -35,17 +37,48 @@ from src.core_specs.configuration.config_loader import config_loader
 from src.api_endpoints.root_endpoint import router as root_router
 from src.api_endpoints.routers.jobs_info import jobs_router
 from src.api_endpoints.routers.health_check import router as health_router
+from src.api_endpoints.routers.probes import router as probes_router
+from src.api_endpoints.routers.jobs_info.jobs_history import close_history_store
+from src.api_endpoints.routers.jobs_info.jobs_utils import shutdown_parse_pool
+from src.api_endpoints.routers.jobs_info.jobs_enrichment import shutdown_enrichment
+from src.api_endpoints.routers.jobs_info.jobs_refresh_tasks import start_refresh, get_refresh_task
 
 """ENVIRONMENT VARIABLES---------------------------------------------------"""
-# Google Sheets configuration is loaded via config_loader from .env file
+# Google Sheets configuration is loaded lazily via config_loader from .env file
 
 """API APP-----------------------------------------------------------"""
 #Lifespan event manager (startup and shutdown)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Subsystems are initialized here instead of at import time
+    setup_file_logging()
+    config_loader.load()
+    if config_loader["tracing"]["enabled"]:
+        tracing_settings = config_loader["tracing"]
+        setup_tracing(tracing_settings["file_path"], tracing_settings["flush_interval_seconds"],
+                      tracing_settings["max_file_bytes"])
+
+    # Watch config_file.json so limits and job source settings can change without a restart
+    config_watcher = None
+    if config_loader["config_reload"]["enabled"]:
+        config_watcher = asyncio.create_task(config_loader.watch())
+
+    # Warm the default sheet in the background, readiness stays 503 until a snapshot is cached
+    warmup_refresh = None
+    if config_loader["defaults"]["doc_id"]:
+        warmup_refresh, _ = start_refresh()
+
     port = config_loader["network"]["server_port"]
     log_handler.info(f"Scraps metal server starting on port {port}")
     yield
+    if config_watcher:
+        config_watcher.cancel()
+    if warmup_refresh and get_refresh_task(warmup_refresh["refresh_id"]):
+        get_refresh_task(warmup_refresh["refresh_id"]).cancel()
+    await shutdown_enrichment()
+    close_history_store()
+    shutdown_parse_pool()
+    shutdown_tracing()
     log_handler.info("Scraps metal server shutting down")
 
 #Create FastAPI app
@@ -61,6 +94,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Probes are polled constantly and must stay cheap, they are never traced
+_probes = config_loader.static_section("probes")
+UNTRACED_PATHS = frozenset(
+    _probes["endpoint_prefix"] + _probes[route] for route in ("liveness_route", "readiness_route")
+)
+
+# Root span of every other request, the trace id is returned so a slow response can be
+# found in the traces.
+# A pure ASGI middleware: probes pass through it without a task or stream wrapping
+app.add_middleware(TracingMiddleware, untraced_paths=UNTRACED_PATHS)
+
 """VARIOUS-----------------------------------------------------------"""
 #Setup rate limiter
 app.state.limiter = limiter
@@ -75,6 +119,8 @@ app.include_router(root_router)
 app.include_router(jobs_router)
 #Health
 app.include_router(health_router)
+#Liveness and readiness probes
+app.include_router(probes_router)
 
 """Start server-----------------------------------------------------------"""
 if __name__ == "__main__":
@@ -17,23 +17,20 @@ from fastapi import APIRouter, Request
 
 #Other files imports
 from src.utils.custom_logger import log_handler
-from src.utils.limiter import limiter as SlowLimiter
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
 from src.core_specs.configuration.config_loader import config_loader
 
 """API ROUTER-----------------------------------------------------------"""
 # Get API router
 router = APIRouter(
-    prefix=config_loader['endpoints']['root_directory_endpoint']['endpoint_prefix'],
-    tags=[config_loader['endpoints']['root_directory_endpoint']['endpoint_tag']],
+    prefix=config_loader.static_section('endpoints')['root_directory_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['root_directory_endpoint']['endpoint_tag']],
 )
 
 """ENDPOINT-----------------------------------------------------------"""
 # Check if app works
-@router.get(config_loader['endpoints']['root_directory_endpoint']['endpoint_route'])
-@SlowLimiter.limit(
-    f"{config_loader['endpoints']['root_directory_endpoint']['request_limit']}/"
-    f"{config_loader['endpoints']['root_directory_endpoint']['unit_of_time_for_limit']}"
-)  # Root endpoint rate limit
+@router.get(config_loader.static_section('endpoints')['root_directory_endpoint']['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('root_directory_endpoint'))  # Root endpoint rate limit
 async def root_endpoint(request: Request):
     """
     Root endpoint to verify that the API is operational.
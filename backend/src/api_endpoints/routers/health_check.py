@@ -17,21 +17,21 @@ from fastapi import APIRouter, Request
 
 # Other files imports
 from src.utils.custom_logger import log_handler
-from src.utils.limiter import limiter as SlowLimiter
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
 from src.core_specs.configuration.config_loader import config_loader
+from src.api_endpoints.routers.jobs_info.jobs_utils import get_jobs_cache, get_sheet_cache_stats
+from src.api_endpoints.routers.jobs_info.jobs_result_cache import result_cache
+from src.api_endpoints.routers.jobs_info.jobs_enrichment import get_enrichment_stats
 
 """API ROUTER-----------------------------------------------------------"""
 router = APIRouter(
-    prefix=config_loader['endpoints']['health_check_endpoint']['endpoint_prefix'],
-    tags=[config_loader['endpoints']['health_check_endpoint']['endpoint_tag']],
+    prefix=config_loader.static_section('endpoints')['health_check_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['health_check_endpoint']['endpoint_tag']],
 )
 
 """ENDPOINT-----------------------------------------------------------"""
-@router.get(config_loader['endpoints']['health_check_endpoint']['endpoint_route'])
-@SlowLimiter.limit(
-    f"{config_loader['endpoints']['health_check_endpoint']['request_limit']}/"
-    f"{config_loader['endpoints']['health_check_endpoint']['unit_of_time_for_limit']}"
-)
+@router.get(config_loader.static_section('endpoints')['health_check_endpoint']['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('health_check_endpoint'))
 async def health_check_endpoint(request: Request) -> Dict[str, Any]:
     """
     Health check endpoint to verify API status and configuration.
@@ -45,10 +45,25 @@ async def health_check_endpoint(request: Request) -> Dict[str, Any]:
     log_handler.debug("Health check requested")
     
     # Check configuration status
+    config = config_loader.snapshot()
     config_status = {
-        "sheet_configured": bool(config_loader['defaults']['doc_id']),
-        "sheet_id": config_loader['defaults']['doc_id'][:10] + "..." if config_loader['defaults']['doc_id'] else None,
-        "sheet_name": config_loader['defaults']['job_sheet_name']
+        "sheet_configured": bool(config['defaults']['doc_id']),
+        "sheet_id": (config['defaults']['doc_id'][:10] + "..."
+                     if config['defaults']['doc_id'] else None),
+        "sheet_name": config['defaults']['job_sheet_name'],
+        "config_version": config_loader.version,
+        "allowed_sheets": sorted(config['sheets']['allowlist'])
+    }
+    
+    # Ingestion counters of the cached snapshot (e.g. merged duplicate rows)
+    cache = get_jobs_cache()
+    snapshot_status = {
+        "version": cache["version"],
+        "count": len(cache["data"]),
+        "ingest": cache["ingest_stats"],
+        "result_cache": result_cache.stats(),
+        "sheet_caches": get_sheet_cache_stats(),
+        "enrichment": get_enrichment_stats()
     }
     
     return {
@@ -57,10 +72,14 @@ async def health_check_endpoint(request: Request) -> Dict[str, Any]:
         "service": "Job Scraper Backend API",
         "version": "1.0.0",
         "configuration": config_status,
+        "snapshot": snapshot_status,
         "endpoints": {
             "jobs_list": "/api/v1/jobs/list",
             "jobs_refresh": "/api/v1/jobs/refresh",
+            "jobs_export": "/api/v1/jobs/export",
             "health": "/api/v1/health",
+            "liveness": "/api/v1/health/live",
+            "readiness": "/api/v1/health/ready",
             "docs": "/docs"
         }
     }
\ No newline at end of file
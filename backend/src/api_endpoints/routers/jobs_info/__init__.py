@@ -10,6 +10,11 @@ from fastapi import APIRouter
 # Import individual endpoint routers
 from .get_jobs_list import router as get_jobs_router
 from .refresh_jobs import router as refresh_jobs_router
+from .get_refresh_status import router as refresh_status_router
+from .export_jobs import router as export_jobs_router
+from .get_jobs_history import router as jobs_history_router
+from .get_history_companies import router as history_companies_router
+from .get_jobs_facets import router as jobs_facets_router
 
 # Create main jobs router that combines all job endpoints
 jobs_router = APIRouter()
@@ -17,6 +22,11 @@ jobs_router = APIRouter()
 # Include individual endpoint routers
 jobs_router.include_router(get_jobs_router)
 jobs_router.include_router(refresh_jobs_router)
+jobs_router.include_router(refresh_status_router)
+jobs_router.include_router(export_jobs_router)
+jobs_router.include_router(jobs_history_router)
+jobs_router.include_router(history_companies_router)
+jobs_router.include_router(jobs_facets_router)
 
 # Export the combined router
 __all__ = ["jobs_router"]
\ No newline at end of file
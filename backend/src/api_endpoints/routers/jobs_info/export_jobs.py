@@ -0,0 +1,293 @@
+################################################################################
+# Export Jobs Endpoint
+##
+# @file export_jobs.py
+# @date: 2025
+################################################################################
+"""
+This module defines the endpoint to bulk export the current job snapshot.
+The snapshot is streamed in chunks as NDJSON, CSV, Arrow IPC or Parquet, so
+memory per request stays constant regardless of the number of jobs.
+CSV exports support HTTP range requests to resume interrupted downloads.
+"""
+
+# Native imports
+import io
+import csv
+import json
+import hashlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Third-party imports
+from fastapi import APIRouter, Request, HTTPException, Query
+from fastapi.responses import StreamingResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
+from src.core_specs.configuration.config_loader import config_loader
+from .jobs_utils import fetch_jobs_from_sheets, get_jobs_cache
+from .jobs_serialization import JOB_COLUMNS
+from .jobs_result_cache import get_csv_info_entry, cache_csv_info
+
+"""API ROUTER-----------------------------------------------------------"""
+router = APIRouter(
+    prefix=config_loader.static_section('endpoints')['export_jobs_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['export_jobs_endpoint']['endpoint_tag']],
+)
+
+"""EXPORT FORMATS-----------------------------------------------------------"""
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+def iter_row_chunks(jobs: List[Dict[str, str]], chunk_rows: int) -> Iterator[List[Dict[str, str]]]:
+    """Yield consecutive slices of the snapshot, chunk_rows jobs at a time."""
+    for start in range(0, len(jobs), chunk_rows):
+        yield jobs[start:start + chunk_rows]
+
+def iter_ndjson(jobs: List[Dict[str, str]], chunk_rows: int) -> Iterator[bytes]:
+    """Yield the snapshot as newline delimited JSON, one encoded chunk at a time."""
+    for chunk in iter_row_chunks(jobs, chunk_rows):
+        yield "".join(json.dumps(job, ensure_ascii=False) + "\n" for job in chunk).encode("utf-8")
+
+def iter_csv(jobs: List[Dict[str, str]], chunk_rows: int) -> Iterator[bytes]:
+    """Yield the snapshot as CSV (header first), one encoded chunk at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(JOB_COLUMNS)
+    yield buffer.getvalue().encode("utf-8")
+
+    for chunk in iter_row_chunks(jobs, chunk_rows):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([job.get(column, "") for column in JOB_COLUMNS] for job in chunk)
+        yield buffer.getvalue().encode("utf-8")
+
+def get_csv_info(jobs: List[Dict[str, str]], version: int, chunk_rows: int) -> Tuple[int, str]:
+    """
+    Get the byte size and ETag of the CSV rendering of a snapshot.
+
+    Needed for Content-Length and range requests; computed in one streaming
+    pass (constant memory) and cached per snapshot version, so switching
+    between sheets does not render their CSV again. The first call per version
+    renders the whole CSV, so endpoints run it in the threadpool.
+    """
+    info = get_csv_info_entry(version)
+    if info is not None:
+        return info
+
+    digest = hashlib.sha1()
+    size = 0
+    for data in iter_csv(jobs, chunk_rows):
+        digest.update(data)
+        size += len(data)
+    info = (size, f'"{digest.hexdigest()[:20]}"')
+    cache_csv_info(version, info)
+    return info
+
+def iter_byte_range(chunks: Iterator[bytes], start: int, end: int) -> Iterator[bytes]:
+    """Yield only the bytes in [start, end] (inclusive) from a stream of chunks."""
+    offset = 0
+    for data in chunks:
+        chunk_end = offset + len(data)
+        if chunk_end > start:
+            yield data[max(start - offset, 0):end + 1 - offset]
+        if chunk_end > end:
+            break
+        offset = chunk_end
+
+def parse_range_header(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single "bytes=" range against a resource of the given size.
+
+    Returns:
+        (start, end) inclusive, or None if the range is malformed or unsatisfiable.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        return None
+
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        return None
+    return start, end
+
+class _DrainableSink(io.RawIOBase):
+    """
+    Write-only file object whose buffered bytes can be taken out between writes.
+
+    tell() keeps counting from the start of the stream, so writers that record
+    file offsets (the Parquet footer) stay correct after each drain.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+def iter_arrow(jobs: List[Dict[str, str]], chunk_rows: int, file_format: str) -> Iterator[bytes]:
+    """
+    Yield the snapshot as an Arrow IPC stream or a Parquet file.
+
+    Every chunk becomes one record batch (or row group) and the writer's
+    output is drained after each one, so only a single chunk is held in memory.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, pa.string()) for column in JOB_COLUMNS])
+    sink = _DrainableSink()
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    for chunk in iter_row_chunks(jobs, chunk_rows):
+        batch = pa.record_batch(
+            [pa.array([job.get(column, "") for job in chunk], pa.string())
+             for column in JOB_COLUMNS],
+            schema=schema
+        )
+        writer.write_batch(batch)
+        data = sink.drain()
+        if data:
+            yield data
+
+    writer.close()
+    data = sink.drain()
+    if data:
+        yield data
+
+def pyarrow_available() -> bool:
+    """Check whether the optional pyarrow dependency is installed."""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+"""ENDPOINT-----------------------------------------------------------"""
+@router.get(config_loader.static_section('endpoints')['export_jobs_endpoint']['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('export_jobs_endpoint'))
+async def export_jobs_endpoint(
+    request: Request,
+    export_format: str = Query("ndjson", alias="format",
+                               description="Export format: ndjson, csv, arrow or parquet"),
+    sheet: Optional[str] = Query(
+        None, description="Sheet from the allowlist, the default sheet when omitted"
+    )
+) -> Response:
+    """
+    Stream the current job snapshot in the requested format.
+
+    Parameters:
+        request (Request): The incoming HTTP request for rate limiting and Range headers.
+        export_format (str): The "format" query parameter, one of ndjson, csv, arrow or
+            parquet (the last two need pyarrow).
+        sheet (str): Optional sheet from sheets.allowlist, the default sheet when omitted.
+
+    Returns:
+        StreamingResponse: The snapshot, streamed in chunks. CSV responses honour
+        "Range: bytes=..." (with If-Range) and answer 206 Partial Content.
+
+    Raises:
+        HTTPException: If the format is unknown or unavailable, or the range is unsatisfiable
+    """
+    requested_format = export_format
+    export_format = export_format.lower()
+    if export_format not in MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported format '{requested_format}'. Use one of: {', '.join(MEDIA_TYPES)}"
+        )
+    if export_format in ("arrow", "parquet") and not pyarrow_available():
+        raise HTTPException(status_code=501,
+                            detail=f"Format '{export_format}' requires pyarrow to be installed")
+
+    try:
+        log_handler.info(f"GET /jobs/export - Exporting job listings as {export_format}")
+
+        await fetch_jobs_from_sheets(force_refresh=False, sheet=sheet)
+        cache = get_jobs_cache(sheet)
+        # Keep a reference to this snapshot, a refresh during the download installs a new list
+        jobs = cache["data"]
+        version = cache["version"]
+        chunk_rows = config_loader['export']['chunk_rows']
+
+        headers = {
+            "Content-Disposition": f'attachment; filename="jobs.{export_format}"',
+            "X-Snapshot-Version": str(version),
+        }
+
+        if export_format == "ndjson":
+            return StreamingResponse(iter_ndjson(jobs, chunk_rows),
+                                     media_type=MEDIA_TYPES["ndjson"], headers=headers)
+        if export_format in ("arrow", "parquet"):
+            return StreamingResponse(iter_arrow(jobs, chunk_rows, export_format),
+                                     media_type=MEDIA_TYPES[export_format], headers=headers)
+
+        # CSV: known size and ETag allow Content-Length and resumable range requests
+        size, etag = await run_in_threadpool(get_csv_info, jobs, version, chunk_rows)
+        headers.update({"Accept-Ranges": "bytes", "ETag": etag})
+
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header and (not if_range or if_range == etag):
+            byte_range = parse_range_header(range_header, size)
+            if byte_range is None:
+                raise HTTPException(status_code=416, detail="Requested range not satisfiable",
+                                    headers={"Content-Range": f"bytes */{size}"})
+            start, end = byte_range
+            headers.update({
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1)
+            })
+            body = iter_byte_range(iter_csv(jobs, chunk_rows), start, end)
+            return StreamingResponse(body, status_code=206, media_type=MEDIA_TYPES["csv"],
+                                     headers=headers)
+
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(iter_csv(jobs, chunk_rows), media_type=MEDIA_TYPES["csv"],
+                                 headers=headers)
+
+    except HTTPException:
+        # Re-raise HTTP exceptions (they have proper status codes)
+        raise
+    except Exception as e:
+        log_handler.error(f"Unexpected error in export_jobs_endpoint: {e}")
+        raise HTTPException(status_code=500,
+                            detail="Internal server error while exporting job listings")
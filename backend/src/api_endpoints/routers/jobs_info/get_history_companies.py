@@ -0,0 +1,82 @@
+################################################################################
+# Get History Companies Endpoint
+##
+# @file get_history_companies.py
+# @date: 2025
+################################################################################
+"""
+This module defines the endpoint that counts historical job postings per
+company inside a time range (e.g. "how many jobs did company X list last month").
+Like the postings history, it covers the default sheet only.
+"""
+
+# Native imports
+from typing import Dict, Any, Optional
+from datetime import datetime
+
+# Third-party imports
+from fastapi import APIRouter, Request, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
+from src.core_specs.configuration.config_loader import config_loader
+from .jobs_history import get_history_store
+from .get_jobs_history import to_timestamp
+
+"""API ROUTER-----------------------------------------------------------"""
+ENDPOINT_SETTINGS = config_loader.static_section('endpoints')['jobs_history_companies_endpoint']
+
+router = APIRouter(
+    prefix=ENDPOINT_SETTINGS['endpoint_prefix'],
+    tags=[ENDPOINT_SETTINGS['endpoint_tag']],
+)
+
+"""ENDPOINT-----------------------------------------------------------"""
+@router.get(ENDPOINT_SETTINGS['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('jobs_history_companies_endpoint'))
+async def get_history_companies_endpoint(
+    request: Request,
+    since: Optional[datetime] = Query(None, description="Start of the time range (ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="End of the time range (ISO 8601)"),
+    new_only: bool = Query(False,
+                           description="Only count postings that first appeared inside the range"),
+    limit: int = Query(100, ge=1, le=1000)
+) -> Dict[str, Any]:
+    """
+    Count historical job postings per company.
+
+    Parameters:
+        request (Request): The incoming HTTP request for rate limiting.
+        since (datetime): Optional start of the range.
+        until (datetime): Optional end of the range.
+        new_only (bool): Count postings by first_seen instead of the listing period.
+        limit (int): Maximum number of companies returned.
+
+    Returns:
+        dict: JSON response with postings per company, largest first
+
+    Raises:
+        HTTPException: If the history store is disabled or the query fails
+    """
+    store = get_history_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="Jobs history is disabled")
+
+    try:
+        log_handler.info(f"GET /jobs/history/companies - since={since} until={until}")
+
+        companies = await run_in_threadpool(
+            store.company_counts, to_timestamp(since), to_timestamp(until), new_only, limit
+        )
+        return {
+            "success": True,
+            "data": companies,
+            "count": len(companies)
+        }
+
+    except Exception as e:
+        log_handler.error(f"Unexpected error in get_history_companies_endpoint: {e}")
+        raise HTTPException(status_code=500,
+                            detail="Internal server error while querying jobs history")
@@ -0,0 +1,112 @@
+################################################################################
+# Get Jobs Facets Endpoint
+##
+# @file get_jobs_facets.py
+# @date: 2025
+################################################################################
+"""
+This module defines the endpoint that serves precomputed facet tables
+(jobs per company, top title tokens, placeholder links) for the current
+snapshot, optionally scoped by the same filters as the list endpoint.
+Encoded responses are kept in the result cache per snapshot version, like
+the list endpoint's.
+"""
+
+# Native imports
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
+
+# Third-party imports
+from fastapi import APIRouter, Request, HTTPException, Query
+from fastapi.responses import Response
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
+from src.core_specs.configuration.config_loader import config_loader
+from .jobs_utils import fetch_jobs_from_sheets, get_jobs_cache, normalize_filters, filter_jobs
+from .jobs_facets import compute_facets, get_filtered_facets, cache_filtered_facets
+from .jobs_result_cache import result_cache
+from .jobs_serialization import dumps
+
+"""API ROUTER-----------------------------------------------------------"""
+router = APIRouter(
+    prefix=config_loader.static_section('endpoints')['get_facets_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['get_facets_endpoint']['endpoint_tag']],
+)
+
+"""FACETS-----------------------------------------------------------"""
+def compute_filtered_facets(jobs: List[Dict[str, str]], filters: Tuple[str, str]) -> Dict[str, Any]:
+    """Filter the snapshot and compute its facets, a full scan that runs off the event loop."""
+    return compute_facets(filter_jobs(jobs, filters))
+
+"""ENDPOINT-----------------------------------------------------------"""
+@router.get(config_loader.static_section('endpoints')['get_facets_endpoint']['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('get_facets_endpoint'))
+async def get_jobs_facets_endpoint(
+    request: Request,
+    company: Optional[str] = Query(None, description="Case-insensitive substring of the company"),
+    title: Optional[str] = Query(None, description="Case-insensitive substring of the job title"),
+    sheet: Optional[str] = Query(
+        None, description="Sheet from the allowlist, the default sheet when omitted"
+    )
+) -> Response:
+    """
+    Get facet tables for the current job snapshot.
+
+    Unfiltered facets are computed when the snapshot is cached; filtered
+    facets are computed in a worker thread on first request and cached per
+    filter combination. The encoded response is cached per snapshot version,
+    so a repeated request neither computes nor encodes anything.
+
+    Parameters:
+        request (Request): The incoming HTTP request for rate limiting.
+        company (str): Optional company filter, same as /jobs/list.
+        title (str): Optional job title filter, same as /jobs/list.
+        sheet (str): Optional sheet from sheets.allowlist, the default sheet when omitted.
+
+    Returns:
+        Response: JSON response containing the facet tables and snapshot metadata
+
+    Raises:
+        HTTPException: If there's an error fetching job data
+    """
+    try:
+        log_handler.info(f"GET /jobs/facets - company={company} title={title}")
+
+        await fetch_jobs_from_sheets(force_refresh=False, sheet=sheet)
+        cache = get_jobs_cache(sheet)
+        filters = normalize_filters(company, title)
+
+        # Keep this snapshot's values, a refresh during the computation installs a new one
+        jobs, version, last_updated = cache["data"], cache["version"], cache["last_updated"]
+        query_key = ("facets", filters)
+        cached_result = result_cache.get(version, query_key)
+        if cached_result is None:
+            if any(filters):
+                facets = get_filtered_facets(version, filters)
+                if facets is None:
+                    facets = await asyncio.to_thread(compute_filtered_facets, jobs, filters)
+                    cache_filtered_facets(version, filters, facets)
+            else:
+                facets = cache["facets"]
+
+            body = dumps({
+                "success": True,
+                "data": facets,
+                "filters": {"company": filters[0] or None, "title": filters[1] or None},
+                "snapshot_version": version,
+                "last_updated": last_updated.isoformat() if last_updated else None
+            })
+            cached_result = (body, facets["total"], len(jobs))
+            result_cache.put(version, query_key, *cached_result)
+
+        return Response(content=cached_result[0], media_type="application/json")
+
+    except HTTPException:
+        # Re-raise HTTP exceptions (they have proper status codes)
+        raise
+    except Exception as e:
+        log_handler.error(f"Unexpected error in get_jobs_facets_endpoint: {e}")
+        raise HTTPException(status_code=500,
+                            detail="Internal server error while computing job facets")
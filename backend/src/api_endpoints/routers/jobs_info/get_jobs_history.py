@@ -0,0 +1,102 @@
+################################################################################
+# Get Jobs History Endpoint
+##
+# @file get_jobs_history.py
+# @date: 2025
+################################################################################
+"""
+This module defines the endpoint to query the history of job postings.
+Postings can be filtered by company and time range and report when they
+were first and last seen across refreshes. The history covers the default
+sheet only, other allowlisted sheets are not recorded.
+"""
+
+# Native imports
+from typing import Dict, Any, Optional
+from datetime import datetime
+
+# Third-party imports
+from fastapi import APIRouter, Request, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
+from src.core_specs.configuration.config_loader import config_loader
+from .jobs_history import get_history_store
+
+"""API ROUTER-----------------------------------------------------------"""
+router = APIRouter(
+    prefix=config_loader.static_section('endpoints')['jobs_history_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['jobs_history_endpoint']['endpoint_tag']],
+)
+
+def to_timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Convert an optional datetime query parameter to a unix timestamp."""
+    return value.timestamp() if value else None
+
+def to_isoformat(timestamp: float) -> str:
+    """Convert a stored unix timestamp to an ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+"""ENDPOINT-----------------------------------------------------------"""
+@router.get(config_loader.static_section('endpoints')['jobs_history_endpoint']['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('jobs_history_endpoint'))
+async def get_jobs_history_endpoint(
+    request: Request,
+    company: Optional[str] = Query(None, description="Company name, ignoring case and punctuation"),
+    since: Optional[datetime] = Query(None, description="Start of the time range (ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="End of the time range (ISO 8601)"),
+    new_only: bool = Query(False, description="Only postings that first appeared inside the range"),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+) -> Dict[str, Any]:
+    """
+    Query the history of job postings.
+
+    Without new_only, a posting matches if it was listed at any time inside
+    the range; with new_only, only if it first appeared inside the range.
+
+    Parameters:
+        request (Request): The incoming HTTP request for rate limiting.
+        company (str): Optional company filter, matched on its comparison key.
+        since (datetime): Optional start of the range.
+        until (datetime): Optional end of the range.
+        new_only (bool): Match on first_seen instead of the listing period.
+        limit (int): Page size.
+        offset (int): Page offset.
+
+    Returns:
+        dict: JSON response with the total number of matches and the page of postings
+
+    Raises:
+        HTTPException: If the history store is disabled or the query fails
+    """
+    store = get_history_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="Jobs history is disabled")
+
+    try:
+        log_handler.info(f"GET /jobs/history - company={company} since={since} until={until}")
+
+        total, postings = await run_in_threadpool(
+            store.query_postings, company, to_timestamp(since), to_timestamp(until), new_only,
+            limit, offset
+        )
+        for posting in postings:
+            posting["first_seen"] = to_isoformat(posting["first_seen"])
+            posting["last_seen"] = to_isoformat(posting["last_seen"])
+
+        return {
+            "success": True,
+            "data": postings,
+            "count": len(postings),
+            "total": total,
+            "limit": limit,
+            "offset": offset
+        }
+
+    except Exception as e:
+        log_handler.error(f"Unexpected error in get_jobs_history_endpoint: {e}")
+        raise HTTPException(status_code=500,
+                            detail="Internal server error while querying jobs history")
@@ -10,30 +10,51 @@ Returns cached data if available and fresh, otherwise fetches new data.
 """
 
 # Native imports
-from typing import Dict, Any
+from typing import Optional
 
 # Third-party imports
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Request, HTTPException, Query
+from fastapi.responses import Response
 
 # Other files imports
 from src.utils.custom_logger import log_handler
-from src.utils.limiter import limiter as SlowLimiter
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
+from src.utils.tracing import span
 from src.core_specs.configuration.config_loader import config_loader
-from .jobs_utils import fetch_jobs_from_sheets, get_jobs_cache, is_cache_valid
+from .jobs_utils import (
+    fetch_jobs_from_sheets, get_jobs_cache, is_cache_valid, normalize_filters, filter_jobs
+)
+from .jobs_serialization import (
+    RESPONSE_FORMATS, parse_fields, serialize_jobs_data, build_list_response, uses_enrichment
+)
+from .jobs_result_cache import result_cache
+from .jobs_enrichment import enrichment_store
 
 """API ROUTER-----------------------------------------------------------"""
 router = APIRouter(
-    prefix=config_loader['endpoints']['get_jobs_endpoint']['endpoint_prefix'],
-    tags=[config_loader['endpoints']['get_jobs_endpoint']['endpoint_tag']],
+    prefix=config_loader.static_section('endpoints')['get_jobs_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['get_jobs_endpoint']['endpoint_tag']],
 )
 
 """ENDPOINT-----------------------------------------------------------"""
-@router.get(config_loader['endpoints']['get_jobs_endpoint']['endpoint_route'])
-@SlowLimiter.limit(
-    f"{config_loader['endpoints']['get_jobs_endpoint']['request_limit']}/"
-    f"{config_loader['endpoints']['get_jobs_endpoint']['unit_of_time_for_limit']}"
-)
-async def get_jobs_list_endpoint(request: Request) -> Dict[str, Any]:
+@router.get(config_loader.static_section('endpoints')['get_jobs_endpoint']['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('get_jobs_endpoint'))
+async def get_jobs_list_endpoint(
+    request: Request,
+    company: Optional[str] = Query(None, description="Case-insensitive substring of the company"),
+    title: Optional[str] = Query(None, description="Case-insensitive substring of the job title"),
+    fields: Optional[str] = Query(
+        None, description="Comma separated job columns and/or response keys to return"
+    ),
+    export_format: str = Query(
+        "full", alias="format", description="Data layout: full, compact (header + rows) or columnar"
+    ),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of jobs to return"),
+    offset: int = Query(0, ge=0, description="Number of matching jobs to skip"),
+    sheet: Optional[str] = Query(
+        None, description="Sheet from the allowlist, the default sheet when omitted"
+    )
+) -> Response:
     """
     Fetch job listings from Google Sheets.
     
@@ -41,30 +62,73 @@ async def get_jobs_list_endpoint(request: Request) -> Dict[str, Any]:
     
     Parameters:
         request (Request): The incoming HTTP request for rate limiting.
+        company (str): Optional company filter.
+        title (str): Optional job title filter.
+        fields (str): Optional projection, e.g. "company,job_title", "count,last_updated" or
+            "company,link,location,liveness" (enrichment columns, see jobs_enrichment.py).
+        export_format (str): The "format" query parameter, full (list of objects),
+            compact (columns + row arrays) or columnar.
+        limit (int): Optional page size.
+        offset (int): Page start within the matching jobs.
+        sheet (str): Optional sheet from sheets.allowlist, the default sheet when omitted.
         
     Returns:
-        dict: JSON response containing job listings and metadata
+        Response: JSON response containing job listings and metadata
         
     Raises:
         HTTPException: If there's an error fetching job data
     """
+    if export_format not in RESPONSE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported format '{export_format}'. "
+                   f"Use one of: {', '.join(RESPONSE_FORMATS)}"
+        )
+    columns, meta_fields = parse_fields(fields)
+
     try:
         log_handler.info("GET /jobs/list - Fetching job listings")
         
-        jobs = await fetch_jobs_from_sheets(force_refresh=False)
-        cache = get_jobs_cache()
-        
-        response_data = {
-            "success": True,
-            "data": jobs,
-            "count": len(jobs),
-            "last_updated": cache["last_updated"].isoformat() if cache["last_updated"] else None,
-            "cached": is_cache_valid(),
-            "cache_duration": cache["cache_duration"]
-        }
+        jobs = await fetch_jobs_from_sheets(force_refresh=False, sheet=sheet)
+        filters = normalize_filters(company, title)
+        cache = get_jobs_cache(sheet)
+
+        # Repeated queries are served from the encoded results of this snapshot
+        # (versions are unique across sheets)
+        # Enriched projections also depend on the published crawl results
+        enrichments = enrichment_store.records if uses_enrichment(columns) else None
+        enrichment_version = enrichment_store.version if enrichments is not None else None
+        query_key = (filters, columns, export_format, offset, limit, enrichment_version)
+        with span("response.serialize", format=export_format) as serialize_span:
+            cached_result = result_cache.get(cache["version"], query_key)
+            serialize_span.set_attribute("result_cache_hit", cached_result is not None)
+            if cached_result is None:
+                filtered_jobs = filter_jobs(jobs, filters)
+                page = filtered_jobs
+                if offset or limit is not None:
+                    page = filtered_jobs[offset:offset + limit if limit is not None else None]
+                data = None
+                if columns:
+                    data = serialize_jobs_data(page, columns, export_format, enrichments)
+                cached_result = (data, len(page), len(filtered_jobs))
+                result_cache.put(cache["version"], query_key, *cached_result)
+            data, count, total = cached_result
+            
+            last_updated = cache["last_updated"]
+            meta = {
+                "count": count,
+                "total": total,
+                "last_updated": last_updated.isoformat() if last_updated else None,
+                "cached": is_cache_valid(sheet),
+                "cache_duration": cache["cache_duration"]
+            }
+            body = build_list_response(data, meta, meta_fields)
+            serialize_span.set_attribute("bytes", len(body))
         
-        log_handler.info(f"Successfully returned {len(jobs)} jobs (cached: {is_cache_valid()})")
-        return response_data
+        log_handler.info(
+            f"Successfully returned {count} of {total} jobs (cached: {meta['cached']})"
+        )
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         # Re-raise HTTP exceptions (they have proper status codes)
@@ -0,0 +1,50 @@
+################################################################################
+# Get Refresh Status Endpoint
+##
+# @file get_refresh_status.py
+# @date: 2025
+################################################################################
+"""
+This module defines the endpoint that reports the status of a refresh
+started with POST /jobs/refresh?mode=async.
+"""
+
+# Native imports
+from typing import Dict, Any
+
+# Third-party imports
+from fastapi import APIRouter, Request, HTTPException
+
+# Other files imports
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
+from src.core_specs.configuration.config_loader import config_loader
+from .jobs_refresh_tasks import get_refresh
+
+"""API ROUTER-----------------------------------------------------------"""
+router = APIRouter(
+    prefix=config_loader.static_section('endpoints')['refresh_status_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['refresh_status_endpoint']['endpoint_tag']],
+)
+
+"""ENDPOINT-----------------------------------------------------------"""
+@router.get(config_loader.static_section('endpoints')['refresh_status_endpoint']['endpoint_route'])
+@SlowLimiter.limit(endpoint_limit('refresh_status_endpoint'))
+async def get_refresh_status_endpoint(request: Request, refresh_id: str) -> Dict[str, Any]:
+    """
+    Report the status of a refresh.
+
+    Parameters:
+        request (Request): The incoming HTTP request for rate limiting.
+        refresh_id (str): ID returned by POST /jobs/refresh?mode=async.
+
+    Returns:
+        dict: Status (queued, running, succeeded, failed, cancelled), current phase and
+        progress, timings, resulting snapshot version and error if any
+
+    Raises:
+        HTTPException: If the refresh ID is unknown or no longer retained
+    """
+    record = get_refresh(refresh_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Refresh '{refresh_id}' not found")
+    return {"success": True, **record}
@@ -0,0 +1,708 @@
+################################################################################
+# Jobs Enrichment
+##
+# @file jobs_enrichment.py
+# @date: 2025
+################################################################################
+"""
+Concurrent crawler that enriches job links with details of the posting.
+
+After a snapshot is installed, the job links are visited and the posting's
+location, a description snippet and its liveness (live, closed, gone or
+error) are extracted. Results are kept per link and published in batches, so
+/jobs/list can return them (fields=location,description,liveness) while the
+crawl is still running.
+
+The crawler keeps one requests.Session (connection pool) per host and limits
+the concurrent requests per host as well as in total, waits a politeness
+delay between requests to the same host, and revalidates known pages with
+conditional GETs (ETag / Last-Modified). Responses are cached on disk, so a
+restart does not fetch every page again: links checked within recheck_seconds
+(error_retry_seconds after a failure) are skipped and only new or changed
+pages are downloaded. The disk cache is bounded to max_cache_bytes.
+"""
+
+# Native imports
+import os
+import re
+import json
+import html
+import time
+import codecs
+import socket
+import asyncio
+import hashlib
+import threading
+import ipaddress
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit, urljoin
+from urllib.robotparser import RobotFileParser
+
+# Third-party imports
+import requests
+from requests.adapters import HTTPAdapter
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+from src.utils.tracing import span
+from src.core_specs.configuration.config_loader import config_loader
+
+"""EXTRACTION-----------------------------------------------------------"""
+JSON_LD_PATTERN = re.compile(
+    r"<script[^>]*type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL
+)
+META_DESCRIPTION_PATTERN = re.compile(
+    r"<meta[^>]+(?:name|property)\s*=\s*[\"'](?:og:)?description[\"']"
+    r"[^>]*content\s*=\s*[\"']([^\"']*)[\"']",
+    re.IGNORECASE
+)
+CHARSET_PATTERN = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+META_CHARSET_PATTERN = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+LOCATION_TEXT_PATTERN = re.compile(r"\blocation\s*:\s*([^<\n|]{2,80})", re.IGNORECASE)
+CLOSED_PATTERN = re.compile(
+    r"no longer (?:accepting applications|available|open)|position has been filled"
+    r"|job (?:has )?expired"
+    r"|this job is closed|stelle ist (?:bereits )?besetzt",
+    re.IGNORECASE
+)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def html_to_text(markup: str) -> str:
+    """Strip tags and entities and collapse whitespace."""
+    return WHITESPACE_PATTERN.sub(" ", html.unescape(TAG_PATTERN.sub(" ", markup))).strip()
+
+def find_job_posting(markup: str) -> Optional[Dict[str, Any]]:
+    """Get the schema.org JobPosting object embedded as JSON-LD, if any."""
+    for block in JSON_LD_PATTERN.findall(markup):
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+        if isinstance(data, list):
+            candidates = data
+        else:
+            candidates = data.get("@graph", [data]) if isinstance(data, dict) else []
+        for candidate in candidates:
+            if isinstance(candidate, dict) and candidate.get("@type") == "JobPosting":
+                return candidate
+    return None
+
+def format_location(posting: Dict[str, Any]) -> Optional[str]:
+    """Human readable location of a JobPosting (remote postings included)."""
+    locations = posting.get("jobLocation") or []
+    if isinstance(locations, dict):
+        locations = [locations]
+
+    names = []
+    for location in locations:
+        address = location.get("address", {}) if isinstance(location, dict) else {}
+        if isinstance(address, str):
+            names.append(address)
+            continue
+        country = address.get("addressCountry")
+        if isinstance(country, dict):
+            country = country.get("name")
+        parts = [address.get("addressLocality"), address.get("addressRegion"), country]
+        names.append(", ".join(part for part in parts if part))
+
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        names.append("Remote")
+    location = "; ".join(dict.fromkeys(name for name in names if name))
+    return location or None
+
+def is_expired(posting: Dict[str, Any]) -> bool:
+    """Whether the JobPosting's validThrough date has passed."""
+    valid_through = posting.get("validThrough")
+    if not isinstance(valid_through, str):
+        return False
+    try:
+        deadline = datetime.fromisoformat(valid_through.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return deadline < datetime.now(timezone.utc)
+
+def detect_encoding(content_type: Optional[str], body: bytes) -> str:
+    """
+    Encoding of a page: the Content-Type charset, else the <meta charset> of the markup, else UTF-8.
+
+    requests.Response.encoding is not used, it falls back to ISO-8859-1 for
+    text/html without a charset, which turns UTF-8 pages into mojibake.
+    """
+    match = CHARSET_PATTERN.search(content_type or "")
+    if match is None:
+        # The declaration must be within the first 1024 bytes of the document
+        match = META_CHARSET_PATTERN.search(body[:1024])
+    if match is not None:
+        encoding = match.group(1)
+        encoding = encoding.decode("ascii") if isinstance(encoding, bytes) else encoding
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+def extract_posting_fields(markup: str, status_code: int,
+                           snippet_chars: int = 300) -> Dict[str, Optional[str]]:
+    """
+    Extract the enrichment fields of a job page.
+
+    Structured data (JSON-LD JobPosting) is preferred, the meta description
+    and a "Location:" text are the fallbacks.
+
+    Parameters:
+        markup: HTML of the page.
+        status_code: HTTP status of the response.
+        snippet_chars: Maximum length of the description snippet.
+
+    Returns:
+        dict: location, description and liveness (live, closed, gone or error)
+    """
+    if status_code in (404, 410):
+        return {"location": None, "description": None, "liveness": "gone"}
+    if status_code >= 400:
+        return {"location": None, "description": None, "liveness": "error"}
+
+    posting = find_job_posting(markup) or {}
+    location = format_location(posting) if posting else None
+    description = posting.get("description")
+    if not isinstance(description, str):
+        description = None
+
+    if description is None:
+        match = META_DESCRIPTION_PATTERN.search(markup)
+        description = match.group(1) if match else None
+    if location is None:
+        match = LOCATION_TEXT_PATTERN.search(html_to_text(markup))
+        location = match.group(1).strip() if match else None
+    if description:
+        description = html_to_text(description)
+        if len(description) > snippet_chars:
+            description = description[:snippet_chars].rsplit(" ", 1)[0] + "..."
+
+    closed = (posting and is_expired(posting)) or bool(CLOSED_PATTERN.search(markup))
+    return {"location": location, "description": description or None,
+            "liveness": "closed" if closed else "live"}
+
+def is_crawlable(link: str) -> bool:
+    """Only absolute http(s) links are visited ("#" placeholders are not)."""
+    return link.startswith(("http://", "https://"))
+
+def is_public_address(address: str) -> bool:
+    """
+    Whether an IP address is globally routable: not loopback, private, link-local,
+    multicast or reserved.
+    """
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+class BlockedLinkError(Exception):
+    """A link the crawler must not visit: non-public address or disallowed by robots.txt."""
+
+"""RESPONSE CACHE-----------------------------------------------------------"""
+class ResponseCache:
+    """
+    On-disk cache of crawled pages, one JSON file per URL.
+
+    A file holds the record (validators, extracted fields, check time) and
+    the (truncated) body, so fields can be re-extracted without a download.
+    The total size is bounded to max_bytes: once it is exceeded, the least
+    recently written files are removed until the cache is back at 90%.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Total size of the cache files, scanned on the first save
+        self._size_bytes: Optional[int] = None
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """(modification time, size, path) of every cache file."""
+        files = []
+        for directory, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _evict(self) -> None:
+        """Remove the oldest files until the cache is at 90% of max_bytes (lock held)."""
+        files = sorted(self._scan())
+        size_bytes = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for _, size, path in files:
+            if size_bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size_bytes -= size
+            removed += 1
+        self._size_bytes = size_bytes
+        log_handler.info(f"Enrichment cache: evicted {removed} pages, {size_bytes} bytes left")
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the cached record of a URL (without the body), None if unknown or unreadable."""
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        entry.pop("body", None)
+        return entry if entry.get("url") == url else None
+
+    def save(self, record: Dict[str, Any], body: Optional[str]) -> None:
+        """Write a record and its body atomically, evicting when over max_bytes."""
+        path = self._path(record["url"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump({**record, "body": body}, file, ensure_ascii=False)
+            size = os.path.getsize(temporary_path)
+            replaced = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(temporary_path, path)
+        except OSError as e:
+            log_handler.warning(f"Could not cache the response of {record['url']}: {e}")
+            return
+
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._size_bytes += size - replaced
+            if self._size_bytes > self.max_bytes:
+                self._evict()
+
+"""ENRICHMENT STORE-----------------------------------------------------------"""
+class EnrichmentStore:
+    """
+    Enrichment records by link, bounded to max_records (least recently checked dropped).
+
+    Crawled records are staged and made visible together by publish(), which
+    bumps the version used in the result cache keys.
+    """
+
+    def __init__(self, max_records: int) -> None:
+        self.max_records = max_records
+        self.version = 0
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._staged: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        """Published records by link."""
+        return self._records
+
+    def get(self, link: str) -> Optional[Dict[str, Any]]:
+        """Latest record of a link, staged or published."""
+        return self._staged.get(link) or self._records.get(link)
+
+    def stage(self, record: Dict[str, Any]) -> None:
+        self._staged[record["url"]] = record
+
+    def publish(self) -> None:
+        """Make the staged records visible."""
+        if not self._staged:
+            return
+        for link, record in self._staged.items():
+            self._records[link] = record
+            self._records.move_to_end(link)
+        self._staged.clear()
+        while len(self._records) > self.max_records:
+            self._records.popitem(last=False)
+        self.version += 1
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+"""CRAWLER-----------------------------------------------------------"""
+MAX_REDIRECTS = 5
+
+class LinkCrawler:
+    """
+    Crawl job links concurrently with per-host limits.
+
+    Links come from tenant sheets, so every request (and redirect hop) is
+    checked first: the host must resolve to public addresses only (unless
+    allow_private_addresses) and the site's robots.txt must allow the path.
+    The address check runs before requests resolves the host again, so a DNS
+    answer changing in between is not covered.
+
+    Parameters:
+        settings: The enrichment section of the configuration.
+        store: Where the records are staged and published.
+        response_cache: On-disk cache of the pages.
+    """
+
+    def __init__(self, settings: Dict[str, Any], store: EnrichmentStore,
+                 response_cache: ResponseCache) -> None:
+        self.settings = settings
+        self.store = store
+        self.response_cache = response_cache
+        self._executor = ThreadPoolExecutor(max_workers=settings['max_concurrency'],
+                                            thread_name_prefix="link-crawler")
+        # Sessions and robots.txt rules are shared by the executor threads
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._robots: Dict[str, Tuple[float, RobotFileParser]] = {}
+        self._robots_locks: Dict[str, threading.Lock] = {}
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_next_request: Dict[str, float] = {}
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def _session(self, host: str) -> requests.Session:
+        """Connection pool of a host, sized to the per-host concurrency."""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1,
+                                      pool_maxsize=self.settings['per_host_concurrency'])
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = self.settings['user_agent']
+                self._sessions[host] = session
+            return session
+
+    def _check_address(self, url: str) -> None:
+        """
+        Resolve the host of a URL and reject it unless every address is public.
+
+        Raises:
+            BlockedLinkError: If the host resolves to a loopback, private, link-local or
+                reserved address.
+            requests.ConnectionError: If the host cannot be resolved.
+        """
+        if self.settings['allow_private_addresses']:
+            return
+        hostname = urlsplit(url).hostname
+        if not hostname:
+            raise BlockedLinkError(f"No host in {url}")
+        try:
+            infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+            addresses = {info[4][0] for info in infos}
+        except (socket.gaierror, UnicodeError) as e:
+            raise requests.ConnectionError(f"Could not resolve {hostname}: {e}")
+        blocked = sorted(address for address in addresses if not is_public_address(address))
+        if blocked:
+            raise BlockedLinkError(f"{hostname} resolves to the non-public address {blocked[0]}")
+
+    def _get(self, url: str, host: str, headers: Dict[str, str]) -> requests.Response:
+        """
+        Streamed GET that checks the address of every redirect hop before following it.
+
+        Raises:
+            BlockedLinkError: If a hop is not allowed.
+            requests.RequestException: If the request fails or redirects too often.
+        """
+        session = self._session(host)
+        for _ in range(MAX_REDIRECTS + 1):
+            self._check_address(url)
+            response = session.get(url, headers=headers, timeout=self.settings['timeout_seconds'],
+                                   stream=True, allow_redirects=False)
+            if not response.is_redirect:
+                return response
+            response.close()
+            url = urljoin(url, response.headers["Location"])
+            if not is_crawlable(url):
+                raise BlockedLinkError(f"Redirect to {url}")
+        raise requests.TooManyRedirects(f"More than {MAX_REDIRECTS} redirects")
+
+    def _fetch_robots(self, origin: str, host: str) -> Tuple[RobotFileParser, float]:
+        """
+        Download and parse the robots.txt of an origin (RFC 9309).
+
+        Returns:
+            Tuple of the rules and how long they may be cached: recheck_seconds,
+            or error_retry_seconds when the file was unreachable (everything disallowed meanwhile).
+        """
+        rules = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            with self._get(rules.url, host, {}) as response:
+                status_code = response.status_code
+                body = response.raw.read(self.settings['max_body_bytes'], decode_content=True)
+        except BlockedLinkError:
+            raise
+        except requests.RequestException:
+            rules.disallow_all = True
+            return rules, self.settings['error_retry_seconds']
+
+        if status_code >= 500:
+            rules.disallow_all = True
+            return rules, self.settings['error_retry_seconds']
+        if status_code >= 400:
+            # No robots.txt: everything is allowed
+            rules.allow_all = True
+        else:
+            rules.parse(body.decode("utf-8", errors="replace").splitlines())
+        return rules, self.settings['recheck_seconds']
+
+    def _robots_allows(self, url: str, host: str) -> bool:
+        """Check robots.txt of the link's origin, fetched once per origin and cached."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            origin_lock = self._robots_locks.setdefault(origin, threading.Lock())
+        # One download per origin, the other threads of the same host wait for it
+        with origin_lock:
+            entry = self._robots.get(origin)
+            if entry is None or entry[0] < time.monotonic():
+                rules, ttl = self._fetch_robots(origin, host)
+                entry = self._robots[origin] = (time.monotonic() + ttl, rules)
+        return entry[1].can_fetch(self.settings['user_agent'], url)
+
+    async def _wait_for_host(self, host: str) -> None:
+        """Politeness: keep per_host_delay_seconds between request starts to the same host."""
+        delay = self.settings['per_host_delay_seconds']
+        if delay <= 0:
+            return
+        async with self._host_locks.setdefault(host, asyncio.Lock()):
+            now = time.monotonic()
+            wait = self._host_next_request.get(host, now) - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_next_request[host] = max(now, self._host_next_request.get(host, now)) + delay
+
+    def _fetch(self, url: str, host: str,
+               previous: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Download (or revalidate) one page and extract its fields, runs in the executor.
+
+        Returns:
+            Tuple of the new record (None when blocked) and the outcome:
+            fetched, not_modified, blocked or error
+        """
+        headers = {}
+        if previous and previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous and previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+        checked_at = time.time()
+        try:
+            if not self._robots_allows(url, host):
+                raise BlockedLinkError(f"{url} is disallowed by robots.txt")
+            with self._get(url, host, headers) as response:
+                if response.status_code == 304 and previous:
+                    return {**previous, "checked_at": checked_at}, "not_modified"
+                body = response.raw.read(self.settings['max_body_bytes'], decode_content=True)
+                encoding = detect_encoding(response.headers.get("Content-Type"), body)
+                text = body.decode(encoding, errors="replace")
+                status_code = response.status_code
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except BlockedLinkError as e:
+            log_handler.info(f"Enrichment skipped a blocked link: {e}")
+            return None, "blocked"
+        except requests.RequestException as e:
+            if previous:
+                record = dict(previous)
+            else:
+                record = {"url": url, "location": None, "description": None}
+            record.update(liveness="error", status_code=None, error=type(e).__name__,
+                          checked_at=checked_at)
+            return record, "error"
+
+        record = {
+            "url": url,
+            **extract_posting_fields(text, status_code, self.settings['snippet_chars']),
+            "status_code": status_code,
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked_at": checked_at
+        }
+        self.response_cache.save(record, text)
+        return record, "fetched"
+
+    async def _crawl_link(self, url: str) -> str:
+        """
+        Enrich one link, skipping it when it was checked within recheck_seconds
+        (error_retry_seconds after a failed check, so transient errors are retried soon).
+        """
+        loop = asyncio.get_running_loop()
+        previous = self.store.get(url)
+        if previous is None:
+            previous = await loop.run_in_executor(self._executor, self.response_cache.load, url)
+        if previous:
+            failed = previous.get("liveness") == "error"
+            recheck_seconds = self.settings['error_retry_seconds' if failed else 'recheck_seconds']
+            if time.time() - previous["checked_at"] < recheck_seconds:
+                if self.store.get(url) is None:
+                    self.store.stage(previous)
+                return "skipped"
+
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_semaphores.setdefault(
+            host, asyncio.Semaphore(self.settings['per_host_concurrency'])
+        )
+        async with semaphore:
+            await self._wait_for_host(host)
+            record, outcome = await loop.run_in_executor(self._executor, self._fetch,
+                                                         url, host, previous)
+        if record is not None:
+            self.store.stage(record)
+        return outcome
+
+    async def crawl(self, links: Iterable[str]) -> Dict[str, Any]:
+        """
+        Enrich links with max_concurrency workers, publishing every publish_every links.
+
+        Returns:
+            dict: Counters of the run (fetched, not_modified, skipped, blocked, errors)
+                and pages/sec
+        """
+        pending = iter(dict.fromkeys(link for link in links if is_crawlable(link)))
+        outcomes: Counter = Counter()
+        publish_every = self.settings['publish_every']
+        started = time.monotonic()
+
+        async def worker() -> None:
+            for url in pending:
+                outcome = await self._crawl_link(url)
+                outcomes[outcome] += 1
+                if sum(outcomes.values()) % publish_every == 0:
+                    self.store.publish()
+
+        with span("enrichment.crawl") as crawl_span:
+            await asyncio.gather(*(worker() for _ in range(self.settings['max_concurrency'])))
+            self.store.publish()
+
+            elapsed = time.monotonic() - started
+            pages = outcomes["fetched"] + outcomes["not_modified"] + outcomes["error"]
+            self.last_run = {
+                "links": sum(outcomes.values()),
+                "fetched": outcomes["fetched"],
+                "not_modified": outcomes["not_modified"],
+                "skipped": outcomes["skipped"],
+                "blocked": outcomes["blocked"],
+                "errors": outcomes["error"],
+                "seconds": round(elapsed, 3),
+                "pages_per_second": round(pages / elapsed, 1) if elapsed > 0 else None,
+                "finished_at": datetime.now().isoformat()
+            }
+            for key, value in self.last_run.items():
+                crawl_span.set_attribute(key, value)
+        return self.last_run
+
+    def close(self) -> None:
+        """Close the connection pools and the executor."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+"""SCHEDULING-----------------------------------------------------------"""
+_crawler: Optional[LinkCrawler] = None
+# Configuration version the crawler was built from
+_crawler_config_version: Optional[int] = None
+_crawl_task: Optional[asyncio.Task] = None
+# Links waiting for the next crawl run (insertion ordered set)
+_pending_links: Dict[str, None] = {}
+# Resized to enrichment.max_records when the crawler is created
+enrichment_store = EnrichmentStore(max_records=200000)
+
+def _get_crawler() -> LinkCrawler:
+    """
+    Create the crawler from the configuration on first use.
+
+    Only called between crawl runs, so when a reload changed the enrichment
+    section the previous crawler is idle and is replaced by one with the new settings.
+    """
+    global _crawler, _crawler_config_version
+
+    settings = config_loader.snapshot()['enrichment']
+    last_run = None
+    if _crawler is not None and _crawler_config_version != config_loader.version:
+        _crawler_config_version = config_loader.version
+        if _crawler.settings != settings:
+            log_handler.info("Enrichment settings changed, rebuilding the link crawler")
+            last_run = _crawler.last_run
+            _crawler.close()
+            _crawler = None
+
+    if _crawler is None:
+        _crawler_config_version = config_loader.version
+        enrichment_store.max_records = settings['max_records']
+        response_cache = ResponseCache(settings['cache_dir'], settings['max_cache_bytes'])
+        _crawler = LinkCrawler(settings, enrichment_store, response_cache)
+        _crawler.last_run = last_run
+    return _crawler
+
+async def _run_crawls() -> None:
+    """Crawl the pending links until no new ones were scheduled meanwhile."""
+    while _pending_links:
+        links = list(_pending_links)
+        _pending_links.clear()
+        try:
+            stats = await _get_crawler().crawl(links)
+            log_handler.info(f"Enrichment crawl: {stats}")
+        except Exception as e:
+            log_handler.error(f"Enrichment crawl failed: {e}")
+
+def schedule_enrichment(jobs: List[Dict[str, str]]) -> None:
+    """
+    Queue the links of a new snapshot for enrichment (when enrichment.enabled).
+
+    Called from the event loop after a snapshot is installed; links of later
+    snapshots are picked up by the running crawl task.
+    """
+    global _crawl_task
+
+    if not config_loader['enrichment']['enabled']:
+        return
+    for job in jobs:
+        if is_crawlable(job["link"]):
+            _pending_links[job["link"]] = None
+    if _crawl_task is None or _crawl_task.done():
+        _crawl_task = asyncio.create_task(_run_crawls())
+
+async def shutdown_enrichment() -> None:
+    """Cancel a running crawl and release the crawler's connections."""
+    global _crawler, _crawl_task, _crawler_config_version
+
+    if _crawl_task is not None and not _crawl_task.done():
+        _crawl_task.cancel()
+        try:
+            await _crawl_task
+        except asyncio.CancelledError:
+            pass
+    _crawl_task = None
+    if _crawler is not None:
+        _crawler.close()
+        _crawler = None
+        _crawler_config_version = None
+
+def get_enrichment_stats() -> Dict[str, Any]:
+    """Enrichment state for the health endpoint."""
+    return {
+        "enabled": config_loader['enrichment']['enabled'],
+        "running": _crawl_task is not None and not _crawl_task.done(),
+        "pending_links": len(_pending_links),
+        "records": len(enrichment_store),
+        "version": enrichment_store.version,
+        "last_run": _crawler.last_run if _crawler else None
+    }
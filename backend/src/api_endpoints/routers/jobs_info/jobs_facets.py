@@ -0,0 +1,105 @@
+################################################################################
+# Jobs Facets
+##
+# @file jobs_facets.py
+# @date: 2025
+################################################################################
+"""
+Facet tables (aggregations) over a job snapshot.
+
+The unfiltered facets are computed once per snapshot during ingestion;
+facets for a filter combination are computed on first request and cached per
+snapshot version (versions are unique across sheets), least recently used
+combinations first out once facets.max_cached_filters is reached.
+"""
+
+# Native imports
+import re
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+# Other files imports
+from src.core_specs.configuration.config_loader import config_loader
+
+"""AGGREGATIONS-----------------------------------------------------------"""
+TOKEN_PATTERN = re.compile(r"[^\W\d_][\w+#.-]*", re.UNICODE)
+
+def tokenize_title(title: str) -> List[str]:
+    """Split a job title into lowercase word tokens."""
+    return [token.rstrip(".-").lower() for token in TOKEN_PATTERN.findall(title)]
+
+def compute_facets(jobs: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Compute the facet tables of a snapshot in a single pass.
+
+    Parameters:
+        jobs: The job rows.
+
+    Returns:
+        dict: total, jobs per company, top title tokens and placeholder "#" link count
+    """
+    facets_config = config_loader['facets']
+    stopwords = set(facets_config['title_stopwords'])
+
+    companies = Counter()
+    tokens = Counter()
+    placeholder_links = 0
+    for job in jobs:
+        companies[job["company"]] += 1
+        # Count each token once per title so repeated words do not skew the ranking
+        tokens.update(token for token in set(tokenize_title(job["job_title"]))
+                      if token not in stopwords and len(token) > 1)
+        if job["link"] == "#":
+            placeholder_links += 1
+
+    top_tokens = tokens.most_common(facets_config['top_title_tokens'])
+    return {
+        "total": len(jobs),
+        "companies_count": len(companies),
+        "companies": [{"company": company, "count": count}
+                      for company, count in companies.most_common()],
+        "top_title_tokens": [{"token": token, "count": count}
+                             for token, count in top_tokens],
+        "placeholder_links": placeholder_links
+    }
+
+"""FILTERED FACETS CACHE-----------------------------------------------------------"""
+# Facets per (snapshot version, filter combination), least recently used first
+_filtered_facets: "OrderedDict[Tuple[int, Tuple], Dict[str, Any]]" = OrderedDict()
+
+def get_filtered_facets(version: int, filters: Tuple) -> Optional[Dict[str, Any]]:
+    """
+    Get the cached facets of a filtered view of a snapshot.
+
+    Looked up before filtering, so a repeated filter combination costs a
+    dictionary lookup instead of a scan of the snapshot.
+
+    Parameters:
+        version: Snapshot version the facets must belong to.
+        filters: Normalized filter key.
+
+    Returns:
+        dict: The facet tables, or None if they were not computed yet.
+    """
+    facets = _filtered_facets.get((version, filters))
+    if facets is not None:
+        _filtered_facets.move_to_end((version, filters))
+    return facets
+
+def cache_filtered_facets(version: int, filters: Tuple, facets: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Store the facets of a filtered view computed after a get_filtered_facets() miss.
+
+    Returns:
+        dict: facets, for chaining.
+    """
+    _filtered_facets[(version, filters)] = facets
+    _filtered_facets.move_to_end((version, filters))
+    while len(_filtered_facets) > config_loader['facets']['max_cached_filters']:
+        _filtered_facets.popitem(last=False)
+    return facets
+
+def invalidate_filtered_facets(version: int) -> None:
+    """Drop the filtered facets of a snapshot version, e.g. when a new snapshot replaces it."""
+    for cache_key in [cache_key for cache_key in _filtered_facets if cache_key[0] == version]:
+        del _filtered_facets[cache_key]
@@ -0,0 +1,280 @@
+################################################################################
+# Jobs History Store
+##
+# @file jobs_history.py
+# @date: 2025
+################################################################################
+"""
+Embedded SQLite store that keeps the history of job postings across refreshes.
+
+Every posting is identified by a hash of (company, job_title, link) and keeps
+first_seen/last_seen timestamps. Each refresh is written in a single
+transaction with batched upserts, and indexes on company and time cover the
+history queries. Company filters match on the case and punctuation
+insensitive comparison key of jobs_normalization.py ("ACME, Inc." finds
+"Acme Inc"). Only the default sheet is recorded.
+"""
+
+# Native imports
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+from src.core_specs.configuration.config_loader import config_loader
+from .jobs_normalization import comparison_key
+
+"""SCHEMA-----------------------------------------------------------"""
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_postings (
+    id INTEGER PRIMARY KEY,
+    job_key BLOB NOT NULL UNIQUE,
+    company TEXT NOT NULL,
+    company_key TEXT NOT NULL DEFAULT '',
+    job_title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    seen_count INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_job_postings_first_seen ON job_postings (first_seen);
+CREATE INDEX IF NOT EXISTS idx_job_postings_last_seen ON job_postings (last_seen);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    taken_at REAL NOT NULL,
+    job_count INTEGER NOT NULL,
+    new_count INTEGER NOT NULL
+);
+"""
+
+# Created after the company_key migration of stores written before the column existed
+COMPANY_KEY_INDEX = """
+DROP INDEX IF EXISTS idx_job_postings_company_first_seen;
+CREATE INDEX IF NOT EXISTS idx_job_postings_company_key_first_seen
+    ON job_postings (company_key, first_seen);
+"""
+
+MAX_POSTING_ID = "SELECT COALESCE(MAX(id), 0) FROM job_postings"
+
+UPSERT_POSTING = """
+INSERT INTO job_postings (job_key, company, company_key, job_title, link, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_key) DO UPDATE SET
+    last_seen = excluded.last_seen,
+    seen_count = seen_count + 1
+"""
+
+def job_key(job: Dict[str, str]) -> bytes:
+    """Stable 16 byte identity of a posting."""
+    identity = f"{job['company']}\x1f{job['job_title']}\x1f{job['link']}"
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).digest()
+
+"""STORE-----------------------------------------------------------"""
+class JobsHistoryStore:
+    """
+    SQLite backed history of job postings.
+
+    Writes go through one connection guarded by a lock, which keeps them
+    serialized. Every reading thread gets its own connection, so with WAL mode
+    the history queries read the last committed state while a refresh writes.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._migrate_company_key()
+        self._connection.executescript(COMPANY_KEY_INDEX)
+
+        # One read connection per thread, all kept so close() can release them
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        log_handler.info(f"Jobs history store opened at {db_path}")
+
+    def _migrate_company_key(self) -> None:
+        """Add and backfill the company_key column of stores created before it existed."""
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(job_postings)")}
+        if "company_key" in columns:
+            return
+
+        with self._connection:
+            self._connection.execute(
+                "ALTER TABLE job_postings ADD COLUMN company_key TEXT NOT NULL DEFAULT ''"
+            )
+            companies = self._connection.execute(
+                "SELECT DISTINCT company FROM job_postings"
+            ).fetchall()
+            self._connection.executemany(
+                "UPDATE job_postings SET company_key = ? WHERE company = ?",
+                [(comparison_key(company), company) for (company,) in companies]
+            )
+        log_handler.info(f"History: added company keys for {len(companies)} companies")
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get the read connection of the calling thread, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # check_same_thread=False only so close() can run from another thread
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA query_only=ON")
+            self._local.connection = connection
+            with self._readers_lock:
+                self._readers.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """Close the write connection and the read connections of all threads."""
+        with self._lock:
+            self._connection.close()
+        with self._readers_lock:
+            for connection in self._readers:
+                connection.close()
+            self._readers.clear()
+
+    def record_snapshot(self, jobs: List[Dict[str, str]],
+                        taken_at: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Record a snapshot: insert new postings and bump last_seen of known ones.
+
+        Parameters:
+            jobs: The job rows of the snapshot.
+            taken_at: Unix timestamp of the snapshot, defaults to now.
+
+        Returns:
+            dict: Number of rows written, new postings and elapsed seconds.
+        """
+        taken_at = taken_at or time.time()
+        start = time.perf_counter()
+        rows = [
+            (job_key(job), job["company"], comparison_key(job["company"]), job["job_title"],
+             job["link"], taken_at, taken_at)
+            for job in jobs
+        ]
+
+        with self._lock, self._connection:
+            # Upserts never consume a rowid, so the max id growth is the number of new postings
+            before = self._connection.execute(MAX_POSTING_ID).fetchone()[0]
+            self._connection.executemany(UPSERT_POSTING, rows)
+            after = self._connection.execute(MAX_POSTING_ID).fetchone()[0]
+            self._connection.execute(
+                "INSERT INTO snapshots (taken_at, job_count, new_count) VALUES (?, ?, ?)",
+                (taken_at, len(rows), after - before)
+            )
+
+        elapsed = time.perf_counter() - start
+        log_handler.info(
+            f"History: recorded {len(rows)} postings ({after - before} new) in {elapsed:.3f}s"
+        )
+        return {"rows": len(rows), "new": after - before, "seconds": elapsed}
+
+    @staticmethod
+    def _range_filter(company: Optional[str], since: Optional[float], until: Optional[float],
+                      new_only: bool) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by the history queries."""
+        clauses, params = [], []
+        if company:
+            clauses.append("company_key = ?")
+            params.append(comparison_key(company))
+        if new_only:
+            # Postings that first appeared inside the range
+            if since is not None:
+                clauses.append("first_seen >= ?")
+                params.append(since)
+            if until is not None:
+                clauses.append("first_seen <= ?")
+                params.append(until)
+        else:
+            # Postings that were listed at any time inside the range
+            if since is not None:
+                clauses.append("last_seen >= ?")
+                params.append(since)
+            if until is not None:
+                clauses.append("first_seen <= ?")
+                params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query_postings(self, company: Optional[str] = None, since: Optional[float] = None,
+                       until: Optional[float] = None, new_only: bool = False,
+                       limit: int = 100, offset: int = 0) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Query postings by company and time range.
+
+        The company matches on its comparison key, so case, punctuation and
+        repeated whitespace are ignored, but legal suffixes are not ("Acme" does
+        not find "Acme GmbH").
+
+        Returns:
+            Tuple of the total number of matches and the requested page of postings.
+        """
+        where, params = self._range_filter(company, since, until, new_only)
+        connection = self._reader()
+        # One read transaction, so the total and the page come from the same committed state
+        with connection:
+            connection.execute("BEGIN")
+            total = connection.execute(
+                f"SELECT COUNT(*) FROM job_postings {where}", params
+            ).fetchone()[0]
+            rows = connection.execute(
+                f"SELECT company, job_title, link, first_seen, last_seen, seen_count "
+                f"FROM job_postings {where} ORDER BY first_seen DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+        return total, [dict(row) for row in rows]
+
+    def company_counts(self, since: Optional[float] = None, until: Optional[float] = None,
+                       new_only: bool = False, limit: int = 100) -> List[Dict[str, Any]]:
+        """Number of postings per company inside the time range, largest first.
+
+        Companies are grouped by comparison key, each reported under one of its stored names.
+        """
+        where, params = self._range_filter(None, since, until, new_only)
+        rows = self._reader().execute(
+            f"SELECT company, COUNT(*) AS postings FROM job_postings {where} "
+            f"GROUP BY company_key ORDER BY postings DESC LIMIT ?",
+            params + [limit]
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+"""SHARED INSTANCE-----------------------------------------------------------"""
+_history_store: Optional[JobsHistoryStore] = None
+
+def get_history_store() -> Optional[JobsHistoryStore]:
+    """Get the shared history store, opening it on first use. None if disabled."""
+    global _history_store
+
+    if not config_loader['history']['enabled']:
+        return None
+    if _history_store is None:
+        _history_store = JobsHistoryStore(config_loader['history']['db_path'])
+    return _history_store
+
+def close_history_store() -> None:
+    """Close the shared history store if it was opened."""
+    global _history_store
+
+    if _history_store is not None:
+        _history_store.close()
+        _history_store = None
+
+def record_history_snapshot(jobs: List[Dict[str, str]]) -> None:
+    """Record a refreshed snapshot in the history store, never failing the refresh."""
+    try:
+        store = get_history_store()
+        if store is not None:
+            store.record_snapshot(jobs)
+    except Exception as e:
+        log_handler.error(f"Failed to record jobs history: {e}")
@@ -0,0 +1,248 @@
+################################################################################
+# Jobs Normalization
+##
+# @file jobs_normalization.py
+# @date: 2025
+################################################################################
+"""
+Normalization and duplicate detection for parsed job rows.
+
+Company names and titles are normalized (whitespace, legal suffix
+punctuation), links are reduced to a canonical form (tracking parameters,
+default ports) that is only used for matching, exact duplicates are merged
+by hashing a canonical key, and near-duplicate titles are found with MinHash
+signatures and LSH banding. Every stage is a single pass over the rows, so the cost grows
+linearly with the snapshot; rows are never compared pairwise.
+"""
+
+# Native imports
+import re
+import random
+import hashlib
+from typing import Dict, Any, List, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Other files imports
+from src.core_specs.configuration.config_loader import config_loader
+
+"""FIELD NORMALIZATION-----------------------------------------------------------"""
+# Punctuation ignored by comparison keys; "#" and "+" are kept ("C#", "C++") and so is
+# a dot starting a token (".NET"), other dots are separators ("Sr.", "Node.js")
+IGNORED_PUNCTUATION_PATTERN = re.compile(r"(?:[^\w#+.]|(?<=\w)\.|\.(?!\w))+", re.UNICODE)
+DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+def collapse_whitespace(value: str) -> str:
+    """Trim and collapse runs of whitespace into single spaces."""
+    return " ".join(value.split())
+
+def build_legal_suffix_pattern(suffixes: List[str]) -> re.Pattern:
+    """Pattern matching punctuation trailing a legal suffix, e.g. the "." in "GmbH."."""
+    alternatives = "|".join(re.escape(suffix) for suffix in suffixes)
+    return re.compile(rf"\b({alternatives})[.,;]+$", re.IGNORECASE)
+
+def normalize_company(name: str, legal_suffix_pattern: re.Pattern) -> str:
+    """Normalize a company name for display ("ACME  GmbH." -> "ACME GmbH")."""
+    return legal_suffix_pattern.sub(r"\1", collapse_whitespace(name))
+
+def comparison_key(value: str) -> str:
+    """Case and punctuation insensitive key used to compare names and titles."""
+    return " ".join(IGNORED_PUNCTUATION_PATTERN.sub(" ", value.casefold()).split())
+
+def canonical_url(link: str, tracking_params: frozenset, tracking_prefixes: Tuple[str, ...]) -> str:
+    """
+    Canonical form of a job link, used as duplicate key (the stored link is kept).
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    query parameters, sorts the remaining parameters and strips a trailing slash.
+    Fragments that look like client-side routes ("#/job/1", "#!/job/1") are kept,
+    they identify the posting. Placeholder, non-URL and malformed values (which
+    urlsplit rejects, e.g. an unclosed "[" in the host) are returned trimmed.
+    """
+    link = link.strip()
+    if "://" not in link:
+        return link or "#"
+
+    if "?" not in link and "#" not in link:
+        # Fast path without query or fragment: plain string handling, no URL parsing
+        scheme, _, rest = link.partition("://")
+        netloc, slash, path = rest.partition("/")
+        scheme, netloc = scheme.lower(), netloc.lower()
+        if netloc.endswith(DEFAULT_PORTS.get(scheme, "\0")):
+            netloc = netloc[:-len(DEFAULT_PORTS[scheme])]
+        path = (slash + path).rstrip("/")
+        return f"{scheme}://{netloc}{path}"
+
+    try:
+        parts = urlsplit(link)
+    except ValueError:
+        return link
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if netloc.endswith(DEFAULT_PORTS.get(scheme, "\0")):
+        netloc = netloc[:-len(DEFAULT_PORTS[scheme])]
+
+    query = ""
+    if parts.query:
+        params = [
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in tracking_params and not key.lower().startswith(tracking_prefixes)
+        ]
+        query = urlencode(sorted(params))
+
+    path = parts.path.rstrip("/")
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+    return urlunsplit((scheme, netloc, path, query, fragment))
+
+"""NEAR-DUPLICATE DETECTION-----------------------------------------------------------"""
+def make_minhash_seeds(num_perm: int) -> List[int]:
+    """Fixed 64-bit seeds, one per MinHash permutation."""
+    generator = random.Random(1729)
+    return [generator.getrandbits(64) for _ in range(num_perm)]
+
+def minhash_signature(tokens: frozenset, seeds: List[int],
+                      token_hashes: Dict[str, Tuple[int, ...]]) -> Tuple[int, ...]:
+    """
+    MinHash signature of a token set.
+
+    Each permutation is simulated by XOR-ing the token hash with a seed. The
+    permuted hashes of a token are computed once and memoized in token_hashes
+    (titles share a small vocabulary), so a signature is an element-wise
+    minimum over a few precomputed tuples.
+    """
+    vectors = []
+    for token in tokens:
+        vector = token_hashes.get(token)
+        if vector is None:
+            # Stable across processes, unlike hash() on strings
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            vector = token_hashes[token] = tuple(value ^ seed for seed in seeds)
+        vectors.append(vector)
+    if not vectors:
+        return tuple(seeds)
+    return tuple(map(min, zip(*vectors)))
+
+def jaccard(first: frozenset, second: frozenset) -> float:
+    """Jaccard similarity of two token sets."""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+def find_root(parents: List[int], index: int) -> int:
+    """Union-find lookup with path halving."""
+    while parents[index] != index:
+        parents[index] = parents[parents[index]]
+        index = parents[index]
+    return index
+
+"""PIPELINE STAGE-----------------------------------------------------------"""
+def normalize_and_deduplicate(
+        jobs: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+    """
+    Normalize job rows and merge exact and near duplicates.
+
+    Two rows are exact duplicates when company, title (case and punctuation
+    insensitive) and canonical link match. They are near duplicates when the
+    company matches, the canonical links match (or one is the "#" placeholder) and the
+    title token sets have a Jaccard similarity of at least the configured
+    threshold; candidates come from LSH buckets, never from pairwise scans.
+    The first occurrence of each group is kept, with its link as listed (trimmed).
+
+    Parameters:
+        jobs: Parsed job rows.
+
+    Returns:
+        Tuple of the deduplicated rows (in input order) and merge statistics.
+    """
+    settings = config_loader['normalization']
+    legal_suffix_pattern = build_legal_suffix_pattern(settings['legal_suffixes'])
+    tracking_params = frozenset(param.lower() for param in settings['tracking_params'])
+    tracking_prefixes = tuple(prefix.lower() for prefix in settings['tracking_param_prefixes'])
+
+    # Stage 1: normalize fields and merge exact duplicates by canonical key
+    unique_jobs: List[Dict[str, str]] = []
+    company_keys: List[str] = []
+    title_keys: List[str] = []
+    link_keys: List[str] = []
+    seen_keys = set()
+    # Companies repeat a lot across rows, normalize each raw spelling once
+    companies: Dict[str, Tuple[str, str]] = {}
+    for job in jobs:
+        company_entry = companies.get(job["company"])
+        if company_entry is None:
+            company = normalize_company(job["company"], legal_suffix_pattern)
+            company_entry = companies[job["company"]] = (company, comparison_key(company))
+        company, company_key = company_entry
+        title = collapse_whitespace(job["job_title"])
+        title_key = comparison_key(title)
+        link_key = canonical_url(job["link"], tracking_params, tracking_prefixes)
+
+        key = (company_key, title_key, link_key)
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+
+        link = job["link"].strip() or "#"
+        unique_jobs.append({"company": company, "job_title": title, "link": link})
+        company_keys.append(company_key)
+        title_keys.append(title_key)
+        link_keys.append(link_key)
+
+    stats = {
+        "input_rows": len(jobs),
+        "exact_duplicates": len(jobs) - len(unique_jobs),
+        "near_duplicates": 0,
+        "output_rows": len(unique_jobs)
+    }
+
+    near_settings = settings['near_duplicates']
+    if not near_settings['enabled'] or len(unique_jobs) < 2:
+        return unique_jobs, stats
+
+    # Stage 2: MinHash + LSH over titles, only for companies with several rows
+    company_sizes: Dict[str, int] = {}
+    for company_key in company_keys:
+        company_sizes[company_key] = company_sizes.get(company_key, 0) + 1
+
+    seeds = make_minhash_seeds(near_settings['num_perm'])
+    bands = near_settings['bands']
+    rows_per_band = len(seeds) // bands
+    threshold = near_settings['threshold']
+
+    parents = list(range(len(unique_jobs)))
+    token_sets: Dict[int, frozenset] = {}
+    token_hashes: Dict[str, Tuple[int, ...]] = {}
+    buckets: Dict[Tuple, int] = {}
+    for index, job in enumerate(unique_jobs):
+        company_key = company_keys[index]
+        if company_sizes[company_key] < 2:
+            continue
+
+        # Single characters (e.g. "m/w/d") carry no meaning for similarity
+        tokens = frozenset(token for token in title_keys[index].split() if len(token) > 1)
+        token_sets[index] = tokens
+        signature = minhash_signature(tokens, seeds, token_hashes)
+
+        for band in range(bands):
+            band_signature = signature[band * rows_per_band:(band + 1) * rows_per_band]
+            bucket_key = (company_key, band, band_signature)
+            # Each row is compared with the first row of its bucket only, keeping the work linear
+            representative = buckets.setdefault(bucket_key, index)
+            if representative == index:
+                continue
+
+            root = find_root(parents, representative)
+            if root == find_root(parents, index):
+                continue
+            links = (link_keys[root], link_keys[index])
+            if links[0] != links[1] and "#" not in links:
+                continue
+            if jaccard(token_sets[root], tokens) >= threshold:
+                parents[index] = root
+                break
+
+    deduplicated = [job for index, job in enumerate(unique_jobs)
+                    if find_root(parents, index) == index]
+    stats["near_duplicates"] = len(unique_jobs) - len(deduplicated)
+    stats["output_rows"] = len(deduplicated)
+    return deduplicated, stats
@@ -0,0 +1,141 @@
+################################################################################
+# Jobs Refresh Tasks
+##
+# @file jobs_refresh_tasks.py
+# @date: 2025
+################################################################################
+"""
+Background refresh tasks for the jobs cache.
+
+A refresh runs as an asyncio task with an ID, a phase and timings that the
+status endpoint can report. Only one refresh runs at a time per sheet:
+starting a refresh while another of the same sheet is in flight attaches to
+the running one.
+"""
+
+# Native imports
+import time
+import uuid
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+
+# Third-party imports
+from fastapi import HTTPException
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+from src.core_specs.configuration.config_loader import config_loader
+from .jobs_utils import fetch_jobs_from_sheets, get_jobs_cache, sheet_key
+
+"""TASK REGISTRY-----------------------------------------------------------"""
+# Recent refreshes by ID (oldest first), the asyncio task of each running one
+# and the running refresh per sheet
+_refreshes: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_refresh_tasks: Dict[str, asyncio.Task] = {}
+_active_refresh_ids: Dict[str, str] = {}
+
+def get_refresh(refresh_id: str) -> Optional[Dict[str, Any]]:
+    """Get the status record of a refresh, None if unknown or already evicted."""
+    return _refreshes.get(refresh_id)
+
+def get_refresh_task(refresh_id: str) -> Optional[asyncio.Task]:
+    """Get the asyncio task of a refresh that is still running."""
+    return _refresh_tasks.get(refresh_id)
+
+def _new_refresh_record(sheet: str) -> Dict[str, Any]:
+    """Create and register the status record of a new refresh, evicting the oldest ones."""
+    record = {
+        "refresh_id": uuid.uuid4().hex,
+        "sheet": sheet,
+        "status": "queued",  # queued, running, succeeded, failed or cancelled
+        "phase": "queued",
+        "progress": {},
+        "created_at": datetime.now().isoformat(),
+        "started_at": None,
+        "finished_at": None,
+        "duration_seconds": None,
+        "snapshot_version": None,
+        "count": None,
+        "error": None
+    }
+    _refreshes[record["refresh_id"]] = record
+
+    max_retained = config_loader['refresh_tasks']['max_retained']
+    while len(_refreshes) > max_retained:
+        oldest_id = next(iter(_refreshes))
+        if oldest_id in _active_refresh_ids.values():
+            break
+        _refreshes.popitem(last=False)
+    return record
+
+async def _run_refresh(record: Dict[str, Any]) -> None:
+    """Run one forced refresh and keep its status record up to date."""
+    def on_progress(phase: str, details: Dict[str, Any]) -> None:
+        record["phase"] = phase
+        record["progress"] = details
+
+    started = time.monotonic()
+    record["status"] = "running"
+    record["started_at"] = datetime.now().isoformat()
+    try:
+        jobs = await fetch_jobs_from_sheets(force_refresh=True, on_progress=on_progress,
+                                            sheet=record["sheet"])
+        record["status"] = "succeeded"
+        record["phase"] = "done"
+        record["count"] = len(jobs)
+        record["snapshot_version"] = get_jobs_cache(record["sheet"])["version"]
+    except HTTPException as e:
+        record["status"] = "failed"
+        record["error"] = e.detail
+        raise
+    except asyncio.CancelledError:
+        # e.g. the startup refresh when the server stops before it finished
+        record["status"] = "cancelled"
+        raise
+    except Exception as e:
+        record["status"] = "failed"
+        record["error"] = "Internal server error while refreshing job listings"
+        log_handler.error(f"Unexpected error in refresh {record['refresh_id']}: {e}")
+        raise
+    finally:
+        record["finished_at"] = datetime.now().isoformat()
+        record["duration_seconds"] = round(time.monotonic() - started, 3)
+        _refresh_tasks.pop(record["refresh_id"], None)
+        if _active_refresh_ids.get(record["sheet"]) == record["refresh_id"]:
+            del _active_refresh_ids[record["sheet"]]
+        log_handler.info(
+            f"Refresh {record['refresh_id']} {record['status']} in {record['duration_seconds']}s"
+        )
+
+def _consume_result(task: asyncio.Task) -> None:
+    """Retrieve a finished task's exception so asyncio does not log it as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+def start_refresh(sheet: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    Start a forced refresh of a sheet, or attach to the one already running for it.
+
+    Parameters:
+        sheet: Sheet from sheets.allowlist, the default sheet when omitted.
+
+    Returns:
+        Tuple of the refresh status record and whether a new refresh was started.
+
+    Raises:
+        HTTPException: If the sheet is unknown.
+    """
+    key = sheet_key(sheet)
+    active_refresh_id = _active_refresh_ids.get(key)
+    if active_refresh_id is not None:
+        return _refreshes[active_refresh_id], False
+
+    record = _new_refresh_record(key)
+    _active_refresh_ids[key] = record["refresh_id"]
+    task = asyncio.create_task(_run_refresh(record))
+    task.add_done_callback(_consume_result)
+    _refresh_tasks[record["refresh_id"]] = task
+    log_handler.info(f"Refresh {record['refresh_id']} of sheet '{key}' started")
+    return record, True
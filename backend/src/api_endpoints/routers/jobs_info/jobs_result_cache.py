@@ -0,0 +1,152 @@
+################################################################################
+# Jobs Result Cache
+##
+# @file jobs_result_cache.py
+# @date: 2025
+################################################################################
+"""
+Bounded LRU cache of encoded /jobs/list (and /jobs/facets) results.
+
+An entry holds the encoded "data" value and the matching row counts of one
+normalized query (filters, projection, format and page) for one snapshot
+version, so a repeated query is answered without filtering or encoding; the
+facets endpoint stores its whole encoded response under ("facets", filters).
+Entries are evicted least recently used first once the encoded bytes exceed
+the memory budget (result_cache.max_bytes), and the entries of a snapshot
+are dropped when update_cache() replaces it. Snapshot versions are unique
+across sheets, so one cache serves every sheet.
+
+The size and ETag of the CSV export of a snapshot are cached here as well,
+so jobs_utils.py drops them together with the list results.
+"""
+
+# Native imports
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+# Other files imports
+from src.core_specs.configuration.config_loader import config_loader
+
+"""RESULT CACHE-----------------------------------------------------------"""
+# Rough per-entry cost of the key tuple and bookkeeping, added to the encoded size
+ENTRY_OVERHEAD_BYTES = 256
+
+class QueryResultCache:
+    """
+    LRU cache of encoded query results with a memory budget in bytes.
+
+    Values are (data, count, total): data is the encoded "data" value (None
+    when no job column was requested), count the rows in the page and total
+    the rows matching the filters.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        """
+        Parameters:
+            max_bytes: Fixed memory budget, None to follow result_cache.max_bytes of the config.
+        """
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[Optional[bytes], int, int]]" = OrderedDict()
+        self._entry_sizes: Dict[Tuple, int] = {}
+        self._size_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "oversized": 0}
+
+    def max_bytes(self) -> int:
+        """Memory budget, read per call so a config reload applies to the next insert."""
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return config_loader['result_cache']['max_bytes']
+
+    def get(self, version: int, key: Tuple) -> Optional[Tuple[Optional[bytes], int, int]]:
+        """
+        Get a cached result of the given snapshot version.
+
+        Parameters:
+            version: Snapshot version the result must belong to.
+            key: Normalized query.
+
+        Returns:
+            (data, count, total) or None on a miss.
+        """
+        entry = self._entries.get((version, key))
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end((version, key))
+        self._stats["hits"] += 1
+        return entry
+
+    def put(self, version: int, key: Tuple, data: Optional[bytes], count: int, total: int) -> None:
+        """
+        Store a result and evict least recently used entries beyond the budget.
+
+        A result larger than the whole budget is not cached.
+        """
+        size = (len(data) if data is not None else 0) + ENTRY_OVERHEAD_BYTES
+        max_bytes = self.max_bytes()
+        if size > max_bytes:
+            self._stats["oversized"] += 1
+            return
+
+        cache_key = (version, key)
+        if cache_key in self._entries:
+            self._size_bytes -= self._entry_sizes[cache_key]
+        self._entries[cache_key] = (data, count, total)
+        self._entries.move_to_end(cache_key)
+        self._entry_sizes[cache_key] = size
+        self._size_bytes += size
+
+        while self._size_bytes > max_bytes:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._size_bytes -= self._entry_sizes.pop(evicted_key)
+            self._stats["evictions"] += 1
+
+    def invalidate_version(self, version: int) -> None:
+        """Drop the entries of a snapshot version, e.g. when a new snapshot replaces it."""
+        stale_keys = [cache_key for cache_key in self._entries if cache_key[0] == version]
+        if stale_keys:
+            self._stats["invalidations"] += 1
+        for cache_key in stale_keys:
+            del self._entries[cache_key]
+            self._size_bytes -= self._entry_sizes.pop(cache_key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current memory use."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else None,
+            "entries": len(self._entries),
+            "size_bytes": self._size_bytes,
+            "max_bytes": self.max_bytes()
+        }
+
+result_cache = QueryResultCache()
+
+"""CSV INFO CACHE-----------------------------------------------------------"""
+# Size and fingerprint of the CSV rendering per snapshot version, least recently used
+# first; entries are tiny, only the rendering is costly
+CSV_INFO_CACHE_SIZE = 64
+_csv_info_cache: "OrderedDict[int, Tuple[int, str]]" = OrderedDict()
+_csv_info_lock = threading.Lock()
+
+def get_csv_info_entry(version: int) -> Optional[Tuple[int, str]]:
+    """Get the cached (size, ETag) of the CSV export of a snapshot version, None on a miss."""
+    with _csv_info_lock:
+        info = _csv_info_cache.get(version)
+        if info is not None:
+            _csv_info_cache.move_to_end(version)
+        return info
+
+def cache_csv_info(version: int, info: Tuple[int, str]) -> None:
+    """Store the (size, ETag) of the CSV export of a snapshot version."""
+    with _csv_info_lock:
+        _csv_info_cache[version] = info
+        while len(_csv_info_cache) > CSV_INFO_CACHE_SIZE:
+            _csv_info_cache.popitem(last=False)
+
+def invalidate_csv_info(version: int) -> None:
+    """Drop the CSV info of a snapshot version, e.g. when a new snapshot replaces it."""
+    with _csv_info_lock:
+        _csv_info_cache.pop(version, None)
@@ -0,0 +1,122 @@
+################################################################################
+# Jobs Serialization
+##
+# @file jobs_serialization.py
+# @date: 2025
+################################################################################
+"""
+Projection and pre-serialization of job listings for the list endpoint.
+
+Clients can ask for a subset of job columns and response keys (fields=) and
+for compact layouts without repeated key names (format=). The encoded "data"
+part is cached by the result cache (jobs_result_cache.py) and spliced into the
+response body as it is.
+"""
+
+# Native imports
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+# Third-party imports
+from fastapi import HTTPException
+
+"""FIELDS AND FORMATS-----------------------------------------------------------"""
+JOB_COLUMNS = ("company", "job_title", "link")
+# Optional columns filled from the link enrichment (jobs_enrichment.py),
+# only returned when listed in fields=
+ENRICHMENT_COLUMNS = ("location", "description", "liveness")
+META_FIELDS = ("count", "total", "last_updated", "cached", "cache_duration")
+RESPONSE_FORMATS = ("full", "compact", "columnar")
+
+def parse_fields(fields: Optional[str]) -> Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]:
+    """
+    Split a fields= value into job columns and response metadata keys.
+
+    Metadata keys are only filtered when at least one of them is listed, so
+    "fields=company,job_title" keeps count/last_updated while
+    "fields=count,last_updated" returns no data at all.
+
+    Parameters:
+        fields: Comma separated names, None for everything.
+
+    Returns:
+        Tuple of the selected job columns (input order) and the selected
+        metadata keys (None meaning all of them).
+
+    Raises:
+        HTTPException: If a name is unknown.
+    """
+    if fields is None:
+        return JOB_COLUMNS, None
+
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    allowed = JOB_COLUMNS + ENRICHMENT_COLUMNS + META_FIELDS
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+
+    columns = tuple(dict.fromkeys(
+        name for name in names if name in JOB_COLUMNS or name in ENRICHMENT_COLUMNS
+    ))
+    meta = tuple(dict.fromkeys(name for name in names if name in META_FIELDS))
+    return columns, meta or None
+
+def dumps(value: Any) -> bytes:
+    """Encode JSON the same way FastAPI's JSONResponse does (compact, UTF-8)."""
+    return json.dumps(value, ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode("utf-8")
+
+def uses_enrichment(columns: Tuple[str, ...]) -> bool:
+    """Whether a projection asks for enrichment columns."""
+    return any(column in ENRICHMENT_COLUMNS for column in columns)
+
+def serialize_jobs_data(jobs: List[Dict[str, str]], columns: Tuple[str, ...], response_format: str,
+                        enrichments: Optional[Dict[str, Dict[str, Any]]] = None) -> bytes:
+    """
+    Encode the "data" value of a list response.
+
+    full:     [{"company": ..., "job_title": ...}, ...]
+    compact:  {"columns": [...], "rows": [[...], ...]}
+    columnar: {"company": [...], "job_title": [...]}
+
+    Enrichment columns are looked up by link in enrichments (null while a
+    link has not been crawled yet).
+    """
+    if enrichments is not None and uses_enrichment(columns):
+        empty: Dict[str, Any] = {}
+        jobs = [
+            {**job, **{column: enrichments.get(job["link"], empty).get(column)
+                       for column in ENRICHMENT_COLUMNS}}
+            for job in jobs
+        ]
+    if response_format == "compact":
+        rows = [[job[column] for column in columns] for job in jobs]
+        return dumps({"columns": list(columns), "rows": rows})
+    if response_format == "columnar":
+        return dumps({column: [job[column] for job in jobs] for column in columns})
+    if columns == JOB_COLUMNS:
+        return dumps(jobs)
+    return dumps([{column: job[column] for column in columns} for job in jobs])
+
+"""RESPONSE-----------------------------------------------------------"""
+def build_list_response(data: Optional[bytes], meta: Dict[str, Any],
+                        meta_fields: Optional[Tuple[str, ...]]) -> bytes:
+    """
+    Assemble the list response body around an already encoded data value.
+
+    Only the small per-request metadata is encoded here; the data bytes are
+    spliced in as they are, with a single copy into the body.
+    """
+    if meta_fields is not None:
+        meta = {key: meta[key] for key in meta_fields}
+
+    parts = [b'{"success":true']
+    if data is not None:
+        parts += (b',"data":', data)
+    if meta:
+        parts += (b",", dumps(meta)[1:-1])
+    parts.append(b"}")
+    return b"".join(parts)
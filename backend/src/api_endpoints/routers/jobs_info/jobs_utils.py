@@ -10,7 +10,14 @@ Contains common functions for Google Sheets integration and caching.
 """
 
 # Native imports
-from typing import Dict, Any, List
+import os
+import time
+import asyncio
+import itertools
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from datetime import datetime
 
 # Third-party imports
@@ -20,31 +27,329 @@ import requests
 # Other files imports
 from src.utils.custom_logger import log_handler
 from src.core_specs.configuration.config_loader import config_loader
+from src.utils.validators import validate_job_rows
+from src.utils.tracing import span
+from .jobs_history import record_history_snapshot
+from .jobs_facets import compute_facets, invalidate_filtered_facets
+from .jobs_result_cache import result_cache, invalidate_csv_info
+from .jobs_enrichment import schedule_enrichment
+from .jobs_normalization import normalize_and_deduplicate
 
 """CACHE MANAGEMENT-----------------------------------------------------------"""
-# Cache for job data (shared across endpoints)
-_jobs_cache = {
-    "data": [],
-    "last_updated": None,
-    "cache_duration": 300  # 5 minutes in seconds
-}
-
-def get_jobs_cache() -> Dict[str, Any]:
-    """Get the current jobs cache."""
-    return _jobs_cache
-
-def is_cache_valid() -> bool:
-    """Check if the current cache is still valid."""
-    if not _jobs_cache["last_updated"]:
+DEFAULT_SHEET = "default"
+
+# Rough memory cost of one cached row besides its strings (dict, keys, string headers, list slot)
+ROW_OVERHEAD_BYTES = 400
+
+def _new_sheet_cache() -> Dict[str, Any]:
+    """Empty cache of one sheet."""
+    return {
+        "data": [],
+        "version": 0,  # Set from _snapshot_versions every time a new snapshot is installed
+        "facets": None,  # Facet tables of "data", computed when the snapshot is installed
+        "ingest_stats": None,  # Counters reported by the ingestion stages of the last snapshot
+        "last_updated": None,
+        "source": None,  # (doc_id, sheet_name) "data" was fetched from
+        "cache_duration": 300,  # Seconds, kept in sync with get_cache_duration()
+        "size_bytes": 0  # Estimated memory of "data", counted against sheets.max_cache_bytes
+    }
+
+# Cache per sheet, least recently used first (shared across endpoints)
+_sheet_caches: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+# Cache of the default sheet (defaults.doc_id), never evicted as readiness depends on it
+_jobs_cache = _sheet_caches[DEFAULT_SHEET] = _new_sheet_cache()
+# One counter for all sheets, so a version identifies a snapshot in the version keyed caches
+_snapshot_versions = itertools.count(1)
+_sheet_cache_evictions = 0
+# One lock per sheet, concurrent fetches of the same sheet wait for a single upstream call
+_fetch_locks: Dict[str, asyncio.Lock] = {}
+
+def sheet_key(sheet: Optional[str] = None) -> str:
+    """
+    Validate a requested sheet against the allowlist.
+
+    Parameters:
+        sheet: Sheet name from the request, None for the default sheet.
+
+    Returns:
+        str: The cache key of the sheet.
+
+    Raises:
+        HTTPException: If the sheet is not in sheets.allowlist.
+    """
+    if not sheet or sheet == DEFAULT_SHEET:
+        return DEFAULT_SHEET
+    if sheet not in config_loader['sheets']['allowlist']:
+        raise HTTPException(status_code=404, detail=f"Unknown sheet '{sheet}'")
+    return sheet
+
+def resolve_sheet(sheet: Optional[str], config: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    Get the cache key, document ID and tab name of a sheet from a config snapshot.
+
+    Raises:
+        HTTPException: If the sheet is not in sheets.allowlist.
+    """
+    if not sheet or sheet == DEFAULT_SHEET:
+        return DEFAULT_SHEET, config['defaults']['doc_id'], config['defaults']['job_sheet_name']
+    tenant = config['sheets']['allowlist'].get(sheet)
+    if tenant is None:
+        raise HTTPException(status_code=404, detail=f"Unknown sheet '{sheet}'")
+    return sheet, tenant['doc_id'], tenant.get('job_sheet_name', 'job_sheet')
+
+def _get_sheet_cache(key: str) -> Dict[str, Any]:
+    """Get (or create) the cache of an already validated sheet key."""
+    cache = _sheet_caches.get(key)
+    if cache is None:
+        cache = _sheet_caches[key] = _new_sheet_cache()
+    return cache
+
+def get_cache_duration(key: str = DEFAULT_SHEET) -> int:
+    """
+    Get the cache duration in seconds of a sheet from the (hot-reloadable) configuration.
+
+    An allowlisted sheet may set its own cache_duration, jobs_cache.cache_duration
+    applies otherwise.
+    """
+    if key != DEFAULT_SHEET:
+        tenant = config_loader['sheets']['allowlist'].get(key, {})
+        if 'cache_duration' in tenant:
+            return tenant['cache_duration']
+    return config_loader['jobs_cache']['cache_duration']
+
+def get_jobs_cache(sheet: Optional[str] = None) -> Dict[str, Any]:
+    """Get the jobs cache of a sheet (the default sheet when omitted), marked as recently used."""
+    key = sheet_key(sheet) if sheet else DEFAULT_SHEET
+    cache = _sheet_caches.get(key) or _get_sheet_cache(key)
+    _sheet_caches.move_to_end(key)
+    cache["cache_duration"] = get_cache_duration(key)
+    return cache
+
+def is_cache_valid(sheet: Optional[str] = None, source: Optional[Tuple[str, str]] = None) -> bool:
+    """
+    Check if the cache of a sheet (the default sheet when omitted) is still valid.
+
+    When source (doc_id, sheet_name) is given, a snapshot fetched from another
+    document or tab (e.g. before a config reload) is not valid either.
+    """
+    key = sheet_key(sheet) if sheet else DEFAULT_SHEET
+    cache = _sheet_caches.get(key)
+    if not cache or not cache["last_updated"]:
+        return False
+    if source is not None and cache["source"] != source:
         return False
     
-    cache_age = datetime.now() - _jobs_cache["last_updated"]
-    return cache_age.total_seconds() < _jobs_cache["cache_duration"]
+    cache_age = datetime.now() - cache["last_updated"]
+    return cache_age.total_seconds() < get_cache_duration(key)
+
+def estimate_snapshot_bytes(jobs: List[Dict[str, str]]) -> int:
+    """Approximate memory held by a snapshot, used for the sheet cache budget."""
+    return sum(len(job["company"]) + len(job["job_title"]) + len(job["link"]) for job in jobs) \
+        + len(jobs) * ROW_OVERHEAD_BYTES
+
+def invalidate_snapshot(version: int) -> None:
+    """Drop everything cached for a snapshot version: list results, filtered facets and CSV info."""
+    result_cache.invalidate_version(version)
+    invalidate_filtered_facets(version)
+    invalidate_csv_info(version)
+
+def drop_sheet_snapshot(key: str) -> None:
+    """Empty the cache of a sheet and drop the caches derived from its snapshot."""
+    cache = _sheet_caches[key]
+    invalidate_snapshot(cache["version"])
+    cache.update(data=[], facets=None, ingest_stats=None, last_updated=None, source=None,
+                 size_bytes=0)
+
+def update_cache(jobs: List[Dict[str, str]], ingest_stats: Optional[Dict[str, Any]] = None,
+                 sheet: Optional[str] = None, facets: Optional[Dict[str, Any]] = None,
+                 source: Optional[Tuple[str, str]] = None) -> None:
+    """
+    Update the jobs cache of a sheet (the default sheet when omitted) with new data.
+
+    The list is replaced, never mutated, so readers holding the previous
+    snapshot (e.g. a streaming export) keep a consistent view. Cached query
+    results of the previous snapshot are dropped, and other sheets are evicted
+    if the sheet caches exceed their memory budget.
+
+    facets are the facet tables of jobs as computed by ingest_csv() off the
+    event loop; they are only computed here when omitted. source is the
+    (doc_id, sheet_name) the jobs were fetched from.
+    """
+    key = sheet_key(sheet)
+    cache = _get_sheet_cache(key)
+    previous_version = cache["version"]
+
+    cache["facets"] = facets if facets is not None else compute_facets(jobs)
+    cache["data"] = jobs
+    cache["ingest_stats"] = ingest_stats
+    cache["size_bytes"] = estimate_snapshot_bytes(jobs)
+    cache["version"] = next(_snapshot_versions)
+    cache["last_updated"] = datetime.now()
+    cache["source"] = source
+    invalidate_snapshot(previous_version)
+
+    _sheet_caches.move_to_end(key)
+    enforce_sheet_cache_budget(keep=key)
+
+def enforce_sheet_cache_budget(keep: Optional[str] = None) -> None:
+    """
+    Evict least recently used sheet snapshots until the caches fit sheets.max_cache_bytes.
+
+    The default sheet and the sheet given as keep (the one just installed) are
+    never evicted; an evicted sheet is fetched again on its next request. The
+    budget is therefore a soft limit: when those two alone exceed it, the
+    overshoot is logged and reported by get_sheet_cache_stats().
+    """
+    global _sheet_cache_evictions
+
+    max_bytes = config_loader['sheets']['max_cache_bytes']
+    total_bytes = sum(cache["size_bytes"] for cache in _sheet_caches.values())
+
+    for key in list(_sheet_caches):
+        if total_bytes <= max_bytes:
+            break
+        cache = _sheet_caches[key]
+        if key in (DEFAULT_SHEET, keep) or not cache["data"]:
+            continue
 
-def update_cache(jobs: List[Dict[str, str]]) -> None:
-    """Update the jobs cache with new data."""
-    _jobs_cache["data"] = jobs
-    _jobs_cache["last_updated"] = datetime.now()
+        total_bytes -= cache["size_bytes"]
+        drop_sheet_snapshot(key)
+        _sheet_cache_evictions += 1
+        log_handler.info(
+            f"Evicted cached jobs of sheet '{key}' (sheet caches over {max_bytes} bytes)"
+        )
+
+    if total_bytes > max_bytes:
+        log_handler.warning(
+            f"Sheet caches hold {total_bytes} bytes, over sheets.max_cache_bytes ({max_bytes}): "
+            f"the default and the current sheet are never evicted"
+        )
+
+def get_sheet_cache_stats() -> Dict[str, Any]:
+    """Memory use of the sheet caches, per sheet in least recently used order."""
+    sheets = {
+        key: {
+            "version": cache["version"],
+            "count": len(cache["data"]),
+            "size_bytes": cache["size_bytes"],
+            "last_updated": cache["last_updated"].isoformat() if cache["last_updated"] else None
+        }
+        for key, cache in _sheet_caches.items()
+    }
+    size_bytes = sum(sheet["size_bytes"] for sheet in sheets.values())
+    return {
+        "size_bytes": size_bytes,
+        "max_bytes": config_loader['sheets']['max_cache_bytes'],
+        "over_budget": size_bytes > config_loader['sheets']['max_cache_bytes'],
+        "evictions": _sheet_cache_evictions,
+        "sheets": sheets
+    }
+
+"""UPSTREAM STATUS AND CIRCUIT BREAKER-----------------------------------------------------------"""
+def _new_upstream_status() -> Dict[str, Any]:
+    """Initial upstream status of one sheet."""
+    return {
+        "last_attempt": None,
+        "last_success": None,
+        "last_result": None,  # "success" or "failure"
+        "last_error": None,
+        "last_duration_seconds": None,
+        "consecutive_failures": 0,
+        "circuit_state": "closed",  # "closed", "open" or "half_open"
+        "circuit_opened_at": None
+    }
+
+# Outcome of the Google Sheets fetches per sheet, read by the readiness probe
+# without calling Google.
+# Each sheet has its own circuit, so one team's broken sheet does not block the others.
+_upstream_statuses: Dict[str, Dict[str, Any]] = {DEFAULT_SHEET: _new_upstream_status()}
+_circuit_opened_monotonic: Dict[str, float] = {}
+
+def _get_upstream_status(key: str) -> Dict[str, Any]:
+    """Get (or create) the upstream status of an already validated sheet key."""
+    status = _upstream_statuses.get(key)
+    if status is None:
+        status = _upstream_statuses[key] = _new_upstream_status()
+    return status
+
+def get_upstream_status(sheet: Optional[str] = None) -> Dict[str, Any]:
+    """Get a copy of the last upstream fetch outcome and circuit state of a sheet."""
+    key = sheet_key(sheet)
+    status = dict(_get_upstream_status(key))
+    status["circuit_state"] = get_circuit_state(key)
+    return status
+
+def get_circuit_state(sheet: Optional[str] = None) -> str:
+    """
+    Get the circuit breaker state of a sheet.
+
+    An open circuit becomes half open once circuit_open_seconds have passed,
+    which lets the next fetch probe Google Sheets again.
+    """
+    key = sheet_key(sheet)
+    status = _get_upstream_status(key)
+    if status["circuit_state"] == "open":
+        open_seconds = time.monotonic() - _circuit_opened_monotonic[key]
+        if open_seconds >= config_loader['upstream']['circuit_open_seconds']:
+            return "half_open"
+    return status["circuit_state"]
+
+def record_upstream_result(success: bool, duration: float, error: Optional[str] = None,
+                           sheet: Optional[str] = None) -> None:
+    """Record the outcome of a fetch of a sheet and open or close its circuit accordingly."""
+    key = sheet_key(sheet)
+    status = _get_upstream_status(key)
+
+    now = datetime.now()
+    status["last_attempt"] = now
+    status["last_duration_seconds"] = round(duration, 3)
+    status["last_result"] = "success" if success else "failure"
+
+    if success:
+        status["last_success"] = now
+        status["last_error"] = None
+        status["consecutive_failures"] = 0
+        status["circuit_state"] = "closed"
+        status["circuit_opened_at"] = None
+        return
+
+    status["last_error"] = error
+    status["consecutive_failures"] += 1
+    failure_threshold = config_loader['upstream']['failure_threshold']
+    if get_circuit_state(key) == "half_open" or status["consecutive_failures"] >= failure_threshold:
+        status["circuit_state"] = "open"
+        status["circuit_opened_at"] = now
+        _circuit_opened_monotonic[key] = time.monotonic()
+        log_handler.warning(
+            f"Google Sheets circuit of sheet '{key}' opened after "
+            f"{status['consecutive_failures']} consecutive failures"
+        )
+
+"""FILTERING-----------------------------------------------------------"""
+def normalize_filters(company: Optional[str] = None,
+                      title: Optional[str] = None) -> Tuple[str, str]:
+    """Normalize the list filters into a hashable key (lowercase, trimmed, '' when unset)."""
+    return ((company or "").strip().lower(), (title or "").strip().lower())
+
+def filter_jobs(jobs: List[Dict[str, str]], filters: Tuple[str, str]) -> List[Dict[str, str]]:
+    """
+    Filter jobs by case-insensitive substring on company and job title.
+
+    Parameters:
+        jobs: The job rows.
+        filters: Key returned by normalize_filters().
+
+    Returns:
+        The matching rows, or the same list when no filter is set.
+    """
+    company, title = filters
+    if not company and not title:
+        return jobs
+    return [
+        job for job in jobs
+        if (not company or company in job["company"].lower())
+        and (not title or title in job["job_title"].lower())
+    ]
 
 """GOOGLE SHEETS INTEGRATION-----------------------------------------------------------"""
 def get_google_sheets_urls(sheet_id: str, sheet_name: str) -> List[str]:
@@ -83,116 +388,373 @@ def parse_csv_to_jobs(csv_text: str) -> List[Dict[str, str]]:
             return []
         
         # Skip header row
-        data_rows = rows[1:]
+        return parse_csv_rows(rows[1:])
         
-        jobs = []
-        for row in data_rows:
-            if not row.strip():  # Skip empty rows
-                continue
-                
-            # Parse CSV row (handle quoted values)
-            columns = []
-            current_col = ""
-            in_quotes = False
-            
-            for char in row:
-                if char == '"':
-                    in_quotes = not in_quotes
-                elif char == ',' and not in_quotes:
-                    columns.append(current_col.strip().strip('"'))
-                    current_col = ""
-                else:
-                    current_col += char
-            
-            # Add the last column
-            columns.append(current_col.strip().strip('"'))
-            
-            # Ensure we have at least 3 columns
-            while len(columns) < 3:
-                columns.append("")
-            
-            # Create job object
-            job = {
-                "company": columns[0] or "Unknown Company",
-                "job_title": columns[1] or "Unknown Position", 
-                "link": columns[2] or "#"
-            }
+    except Exception as e:
+        log_handler.error(f"Error parsing CSV: {e}")
+        return []
+
+def parse_csv_rows(rows: List[str]) -> List[Dict[str, str]]:
+    """
+    Parse CSV data rows (without the header) into job objects.
+
+    Args:
+        rows: CSV lines
+
+    Returns:
+        List of job dictionaries
+    """
+    jobs = []
+    for row in rows:
+        if not row.strip():  # Skip empty rows
+            continue
             
-            # Only add jobs with valid data
-            if job["company"] != "Unknown Company" and job["job_title"] != "Unknown Position":
-                jobs.append(job)
+        # Parse CSV row (handle quoted values)
+        columns = []
+        current_col = ""
+        in_quotes = False
         
-        return jobs
+        for char in row:
+            if char == '"':
+                in_quotes = not in_quotes
+            elif char == ',' and not in_quotes:
+                columns.append(current_col.strip().strip('"'))
+                current_col = ""
+            else:
+                current_col += char
         
-    except Exception as e:
-        log_handler.error(f"Error parsing CSV: {e}")
+        # Add the last column
+        columns.append(current_col.strip().strip('"'))
+        
+        # Ensure we have at least 3 columns
+        while len(columns) < 3:
+            columns.append("")
+        
+        # Create job object
+        job = {
+            "company": columns[0] or "Unknown Company",
+            "job_title": columns[1] or "Unknown Position", 
+            "link": columns[2] or "#"
+        }
+        
+        # Only add jobs with valid data
+        if job["company"] != "Unknown Company" and job["job_title"] != "Unknown Position":
+            jobs.append(job)
+    
+    return jobs
+
+"""PARALLEL PARSING-----------------------------------------------------------"""
+# Process pool for large exports, created on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_workers: Optional[int] = None
+
+def _get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared parsing pool, creating it on first use.
+
+    Workers are spawned rather than forked: parsing is started from a worker
+    thread of the server, and forking a multi-threaded process is unsafe.
+    """
+    global _parse_pool, _parse_pool_workers
+
+    if _parse_pool is not None and _parse_pool_workers != workers:
+        shutdown_parse_pool()
+
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=workers,
+                                          mp_context=multiprocessing.get_context("spawn"))
+        _parse_pool_workers = workers
+        log_handler.info(f"CSV parsing process pool started with {workers} workers")
+    return _parse_pool
+
+def shutdown_parse_pool() -> None:
+    """Shut down the shared parsing pool if it was started."""
+    global _parse_pool, _parse_pool_workers
+
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=True)
+        _parse_pool = None
+        _parse_pool_workers = None
+        log_handler.info("CSV parsing process pool shut down")
+
+def split_csv_records(text: str, parts: int) -> List[str]:
+    """
+    Split CSV data rows into about parts chunks that only end between records.
+
+    A newline is a record boundary when the number of quotes since the
+    previous boundary is even, i.e. it is not inside a quoted value (escaped
+    quotes "" count twice and keep the parity). Quotes are counted with
+    str.count, so the split does not loop over characters in Python.
+
+    Args:
+        text: CSV data rows, without the header
+        parts: Wanted number of chunks
+
+    Returns:
+        Consecutive chunks, joined back by newlines they give the original text
+    """
+    chunks = []
+    target_size = max(1, len(text) // max(1, parts))
+    start = 0
+    while start < len(text):
+        boundary = text.find('\n', start + target_size)
+        quotes = text.count('"', start, boundary) if boundary != -1 else 0
+        while boundary != -1 and quotes % 2:
+            next_boundary = text.find('\n', boundary + 1)
+            if next_boundary != -1:
+                quotes += text.count('"', boundary, next_boundary)
+            boundary = next_boundary
+        if boundary == -1:
+            chunks.append(text[start:])
+            break
+        chunks.append(text[start:boundary])
+        start = boundary + 1
+    return chunks
+
+def _parse_csv_chunk(chunk: str) -> List[Dict[str, str]]:
+    """Parse one chunk of data rows, runs in a pool worker."""
+    return parse_csv_rows(chunk.split('\n'))
+
+def parse_csv_parallel(csv_text: str, workers: int,
+                       chunks_per_worker: int = 4) -> List[Dict[str, str]]:
+    """
+    Parse CSV text in the process pool, same result as parse_csv_to_jobs().
+
+    The data rows are split on record boundaries, parsed as separate chunks
+    and merged in their original order.
+
+    Args:
+        csv_text: Raw CSV text from Google Sheets
+        workers: Number of worker processes
+        chunks_per_worker: Chunks per worker, more chunks even out uneven rows
+
+    Returns:
+        List of job dictionaries
+    """
+    text = csv_text.strip()
+    header_end = text.find('\n')
+    if header_end == -1:  # Need at least header + 1 data row
         return []
 
-async def fetch_jobs_from_sheets(force_refresh: bool = False) -> List[Dict[str, str]]:
+    chunks = split_csv_records(text[header_end + 1:], workers * chunks_per_worker)
+    jobs: List[Dict[str, str]] = []
+    for chunk_jobs in _get_parse_pool(workers).map(_parse_csv_chunk, chunks):
+        jobs.extend(chunk_jobs)
+    return jobs
+
+def available_cpu_count() -> int:
+    """
+    Number of CPUs this process may run on.
+
+    Respects the CPU affinity (e.g. a container pinned to one core) where the
+    platform exposes it, os.cpu_count() counts every core of the host.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def parse_csv(csv_text: str) -> Tuple[List[Dict[str, str]], bool]:
+    """
+    Parse an export inline, or in the process pool when it is large enough.
+
+    Exports of at least parsing.parallel_min_chars characters are parsed in
+    parallel when more than one worker is available; if the pool fails the
+    export is parsed inline.
+
+    Returns:
+        Tuple of the job dictionaries and whether the pool was used
+    """
+    settings = config_loader['parsing']
+    workers = settings['max_workers'] or available_cpu_count()
+    if len(csv_text) < settings['parallel_min_chars'] or workers < 2:
+        return parse_csv_to_jobs(csv_text), False
+
+    try:
+        return parse_csv_parallel(csv_text, workers, settings['chunks_per_worker']), True
+    except Exception as e:
+        log_handler.error(f"Parallel CSV parsing failed, parsing inline: {e}")
+        shutdown_parse_pool()
+        return parse_csv_to_jobs(csv_text), False
+
+def ingest_csv(csv_text: str) -> Tuple[List[Dict[str, str]], Dict[str, Any], Dict[str, Any]]:
+    """
+    Run the ingestion stages on a CSV export.
+
+    Parses the rows (in parallel for large exports), drops invalid ones,
+    normalizes and merges duplicates, then computes the facet tables, so
+    update_cache() only installs the results.
+
+    Args:
+        csv_text: Raw CSV text from Google Sheets
+
+    Returns:
+        Tuple of the job dictionaries, the ingestion counters and the facet tables
+    """
+    with span("csv.parse", csv_chars=len(csv_text)) as parse_span:
+        jobs, parallel = parse_csv(csv_text)
+        parse_span.set_attribute("rows", len(jobs))
+        parse_span.set_attribute("parallel", parallel)
+    with span("ingest.validate", rows=len(jobs)):
+        jobs, validation_stats = validate_job_rows(jobs)
+    with span("ingest.normalize", rows=len(jobs)):
+        jobs, ingest_stats = normalize_and_deduplicate(jobs)
+    ingest_stats["validation"] = validation_stats
+    with span("ingest.facets", rows=len(jobs)):
+        facets = compute_facets(jobs)
+    return jobs, ingest_stats, facets
+
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+def report_progress(on_progress: Optional[ProgressCallback], phase: str, **details: Any) -> None:
+    """Forward a fetch phase to the optional progress callback."""
+    if on_progress is not None:
+        on_progress(phase, details)
+
+async def fetch_jobs_from_sheets(force_refresh: bool = False,
+                                 on_progress: Optional[ProgressCallback] = None,
+                                 sheet: Optional[str] = None) -> List[Dict[str, str]]:
     """
     Fetch jobs from Google Sheets with caching.
     
     Args:
         force_refresh: If True, bypass cache and fetch fresh data
+        on_progress: Optional callback receiving (phase, details) as the fetch advances
+        sheet: Sheet from sheets.allowlist, the default sheet when omitted
         
     Returns:
         List of job dictionaries
+
+    Raises:
+        HTTPException: If the sheet is unknown or its data cannot be fetched
     """
+    # Get configuration (one snapshot, so a reload cannot mix old and new values)
+    config = config_loader.snapshot()
+    key, sheet_id, sheet_name = resolve_sheet(sheet, config)
+    source = (sheet_id, sheet_name)
+    cache = get_jobs_cache(key)
+
+    # A reloaded config may point the sheet at another document or tab,
+    # never serve the old one's jobs
+    if cache["source"] is not None and cache["source"] != source:
+        log_handler.info(f"Source of sheet '{key}' changed, dropping its cached jobs")
+        drop_sheet_snapshot(key)
+
     # Return cached data if valid and not forcing refresh
-    if not force_refresh and is_cache_valid():
-        log_handler.info("Returning cached job data")
-        return _jobs_cache["data"]
-    
-    # Get configuration
-    sheet_id = config_loader['defaults']['doc_id']
-    sheet_name = config_loader['defaults']['job_sheet_name']
-    
+    if not force_refresh and is_cache_valid(key, source):
+        log_handler.info(f"Returning cached job data of sheet '{key}'")
+        return cache["data"]
+
+    # Single flight per sheet: requests arriving during a fetch wait for it and share its snapshot
+    version_before = cache["version"]
+    async with _fetch_locks.setdefault(key, asyncio.Lock()):
+        if cache["version"] != version_before and cache["data"] and cache["source"] == source:
+            log_handler.info(f"Returning job data of sheet '{key}' fetched by a concurrent request")
+            return cache["data"]
+        return await _fetch_from_upstream(key, sheet_id, sheet_name, force_refresh, on_progress)
+
+async def _fetch_from_upstream(key: str, sheet_id: str, sheet_name: str, force_refresh: bool,
+                               on_progress: Optional[ProgressCallback]) -> List[Dict[str, str]]:
+    """Fetch, ingest and cache one sheet, trying each export URL format in turn."""
+    cache = _get_sheet_cache(key)
+
     if not sheet_id:
         raise HTTPException(status_code=500, detail="Google Sheet ID not configured")
+
+    # While the circuit is open, do not call Google: serve stale data if there is any
+    if get_circuit_state(key) == "open":
+        if not force_refresh and cache["data"]:
+            log_handler.warning(
+                f"Google Sheets circuit of sheet '{key}' open - returning stale cached job data"
+            )
+            return cache["data"]
+        raise HTTPException(
+            status_code=503,
+            detail="Google Sheets is temporarily unavailable after repeated failures. "
+                   "Please try again later."
+        )
     
     # Try multiple URL formats
     urls_to_try = get_google_sheets_urls(sheet_id, sheet_name)
+    fetch_started = time.monotonic()
+    last_error = None
     
     for i, url in enumerate(urls_to_try):
-        try:
-            log_handler.info(f"Trying Google Sheets URL {i + 1}: {url}")
+        # One span per attempt, so a slow request shows which URL format cost the time
+        with span("sheets.attempt", sheet=key, attempt=i + 1,
+                  attempts_total=len(urls_to_try)) as attempt_span:
+            try:
+                log_handler.info(f"Trying Google Sheets URL {i + 1}: {url}")
+                report_progress(on_progress, "fetching", attempt=i + 1,
+                                attempts_total=len(urls_to_try))
             
-            response = requests.get(url, headers={
-                'Accept': 'text/csv,text/plain,*/*',
-                'User-Agent': 'Job-Scraper-Backend/1.0'
-            }, timeout=10)
+                # Blocking HTTP call runs in a worker thread so other requests are served meanwhile
+                response = await asyncio.to_thread(requests.get, url, headers={
+                    'Accept': 'text/csv,text/plain,*/*',
+                    'User-Agent': 'Job-Scraper-Backend/1.0'
+                }, timeout=10)
+                attempt_span.set_attribute("status_code", response.status_code)
             
-            if not response.ok:
-                log_handler.warning(f"URL {i + 1} failed with status {response.status_code}")
-                continue
+                if not response.ok:
+                    log_handler.warning(f"URL {i + 1} failed with status {response.status_code}")
+                    last_error = f"HTTP {response.status_code}"
+                    attempt_span.set_attribute("result", last_error)
+                    continue
             
-            csv_text = response.text
+                csv_text = response.text
             
-            # Check if we got a login page instead of CSV
-            if 'accounts.google.com' in csv_text or 'Sign in' in csv_text:
-                log_handler.warning(f"URL {i + 1} returned login page - sheet not public")
-                continue
+                # Check if we got a login page instead of CSV
+                if 'accounts.google.com' in csv_text or 'Sign in' in csv_text:
+                    log_handler.warning(f"URL {i + 1} returned login page - sheet not public")
+                    last_error = "Sheet not public"
+                    attempt_span.set_attribute("result", last_error)
+                    continue
             
-            # Parse CSV data
-            jobs = parse_csv_to_jobs(csv_text)
+                # Parse, validate and normalize in a worker thread, the event loop stays responsive
+                report_progress(on_progress, "parsing", attempt=i + 1)
+                jobs, ingest_stats, facets = await asyncio.to_thread(ingest_csv, csv_text)
             
-            if jobs:
-                # Update cache
-                update_cache(jobs)
+                if jobs:
+                    log_handler.info(
+                        f"Merged {ingest_stats['exact_duplicates']} exact and "
+                        f"{ingest_stats['near_duplicates']} near duplicate job rows"
+                    )
+
+                    # Update cache
+                    update_cache(jobs, ingest_stats, key, facets, (sheet_id, sheet_name))
+                    record_upstream_result(True, time.monotonic() - fetch_started, sheet=key)
+                    # Crawl new or changed job links in the background (when enabled)
+                    schedule_enrichment(jobs)
+
+                    # Persist the snapshot's changes off the event loop
+                    # (the history covers the default sheet)
+                    if key == DEFAULT_SHEET:
+                        report_progress(on_progress, "storing", jobs=len(jobs))
+                        with span("history.record", rows=len(jobs)):
+                            await asyncio.to_thread(record_history_snapshot, jobs)
                 
-                log_handler.info(f"Successfully fetched {len(jobs)} jobs from Google Sheets")
-                return jobs
-            else:
-                log_handler.warning(f"URL {i + 1} returned no valid job data")
+                    attempt_span.set_attribute("result", "success")
+                    log_handler.info(
+                        f"Successfully fetched {len(jobs)} jobs of sheet '{key}' from Google Sheets"
+                    )
+                    return jobs
+                else:
+                    log_handler.warning(f"URL {i + 1} returned no valid job data")
+                    last_error = "No valid job data"
+                    attempt_span.set_attribute("result", last_error)
                 
-        except requests.RequestException as e:
-            log_handler.error(f"Request failed for URL {i + 1}: {e}")
-            continue
-        except Exception as e:
-            log_handler.error(f"Unexpected error for URL {i + 1}: {e}")
-            continue
+            except requests.RequestException as e:
+                log_handler.error(f"Request failed for URL {i + 1}: {e}")
+                last_error = f"Request failed: {type(e).__name__}"
+                attempt_span.set_attribute("result", last_error)
+                continue
+            except Exception as e:
+                log_handler.error(f"Unexpected error for URL {i + 1}: {e}")
+                last_error = f"Unexpected error: {type(e).__name__}"
+                attempt_span.set_attribute("result", last_error)
+                continue
     
     # If we get here, all URLs failed
+    record_upstream_result(False, time.monotonic() - fetch_started, last_error, sheet=key)
     raise HTTPException(
         status_code=503, 
         detail="Unable to fetch job data from Google Sheets. Please check sheet configuration and accessibility."
@@ -6,56 +6,94 @@
 ################################################################################
 """
 This module defines the endpoint to force refresh job listings from Google Sheets.
-Bypasses cache and fetches fresh data directly from the source.
+Bypasses cache and fetches fresh data directly from the source, either while the
+client waits or, in async mode, as a background refresh reported by ID.
 """
 
 # Native imports
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Optional, Union
 
 # Third-party imports
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Request, HTTPException, Query
+from fastapi.responses import JSONResponse
 
 # Other files imports
 from src.utils.custom_logger import log_handler
-from src.utils.limiter import limiter as SlowLimiter
+from src.utils.limiter import limiter as SlowLimiter, endpoint_limit
 from src.core_specs.configuration.config_loader import config_loader
-from .jobs_utils import fetch_jobs_from_sheets, get_jobs_cache
+from .jobs_utils import get_jobs_cache
+from .jobs_refresh_tasks import start_refresh, get_refresh_task
 
 """API ROUTER-----------------------------------------------------------"""
 router = APIRouter(
-    prefix=config_loader['endpoints']['refresh_jobs_endpoint']['endpoint_prefix'],
-    tags=[config_loader['endpoints']['refresh_jobs_endpoint']['endpoint_tag']],
+    prefix=config_loader.static_section('endpoints')['refresh_jobs_endpoint']['endpoint_prefix'],
+    tags=[config_loader.static_section('endpoints')['refresh_jobs_endpoint']['endpoint_tag']],
 )
 
 """ENDPOINT-----------------------------------------------------------"""
-@router.post(config_loader['endpoints']['refresh_jobs_endpoint']['endpoint_route'])
-@SlowLimiter.limit(
-    f"{config_loader['endpoints']['refresh_jobs_endpoint']['request_limit']}/"
-    f"{config_loader['endpoints']['refresh_jobs_endpoint']['unit_of_time_for_limit']}"
-)
-async def refresh_jobs_endpoint(request: Request) -> Dict[str, Any]:
+@router.post(config_loader.static_section('endpoints')['refresh_jobs_endpoint']['endpoint_route'],
+             response_model=None)
+@SlowLimiter.limit(endpoint_limit('refresh_jobs_endpoint'))
+async def refresh_jobs_endpoint(
+    request: Request,
+    mode: str = Query("sync",
+                      description="sync waits for the data, async returns 202 with a refresh ID"),
+    sheet: Optional[str] = Query(
+        None, description="Sheet from the allowlist, the default sheet when omitted"
+    )
+) -> Union[Dict[str, Any], JSONResponse]:
     """
     Force refresh job listings from Google Sheets, bypassing cache.
     
     This endpoint will always fetch fresh data from Google Sheets,
     regardless of cache status. Use this when you need the most
-    up-to-date job listings.
+    up-to-date job listings. Only one refresh runs at a time per sheet, a
+    request arriving during a refresh attaches to it instead of starting another.
     
     Parameters:
         request (Request): The incoming HTTP request for rate limiting.
+        mode (str): "sync" (default) returns the refreshed data; "async" returns
+            202 right away with a refresh ID to poll at /jobs/refresh/{refresh_id}.
+        sheet (str): Optional sheet from sheets.allowlist, the default sheet when omitted.
         
     Returns:
-        dict: JSON response containing fresh job listings and metadata
+        dict: JSON response containing fresh job listings and metadata (sync), or
+        JSONResponse: 202 response with the refresh handle (async)
         
     Raises:
         HTTPException: If there's an error fetching job data
     """
+    if mode not in ("sync", "async"):
+        raise HTTPException(status_code=400,
+                            detail=f"Unsupported mode '{mode}'. Use 'sync' or 'async'")
+
     try:
-        log_handler.info("POST /jobs/refresh - Force refreshing job listings")
+        log_handler.info(f"POST /jobs/refresh - Force refreshing job listings ({mode})")
         
-        # Force refresh from Google Sheets
-        jobs = await fetch_jobs_from_sheets(force_refresh=True)
-        cache = get_jobs_cache()
+        record, started = start_refresh(sheet)
+        status_url = f"{request.url.path}/{record['refresh_id']}"
+
+        if mode == "async":
+            return JSONResponse(
+                status_code=202,
+                headers={"Location": status_url},
+                content={
+                    "success": True,
+                    "refresh_id": record["refresh_id"],
+                    "sheet": record["sheet"],
+                    "status": record["status"],
+                    "attached": not started,
+                    "status_url": status_url
+                }
+            )
+
+        # Sync mode waits for the (possibly shared) refresh;
+        # shield keeps it running if this client disconnects
+        await asyncio.shield(get_refresh_task(record["refresh_id"]))
+
+        cache = get_jobs_cache(record["sheet"])
+        jobs = cache["data"]
         
         response_data = {
             "success": True,
@@ -64,7 +102,10 @@ async def refresh_jobs_endpoint(request: Request) -> Dict[str, Any]:
             "last_updated": cache["last_updated"].isoformat(),
             "cached": False,  # Always false for refresh endpoint
             "message": "Job data refreshed successfully from Google Sheets",
-            "cache_duration": cache["cache_duration"]
+            "cache_duration": cache["cache_duration"],
+            "refresh_id": record["refresh_id"],
+            "sheet": record["sheet"],
+            "snapshot_version": record["snapshot_version"]
         }
         
         log_handler.info(f"Successfully refreshed {len(jobs)} jobs from Google Sheets")
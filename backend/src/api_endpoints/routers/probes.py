@@ -0,0 +1,91 @@
+################################################################################
+# Liveness and Readiness Probes
+##
+# @file probes.py
+# @date: 2025
+################################################################################
+"""
+This module defines the probes used by Docker and orchestrators.
+
+The liveness probe only proves the process answers: no rate limiter, no
+logging, a constant body. The readiness probe reports cache warmth, snapshot
+age, the last upstream fetch and the circuit state, all read from in-memory
+state; it never calls Google Sheets.
+"""
+
+# Native imports
+from datetime import datetime
+from typing import Optional
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi.responses import Response, JSONResponse
+
+# Other files imports
+from src.core_specs.configuration.config_loader import config_loader
+from src.api_endpoints.routers.jobs_info.jobs_utils import (
+    get_jobs_cache, is_cache_valid, get_upstream_status
+)
+
+"""API ROUTER-----------------------------------------------------------"""
+router = APIRouter(
+    prefix=config_loader.static_section('probes')['endpoint_prefix'],
+    tags=[config_loader.static_section('probes')['endpoint_tag']],
+)
+
+LIVENESS_BODY = b'{"status":"alive"}'
+
+def isoformat_or_none(value: Optional[datetime]) -> Optional[str]:
+    """ISO 8601 string of an optional timestamp."""
+    return value.isoformat() if value else None
+
+"""ENDPOINTS-----------------------------------------------------------"""
+@router.get(config_loader.static_section('probes')['liveness_route'])
+async def liveness_probe() -> Response:
+    """
+    Liveness probe: answers as long as the event loop is running.
+
+    Deliberately bypasses the rate limiter and logging so it can be polled often.
+
+    Returns:
+        Response: Constant JSON body with status 200.
+    """
+    return Response(content=LIVENESS_BODY, media_type="application/json")
+
+@router.get(config_loader.static_section('probes')['readiness_route'])
+async def readiness_probe() -> JSONResponse:
+    """
+    Readiness probe: ready once a job snapshot is cached.
+
+    Stale data still counts as ready (it is served while Google Sheets is
+    failing); the payload shows whether the cache is warm and how old it is.
+
+    Returns:
+        JSONResponse: Readiness details, status 200 when ready and 503 otherwise.
+    """
+    cache = get_jobs_cache()
+    upstream = get_upstream_status()
+    last_updated = cache["last_updated"]
+    ready = bool(cache["data"])
+    snapshot_age = (datetime.now() - last_updated).total_seconds() if last_updated else None
+
+    body = {
+        "status": "ready" if ready else "not_ready",
+        "cache": {
+            "warm": is_cache_valid(),
+            "jobs": len(cache["data"]),
+            "snapshot_version": cache["version"],
+            "snapshot_age_seconds": round(snapshot_age, 3) if snapshot_age is not None else None,
+            "cache_duration": cache["cache_duration"]
+        },
+        "upstream": {
+            "last_result": upstream["last_result"],
+            "last_attempt": isoformat_or_none(upstream["last_attempt"]),
+            "last_success": isoformat_or_none(upstream["last_success"]),
+            "last_error": upstream["last_error"],
+            "last_duration_seconds": upstream["last_duration_seconds"],
+            "consecutive_failures": upstream["consecutive_failures"],
+            "circuit_state": upstream["circuit_state"]
+        }
+    }
+    return JSONResponse(content=body, status_code=200 if ready else 503)
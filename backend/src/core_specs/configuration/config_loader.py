@@ -7,36 +7,216 @@
 """
 Configuration loader for the Job Scraper Backend.
 Loads application settings from JSON configuration files and environment variables.
+
+The settings are read lazily: importing this module has no side effects and the
+file is only read on first access (or when the app lifespan calls load()).
+Route prefixes and paths, which routers need at import time, are read with
+static_section(): the JSON file alone, without .env, validation or logging.
+While the server runs, the file is watched and valid changes are swapped in
+atomically with a new version number; invalid files are rejected and the
+previous configuration is kept.
 """
 
 # Native imports
 import os
+import re
 import json
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Iterator, Optional
+from collections.abc import Mapping
 
 # Third-party imports
 from dotenv import load_dotenv
+from limits import parse as parse_limit
 
 # Other files imports
 from src.utils.custom_logger import log_handler
 
-# Load environment variables
-load_dotenv()
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config_file.json")
+
+REQUIRED_SECTIONS = (
+    "defaults", "logging", "network", "endpoints", "jobs_cache", "config_reload", "result_cache",
+    "sheets", "parsing", "enrichment", "export", "history", "facets", "normalization",
+    "validation", "upstream", "probes", "refresh_tasks", "tracing"
+)
+
+# Fields of a parsed job row, the only ones the validation rules can refer to
+JOB_ROW_FIELDS = ("company", "job_title", "link")
+
+def _check_int(settings: Dict[str, Any], path: str, key: str, minimum: int = 1) -> None:
+    """Raise ValueError unless settings[key] is an integer >= minimum."""
+    value = settings.get(key)
+    if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+        raise ValueError(f"'{path}.{key}' must be an integer >= {minimum}")
+
+def _check_number(settings: Dict[str, Any], path: str, key: str, positive: bool = False) -> None:
+    """Raise ValueError unless settings[key] is a non-negative (or positive) number."""
+    value = settings.get(key)
+    if (not isinstance(value, (int, float)) or isinstance(value, bool)
+            or value < 0 or (positive and value == 0)):
+        kind = "positive" if positive else "non-negative"
+        raise ValueError(f"'{path}.{key}' must be a {kind} number")
+
+def _check_type(settings: Dict[str, Any], path: str, key: str, expected: type) -> None:
+    """Raise ValueError unless settings[key] is an instance of expected."""
+    value = settings.get(key)
+    if not isinstance(value, expected) or (expected is not bool and isinstance(value, bool)):
+        raise ValueError(f"'{path}.{key}' must be of type {expected.__name__}")
+
+def _check_string_list(settings: Dict[str, Any], path: str, key: str) -> None:
+    """Raise ValueError unless settings[key] is a list of strings."""
+    value = settings.get(key)
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"'{path}.{key}' must be a list of strings")
+
+def validate_config(config: Dict[str, Any]) -> None:
+    """
+    Validate the values that are applied at runtime.
+
+    Parameters:
+        config (dict): Configuration as returned by the JSON file.
+
+    Raises:
+        ValueError: If a section is missing or a value is invalid.
+    """
+    for section in REQUIRED_SECTIONS:
+        if not isinstance(config.get(section), dict):
+            raise ValueError(f"Missing or invalid section '{section}'")
+
+    for name, endpoint in config['endpoints'].items():
+        for key in ("endpoint_prefix", "endpoint_tag", "endpoint_route"):
+            _check_type(endpoint, f"endpoints.{name}", key, str)
+        _check_int(endpoint, f"endpoints.{name}", 'request_limit')
+        try:
+            parse_limit(f"{endpoint['request_limit']}/{endpoint.get('unit_of_time_for_limit')}")
+        except ValueError:
+            raise ValueError(f"Endpoint '{name}': invalid 'unit_of_time_for_limit'")
+
+    _check_number(config['jobs_cache'], "jobs_cache", 'cache_duration')
+    _check_int(config['result_cache'], "result_cache", 'max_bytes')
+
+    _check_int(config['sheets'], "sheets", 'max_cache_bytes')
+    allowlist = config['sheets'].get('allowlist')
+    if not isinstance(allowlist, dict):
+        raise ValueError("'sheets.allowlist' must be an object of sheet name to sheet settings")
+    for name, sheet in allowlist.items():
+        if name == "default" or not isinstance(sheet, dict) or not sheet.get('doc_id'):
+            raise ValueError(f"Sheet '{name}': must not be named 'default' and needs a 'doc_id'")
+        if 'cache_duration' in sheet:
+            _check_number(sheet, f"sheets.allowlist.{name}", 'cache_duration')
 
-def load_config() -> Dict[str, Any]:
+    parsing = config['parsing']
+    for key in ("parallel_min_chars", "chunks_per_worker"):
+        _check_int(parsing, "parsing", key)
+    if parsing.get('max_workers') is not None:
+        _check_int(parsing, "parsing", 'max_workers')
+
+    enrichment = config['enrichment']
+    for key in ("enabled", "allow_private_addresses"):
+        _check_type(enrichment, "enrichment", key, bool)
+    for key in ("max_concurrency", "per_host_concurrency", "max_body_bytes", "snippet_chars",
+                "publish_every", "max_records", "max_cache_bytes"):
+        _check_int(enrichment, "enrichment", key)
+    for key in ("per_host_delay_seconds", "timeout_seconds", "recheck_seconds",
+                "error_retry_seconds"):
+        _check_number(enrichment, "enrichment", key)
+    for key in ("cache_dir", "user_agent"):
+        _check_type(enrichment, "enrichment", key, str)
+
+    _check_int(config['export'], "export", 'chunk_rows')
+
+    _check_type(config['history'], "history", 'enabled', bool)
+    _check_type(config['history'], "history", 'db_path', str)
+
+    for key in ("top_title_tokens", "max_cached_filters"):
+        _check_int(config['facets'], "facets", key)
+    _check_string_list(config['facets'], "facets", 'title_stopwords')
+
+    normalization = config['normalization']
+    for key in ("legal_suffixes", "tracking_params", "tracking_param_prefixes"):
+        _check_string_list(normalization, "normalization", key)
+    _check_type(normalization, "normalization", 'near_duplicates', dict)
+    near_duplicates = normalization['near_duplicates']
+    _check_type(near_duplicates, "normalization.near_duplicates", 'enabled', bool)
+    for key in ("num_perm", "bands"):
+        _check_int(near_duplicates, "normalization.near_duplicates", key)
+    if near_duplicates['num_perm'] % near_duplicates['bands']:
+        raise ValueError("'normalization.near_duplicates.num_perm' must be a multiple of 'bands'")
+    threshold = near_duplicates.get('threshold')
+    if (not isinstance(threshold, (int, float)) or isinstance(threshold, bool)
+            or not 0 < threshold <= 1):
+        raise ValueError("'normalization.near_duplicates.threshold' must be a number in (0, 1]")
+
+    # Job row rules are compiled here too, so a broken pattern is rejected on reload
+    # instead of failing every refresh
+    validation = config['validation']
+    _check_string_list(validation, "validation", 'required_fields')
+    _check_type(validation, "validation", 'max_lengths', dict)
+    for field in validation['max_lengths']:
+        _check_int(validation['max_lengths'], "validation.max_lengths", field)
+    rule_fields = set(validation['required_fields']) | set(validation['max_lengths'])
+    unknown_fields = sorted(rule_fields - set(JOB_ROW_FIELDS))
+    if unknown_fields:
+        raise ValueError(f"'validation' refers to unknown job fields: {', '.join(unknown_fields)}")
+    for key in ("disallowed_characters_pattern", "link_pattern"):
+        _check_type(validation, "validation", key, str)
+        try:
+            pattern = re.compile(validation[key], re.IGNORECASE if key == "link_pattern" else 0)
+        except re.error as e:
+            raise ValueError(f"'validation.{key}' is not a valid regular expression: {e}")
+        # Rows are checked with the fields joined by newlines
+        if key == "disallowed_characters_pattern" and pattern.search("\n"):
+            raise ValueError("'validation.disallowed_characters_pattern' must not match a newline")
+
+    _check_int(config['upstream'], "upstream", 'failure_threshold')
+    _check_number(config['upstream'], "upstream", 'circuit_open_seconds')
+    for key in ("endpoint_prefix", "endpoint_tag", "liveness_route", "readiness_route"):
+        _check_type(config['probes'], "probes", key, str)
+
+    _check_int(config['refresh_tasks'], "refresh_tasks", 'max_retained')
+
+    tracing = config['tracing']
+    _check_type(tracing, "tracing", 'enabled', bool)
+    _check_type(tracing, "tracing", 'file_path', str)
+    _check_number(tracing, "tracing", 'flush_interval_seconds', positive=True)
+    _check_int(tracing, "tracing", 'max_file_bytes')
+
+    _check_type(config['config_reload'], "config_reload", 'enabled', bool)
+    _check_number(config['config_reload'], "config_reload", 'poll_interval_seconds', positive=True)
+
+def read_config_file(config_path: str = CONFIG_PATH) -> Dict[str, Any]:
+    """
+    Parse the JSON configuration file without environment overrides or validation.
+
+    Parameters:
+        config_path (str): Path of the JSON configuration file.
+
+    Returns:
+        Dict containing the settings of the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    with open(config_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+def load_config(config_path: str = CONFIG_PATH) -> Dict[str, Any]:
     """
     Load configuration from JSON file and environment variables.
+
+    Parameters:
+        config_path (str): Path of the JSON configuration file.
     
     Returns:
         Dict containing all configuration settings
     """
     try:
-        # Get config file path
-        config_path = os.path.join(os.path.dirname(__file__), "config_file.json")
-        
+        # Load environment variables
+        load_dotenv()
+
         # Load JSON configuration
-        with open(config_path, 'r', encoding='utf-8') as file:
-            config = json.load(file)
+        config = read_config_file(config_path)
         
         # Set Google Sheets configuration from environment variables (primary source)
         # Create defaults section if it doesn't exist
@@ -57,6 +237,9 @@ def load_config() -> Dict[str, Any]:
         # Network configuration from environment
         config['network']['host'] = os.getenv('HOST', config['network']['host'])
         config['network']['server_port'] = int(os.getenv('PORT', config['network']['server_port']))
+
+        # Reject configurations that would break limits or caching at runtime
+        validate_config(config)
         
         log_handler.info("Configuration loaded successfully")
         return config
@@ -67,9 +250,130 @@ def load_config() -> Dict[str, Any]:
     except json.JSONDecodeError as e:
         log_handler.error(f"Error parsing JSON configuration: {e}")
         raise RuntimeError("Invalid JSON configuration")
+    except ValueError as e:
+        log_handler.error(f"Invalid configuration values: {e}")
+        raise RuntimeError("Invalid configuration values")
     except Exception as e:
         log_handler.error(f"Error loading configuration: {e}")
         raise RuntimeError("Configuration loading failed")
 
-# Load configuration on module import
-config_loader = load_config()
\ No newline at end of file
+class ConfigLoader(Mapping):
+    """
+    Read-only, versioned mapping that loads the configuration on first access.
+
+    Modules keep using config_loader['section']['key'] as before; the JSON file
+    and environment are only read when a value is actually needed. reload()
+    swaps in a new configuration with a single assignment, so a request sees
+    either the old or the new settings. Code that reads several related values
+    should take snapshot() once and read from it.
+    """
+
+    def __init__(self, config_path: str = CONFIG_PATH) -> None:
+        self._config_path = config_path
+        self._config: Optional[Dict[str, Any]] = None
+        self._version = 0
+        self._file_stamp: Optional[tuple] = None
+        self._static_config: Optional[Dict[str, Any]] = None
+
+    def _read_file_stamp(self) -> Optional[tuple]:
+        """Return (mtime_ns, size) of the config file, None if it cannot be read."""
+        try:
+            stat = os.stat(self._config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self) -> Dict[str, Any]:
+        """Load the configuration if it was not loaded yet and return it."""
+        if self._config is None:
+            self._file_stamp = self._read_file_stamp()
+            self._config = load_config(self._config_path)
+            self._version = 1
+        return self._config
+
+    def static_section(self, section: str) -> Any:
+        """
+        Return a section as it was in the file when first requested.
+
+        For settings that are fixed once the routers are built (route prefixes,
+        tags and paths): it only parses the JSON file, so importing a router
+        neither loads .env nor logs, and loaded stays False until load().
+        """
+        if self._static_config is None:
+            self._static_config = read_config_file(self._config_path)
+        return self._static_config[section]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current configuration as one consistent object."""
+        return self.load()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the configuration has been read already."""
+        return self._config is not None
+
+    @property
+    def version(self) -> int:
+        """Version of the active configuration, incremented on every successful reload."""
+        return self._version
+
+    def reload(self) -> bool:
+        """
+        Re-read the configuration file and swap it in if it is valid.
+
+        Returns:
+            bool: True if the new configuration was applied, False if it was
+            rejected and the previous configuration is kept.
+        """
+        self._file_stamp = self._read_file_stamp()
+        try:
+            new_config = load_config(self._config_path)
+        except RuntimeError:
+            log_handler.error(f"Configuration reload rejected, keeping version {self._version}")
+            return False
+
+        self._config = new_config
+        self._version += 1
+        log_handler.info(f"Configuration reloaded, now at version {self._version}")
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the configuration if the file changed since it was last read.
+
+        Returns:
+            bool: True if a new configuration was applied.
+        """
+        if not self.loaded:
+            self.load()
+            return False
+        if self._read_file_stamp() == self._file_stamp:
+            return False
+        return self.reload()
+
+    async def watch(self) -> None:
+        """
+        Poll the configuration file and reload it when it changes.
+
+        Runs until cancelled; the poll interval is read from the active
+        configuration on every iteration so it can be tuned too.
+        """
+        log_handler.info(f"Watching configuration file {self._config_path}")
+        while True:
+            await asyncio.sleep(self.snapshot()['config_reload']['poll_interval_seconds'])
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                log_handler.error(f"Error while checking configuration file: {e}")
+
+    def __getitem__(self, key: str) -> Any:
+        return self.load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.load())
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+# Shared configuration, loaded on first access
+config_loader = ConfigLoader()
\ No newline at end of file
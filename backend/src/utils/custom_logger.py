@@ -8,6 +8,7 @@
 #############################################################################
 
 This module initializes a custom logger to handle log messages for the other modules.
+The log file is only created once setup_file_logging() is called.
 """
 
 #Native imports
@@ -26,35 +27,58 @@ log_format = logging.Formatter(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-"""File handler (File accessible only when it runs locally)"""
-#Create folder
-log_directory = "logs"
-os.makedirs(log_directory, exist_ok=True)
-
-#Create log file
-log_file = os.path.join(
-    log_directory, 
-    datetime.datetime.now().strftime("job_scraper_backend_%Y-%m-%dT%H-%M-%S.log")
-)
-file_handler = logging.FileHandler(log_file)
-file_handler.setFormatter(log_format)
-
 """Console handler for console output"""
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setFormatter(log_format)
 
-#Final log handler
+#Console output is available right away, importing this module touches no files
 if not log_handler.hasHandlers():
-    log_handler.addHandler(file_handler)
     log_handler.addHandler(console_handler)
 
-log_handler.info("Job Scraper backend server starting")
-log_handler.info(f"Current working directory: {os.getcwd()}, Logs are written to '{log_file}'")
+"""File handler (File accessible only when it runs locally)"""
+#Created lazily by setup_file_logging(), called from the app lifespan
+file_handler = None
+log_file = None
+
+def setup_file_logging(log_directory: str = "logs") -> str:
+    """
+    Create the log folder and the timestamped log file, once per process.
+
+    Importing this module has no filesystem side effects, so tools and tests
+    can import it freely; the server calls this on startup.
+
+    Parameters:
+        log_directory (str): Folder where log files are written.
+
+    Returns:
+        str: Path of the log file in use.
+    """
+    global file_handler, log_file
+
+    if file_handler is not None:
+        return log_file
+
+    #Create folder
+    os.makedirs(log_directory, exist_ok=True)
+
+    #Create log file
+    log_file = os.path.join(
+        log_directory,
+        datetime.datetime.now().strftime("job_scraper_backend_%Y-%m-%dT%H-%M-%S.log")
+    )
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(log_format)
+    log_handler.addHandler(file_handler)
+
+    log_handler.info("Job Scraper backend server starting")
+    log_handler.info(f"Current working directory: {os.getcwd()}, Logs are written to '{log_file}'")
+    return log_file
 
 #Example usage
 """
-from src.utils.custom_logger import log_handler
+from src.utils.custom_logger import log_handler, setup_file_logging
 
+setup_file_logging()
 log_handler.debug("Debug message")
 log_handler.info("Info message")
 log_handler.warning("Warning message")
@@ -7,13 +7,19 @@
 ### @date: 2025
 #############################################################################
 
-This utility provides methods to encrypt and decrypt strings
+This utility provides methods to encrypt and decrypt strings, one at a time
+or in batches spread across a process pool.
 """
 
 #Native imports
 import os
 import json
+import asyncio
+import threading
+import multiprocessing
 from base64 import b64encode, b64decode
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional
 
 #Third-party imports
 from cryptography.hazmat.primitives import serialization, hashes
@@ -125,3 +131,165 @@ def decrypt_out(token: str, dtype: str = "str"):
     convert_func = type_map[dtype]
     log_handler.debug("Decryption successful")
     return convert_func(decrypted_str)
+
+
+"""BATCH METHODS -----------------------------------------------------"""
+#Tokens handed to a worker per task, keeps IPC overhead low for small payloads
+BATCH_CHUNK_SIZE = 64
+
+#Process pool shared by the batch methods, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers: Optional[int] = None
+_process_pool_lock = threading.Lock()
+
+def _get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, creating it on first use.
+
+    Each worker imports this module once, which loads the RSA keys once per
+    process, so the keys are never re-parsed per token. Workers are spawned
+    rather than forked: batches are started from a multi-threaded server,
+    and forking a multi-threaded process is unsafe.
+
+    Replacing a pool of a different size waits for its running batches, so
+    async callers must call this from a worker thread.
+
+    Parameters:
+        max_workers (int | None): Number of worker processes, defaults to the CPU count.
+
+    Returns:
+        ProcessPoolExecutor: The shared executor.
+    """
+    global _process_pool, _process_pool_workers
+
+    workers = max_workers or os.cpu_count() or 1
+    with _process_pool_lock:
+        if _process_pool is not None and _process_pool_workers != workers:
+            _shutdown_process_pool_locked()
+
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=workers,
+                                                mp_context=multiprocessing.get_context("spawn"))
+            _process_pool_workers = workers
+            log_handler.info(f"Crypto process pool started with {workers} workers")
+        return _process_pool
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool if it was started."""
+    with _process_pool_lock:
+        _shutdown_process_pool_locked()
+
+def _shutdown_process_pool_locked() -> None:
+    global _process_pool, _process_pool_workers
+
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True)
+        _process_pool = None
+        _process_pool_workers = None
+        log_handler.info("Crypto process pool shut down")
+
+def _chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _encrypt_chunk(messages: List[Any]) -> List[str]:
+    """Worker task: encrypt a chunk of messages in order."""
+    return [encrypt_in(message) for message in messages]
+
+def _decrypt_chunk(tokens: List[str], dtype: str) -> List[Any]:
+    """Worker task: decrypt a chunk of tokens in order."""
+    return [decrypt_out(token, dtype) for token in tokens]
+
+def encrypt_many(messages: Iterable[Any], max_workers: Optional[int] = None,
+                 chunk_size: int = BATCH_CHUNK_SIZE) -> List[str]:
+    """
+    Encrypt many values in parallel using the shared process pool.
+
+    Parameters:
+        messages (Iterable): Values accepted by encrypt_in().
+        max_workers (int | None): Number of worker processes, defaults to the CPU count.
+        chunk_size (int): Number of values sent to a worker per task.
+
+    Returns:
+        list[str]: Base64 encoded tokens, in the same order as the input.
+    """
+    messages = list(messages)
+    if len(messages) <= chunk_size:
+        return _encrypt_chunk(messages)
+
+    pool = _get_process_pool(max_workers)
+    results: List[str] = []
+    for chunk_result in pool.map(_encrypt_chunk, _chunked(messages, chunk_size)):
+        results.extend(chunk_result)
+    log_handler.debug(f"Batch encryption successful for {len(results)} values")
+    return results
+
+def decrypt_many(tokens: Iterable[str], dtype: str = "str", max_workers: Optional[int] = None,
+                 chunk_size: int = BATCH_CHUNK_SIZE) -> List[Any]:
+    """
+    Decrypt many tokens in parallel using the shared process pool.
+
+    Parameters:
+        tokens (Iterable[str]): Base64 encoded encrypted data.
+        dtype (str): Original type of every token, see decrypt_out().
+        max_workers (int | None): Number of worker processes, defaults to the CPU count.
+        chunk_size (int): Number of tokens sent to a worker per task.
+
+    Returns:
+        list: The decrypted values, in the same order as the input.
+
+    Raises:
+        ValueError: if an unsupported dtype is provided.
+    """
+    tokens = list(tokens)
+    if len(tokens) <= chunk_size:
+        return _decrypt_chunk(tokens, dtype)
+
+    pool = _get_process_pool(max_workers)
+    results: List[Any] = []
+    chunks = _chunked(tokens, chunk_size)
+    for chunk_result in pool.map(_decrypt_chunk, chunks, [dtype] * len(chunks)):
+        results.extend(chunk_result)
+    log_handler.debug(f"Batch decryption successful for {len(results)} tokens")
+    return results
+
+async def encrypt_many_async(messages: Iterable[Any], max_workers: Optional[int] = None,
+                             chunk_size: int = BATCH_CHUNK_SIZE) -> List[str]:
+    """
+    Async version of encrypt_many(), safe to await from an endpoint.
+
+    The pool is obtained in a worker thread and the chunks are awaited as pool
+    futures, so the event loop is never blocked by the RSA operations or by
+    resizing the pool.
+    """
+    messages = list(messages)
+    loop = asyncio.get_running_loop()
+    pool = await asyncio.to_thread(_get_process_pool, max_workers)
+    futures = [loop.run_in_executor(pool, _encrypt_chunk, chunk)
+               for chunk in _chunked(messages, chunk_size)]
+
+    results: List[str] = []
+    for chunk_result in await asyncio.gather(*futures):
+        results.extend(chunk_result)
+    return results
+
+async def decrypt_many_async(tokens: Iterable[str], dtype: str = "str",
+                             max_workers: Optional[int] = None,
+                             chunk_size: int = BATCH_CHUNK_SIZE) -> List[Any]:
+    """
+    Async version of decrypt_many(), safe to await from an endpoint.
+
+    The pool is obtained in a worker thread and the chunks are awaited as pool
+    futures, so the event loop is never blocked by the RSA operations or by
+    resizing the pool.
+    """
+    tokens = list(tokens)
+    loop = asyncio.get_running_loop()
+    pool = await asyncio.to_thread(_get_process_pool, max_workers)
+    futures = [loop.run_in_executor(pool, _decrypt_chunk, chunk, dtype)
+               for chunk in _chunked(tokens, chunk_size)]
+
+    results: List[Any] = []
+    for chunk_result in await asyncio.gather(*futures):
+        results.extend(chunk_result)
+    return results
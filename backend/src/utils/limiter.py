@@ -11,9 +11,33 @@ This module contains the element to limit the number of requests per minute to
 the endpoints in the server
 """
 
+#Native imports
+from typing import Callable
+
 #Third party libraries
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+#Other files imports
+from src.core_specs.configuration.config_loader import config_loader
+
 #Shared rate limiter instance
 limiter = Limiter(key_func=get_remote_address)
+
+def endpoint_limit(endpoint_name: str) -> Callable[[], str]:
+    """
+    Build a rate limit provider for an endpoint defined in config_file.json.
+
+    slowapi calls the provider on each request, so the limit is read from the
+    configuration when a request arrives instead of when the router is imported.
+
+    Parameters:
+        endpoint_name (str): Key of the endpoint inside the "endpoints" section.
+
+    Returns:
+        Callable[[], str]: Provider returning a limit string such as "30/minute".
+    """
+    def limit_provider() -> str:
+        endpoint_config = config_loader['endpoints'][endpoint_name]
+        return f"{endpoint_config['request_limit']}/{endpoint_config['unit_of_time_for_limit']}"
+    return limit_provider
@@ -0,0 +1,117 @@
+################################################################################
+# Trace Summary
+##
+# @file trace_summary.py
+# @date: 2025
+################################################################################
+"""
+Offline latency breakdown of the spans exported by src/utils/tracing.py.
+
+Prints count and p50/p95/max duration per span name, then the slowest
+requests with their span tree, so a slow /jobs/list can be matched with the
+Google Sheets attempt or parsing step that caused it.
+
+Usage (from the backend directory):
+    python -m src.utils.trace_summary logs/traces.jsonl
+    python -m src.utils.trace_summary logs/traces.jsonl --path /api/v1/jobs/list --slowest 5
+    python -m src.utils.trace_summary logs/traces.jsonl --trace <X-Trace-Id header value>
+"""
+
+# Native imports
+import sys
+import json
+import argparse
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+def load_spans(file_path: str) -> List[Dict[str, Any]]:
+    """Read the JSONL export, skipping truncated lines (e.g. after a crash)."""
+    spans = []
+    with open(file_path, "r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def print_span_stats(spans: List[Dict[str, Any]]) -> None:
+    """Duration statistics per span name."""
+    durations: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    for span in spans:
+        durations[span["name"]].append(span["duration_ms"])
+        if span["status"] == "error":
+            errors[span["name"]] += 1
+
+    print(f"{'span':<24}{'count':>8}{'errors':>8}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}")
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        values.sort()
+        print(f"{name:<24}{len(values):>8}{errors[name]:>8}"
+              f"{percentile(values, 0.5):>12.2f}{percentile(values, 0.95):>12.2f}"
+              f"{values[-1]:>12.2f}")
+
+def print_trace_tree(trace: List[Dict[str, Any]]) -> None:
+    """Print one trace as an indented tree, children in start order."""
+    children: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+    for span in sorted(trace, key=lambda span: span["start_time"]):
+        children[span["parent_id"]].append(span)
+
+    def print_node(span: Dict[str, Any], depth: int) -> None:
+        attributes = " ".join(f"{key}={value}" for key, value in span["attributes"].items())
+        error = f" ERROR {span['error']}" if span["error"] else ""
+        print(f"  {'  ' * depth}{span['name']:<{28 - 2 * depth}}"
+              f"{span['duration_ms']:>10.2f} ms  {attributes}{error}")
+        for child in children[span["span_id"]]:
+            print_node(child, depth + 1)
+
+    for root in children[None]:
+        print_node(root, 0)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize exported trace spans")
+    parser.add_argument("file_path", help="JSONL file written by the tracer (tracing.file_path)")
+    parser.add_argument("--path", help="Only requests to this path")
+    parser.add_argument("--slowest", type=int, default=3,
+                        help="Number of slowest requests to break down")
+    parser.add_argument("--trace", help="Break down this trace id only")
+    args = parser.parse_args()
+
+    traces: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for span in load_spans(args.file_path):
+        traces[span["trace_id"]].append(span)
+
+    if args.trace:
+        if args.trace not in traces:
+            print(f"Trace {args.trace} not found")
+            return 1
+        print_trace_tree(traces[args.trace])
+        return 0
+
+    roots = {
+        trace_id: root for trace_id, trace in traces.items()
+        for root in trace
+        if root["parent_id"] is None
+        and (not args.path or root["attributes"].get("path") == args.path)
+    }
+    selected = [span for trace_id in roots for span in traces[trace_id]]
+    if not selected:
+        print("No spans found")
+        return 1
+
+    print(f"{len(roots)} traces, {len(selected)} spans\n")
+    print_span_stats(selected)
+
+    slowest = sorted(roots.items(), key=lambda item: -item[1]["duration_ms"])[:args.slowest]
+    for trace_id, root in slowest:
+        print(f"\nTrace {trace_id}")
+        print_trace_tree(traces[trace_id])
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+################################################################################
+# Tracing
+##
+# @file tracing.py
+# @date: 2025
+################################################################################
+"""
+Lightweight tracing with spans exported to a local JSONL file.
+
+A span measures one operation (request, Google Sheets attempt, CSV parsing,
+response serialization) and knows its parent through a context variable, so
+spans opened in the same request (including code run with asyncio.to_thread)
+form one trace. Finished spans are written as one JSON object per line and
+can be summarized offline with src/utils/trace_summary.py. The file is
+written by a background thread, never on the event loop.
+
+Tracing is off until setup_tracing() is called (from the app lifespan); until
+then span() costs a context variable lookup and nothing is recorded.
+"""
+
+# Native imports
+import os
+import json
+import time
+import secrets
+import threading
+from contextvars import ContextVar
+from contextlib import contextmanager
+from typing import Dict, Any, Awaitable, Callable, Iterator, List, Optional
+
+# Other files imports
+from src.utils.custom_logger import log_handler
+
+"""SPANS-----------------------------------------------------------"""
+class Span:
+    """One timed operation of a trace."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_time", "_start", "duration_ms",
+                 "attributes", "status", "error")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a value (status code, row count, ...) to the span."""
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        """Stop the timer."""
+        self.duration_ms = round((time.perf_counter() - self._start) * 1000, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Exported representation."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes
+        }
+
+class _NoopSpan:
+    """Returned by span() while tracing is disabled."""
+
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+"""EXPORTER-----------------------------------------------------------"""
+class JsonlFileExporter:
+    """
+    Append finished spans to a JSONL file from a background thread.
+
+    export() only appends the encoded span to a buffer, so ending a span never
+    touches the file on the event loop. A daemon thread writes the buffer every
+    flush_interval_seconds (sooner once max_buffered_spans are waiting), so
+    the spans of many requests share one write. When the file grows beyond
+    max_file_bytes it is rotated to "<file_path>.1", keeping one old file.
+    """
+
+    def __init__(self, file_path: str, flush_interval_seconds: float = 1.0,
+                 max_file_bytes: int = 100 * 1024 * 1024, max_buffered_spans: int = 4096) -> None:
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file_path = file_path
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_file_bytes = max_file_bytes
+        self.max_buffered_spans = max_buffered_spans
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        # Serializes file writes between the flush thread and flush()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.max_buffered_spans:
+                self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered spans now."""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if not lines:
+            return
+        with self._write_lock:
+            try:
+                if (os.path.exists(self.file_path)
+                        and os.path.getsize(self.file_path) >= self.max_file_bytes):
+                    os.replace(self.file_path, self.file_path + ".1")
+                with open(self.file_path, "a", encoding="utf-8") as file:
+                    file.write("\n".join(lines) + "\n")
+            except OSError as e:
+                log_handler.warning(f"Could not write traces to '{self.file_path}': {e}")
+
+    def close(self) -> None:
+        """Stop the flush thread and write the remaining spans."""
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+
+"""TRACER-----------------------------------------------------------"""
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporter: Optional[JsonlFileExporter] = None
+
+def setup_tracing(file_path: str, flush_interval_seconds: float = 1.0,
+                  max_file_bytes: int = 100 * 1024 * 1024) -> None:
+    """
+    Enable tracing and export finished spans to file_path, once per process.
+
+    Parameters:
+        file_path (str): JSONL file the spans are appended to.
+        flush_interval_seconds (float): Delay between two background writes.
+        max_file_bytes (int): Size at which the file is rotated to "<file_path>.1".
+    """
+    global _exporter
+
+    if _exporter is None:
+        _exporter = JsonlFileExporter(file_path, flush_interval_seconds, max_file_bytes)
+        log_handler.info(f"Tracing enabled, spans are written to '{file_path}'")
+
+def shutdown_tracing() -> None:
+    """Disable tracing, then flush the buffered spans and stop the flush thread."""
+    global _exporter
+
+    if _exporter is not None:
+        exporter, _exporter = _exporter, None
+        exporter.close()
+
+def tracing_enabled() -> bool:
+    """Whether setup_tracing() is active."""
+    return _exporter is not None
+
+def get_current_span() -> Optional[Span]:
+    """The innermost open span of the current context, if any."""
+    return _current_span.get()
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Time the enclosed block as a child of the current span.
+
+    Exceptions are recorded on the span (status "error") and re-raised.
+
+    Usage:
+        with span("sheets.attempt", attempt=1) as current:
+            current.set_attribute("status_code", 200)
+    """
+    exporter = _exporter
+    if exporter is None:
+        yield _NOOP_SPAN
+        return
+
+    current = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end()
+        exporter.export(current)
+
+"""ASGI MIDDLEWARE-----------------------------------------------------------"""
+class TracingMiddleware:
+    """
+    Pure ASGI middleware opening the root span of every HTTP request.
+
+    Requests to untraced_paths (the probes) and every request while tracing
+    is disabled go straight to the app: no span, no wrapped send, no extra
+    task. Traced responses carry their trace id in the X-Trace-Id header, and
+    the span lasts until the body is sent, so streamed responses are timed
+    completely.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]],
+                 untraced_paths: frozenset = frozenset()) -> None:
+        self.app = app
+        self.untraced_paths = untraced_paths
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["path"] in self.untraced_paths or _exporter is None:
+            await self.app(scope, receive, send)
+            return
+
+        with span("http.request", method=scope["method"], path=scope["path"]) as request_span:
+            async def send_with_trace_id(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    request_span.set_attribute("status_code", message["status"])
+                    if request_span.trace_id:
+                        headers = list(message.get("headers", []))
+                        headers.append((b"x-trace-id", request_span.trace_id.encode("ascii")))
+                        message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
@@ -7,17 +7,27 @@
 ### @date: 2025
 #############################################################################
 
-This module defines several methods to validate several things.
+This module defines several methods to validate several things, including a
+batch validator that checks every job row of a snapshot in one pass.
 """
 #Native imports
 import re
+from typing import Any, Dict, List, Optional, Tuple
 
 #Other files imports
 from src.utils.custom_logger import log_handler
-#from src.core_specs.configuration.config_loader import config_loader
-from src.core_specs.data.data_loader import data_loader
+from src.core_specs.configuration.config_loader import config_loader
 from fastapi import HTTPException
 
+def _get_data_loader():
+    """
+    Import the region data lazily, only the region validators need it.
+
+    Keeps this module importable when the optional data package is not present.
+    """
+    from src.core_specs.data.data_loader import data_loader
+    return data_loader
+
 def validate_summoner_name(give_name: str):
     """
     Validate a League of Legends summoner name (gameName).
@@ -61,7 +71,7 @@ def validate_region_routing(given_region: str):
         HTTPException: If the region is not valid.
     """
     region_lower = given_region.lower()
-    general_regions = data_loader["regions"]["regional_routings"]
+    general_regions = _get_data_loader()["regions"]["regional_routings"]
 
     if region_lower not in general_regions:
         raise HTTPException(
@@ -83,7 +93,7 @@ def validate_platform_regions(given_region: str):
         HTTPException: If the region is not valid.
     """
     region_plat_lower = given_region.lower()
-    plat_regions = data_loader["regions"]["platform_regions"]
+    plat_regions = _get_data_loader()["regions"]["platform_regions"]
 
     if region_plat_lower not in plat_regions:
         raise HTTPException(
@@ -93,3 +103,118 @@ def validate_platform_regions(given_region: str):
 
     log_handler.debug(f"Region '{given_region}' is valid.")
 
+
+
+"""JOB ROW VALIDATION -----------------------------------------------------"""
+# Rules that only concern the link: a row breaking nothing else keeps its
+# posting, with the "#" placeholder instead of the unusable link
+LINK_RULES = frozenset(("invalid_link", "too_long_link", "disallowed_characters_link"))
+
+class JobRowRules:
+    """
+    Job row validation rules compiled once from the "validation" config section.
+
+    Regexes are compiled here, not per row or per call; validate_job_rows()
+    rebuilds the rules only when the configuration version changes. The
+    settings were checked (and the patterns test-compiled) by validate_config(),
+    so a configuration that would break here is never activated.
+    """
+
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        self.required_fields: Tuple[str, ...] = tuple(settings["required_fields"])
+        self.max_lengths: Tuple[Tuple[str, int], ...] = tuple(settings["max_lengths"].items())
+        self.disallowed_characters = re.compile(settings["disallowed_characters_pattern"])
+        self.link_pattern = re.compile(settings["link_pattern"], re.IGNORECASE)
+        self.checked_fields: Tuple[str, ...] = ("company", "job_title", "link")
+
+    def is_valid(self, job: Dict[str, str]) -> bool:
+        """
+        Fast check used for every row; failed_rules() is only run on rejected rows.
+
+        The checked fields are joined with a newline (never a disallowed
+        character) so one regex search covers all of them.
+        """
+        for field in self.required_fields:
+            if not job.get(field, "").strip():
+                return False
+        for field, max_length in self.max_lengths:
+            if len(job.get(field, "")) > max_length:
+                return False
+        checked_text = "\n".join([job.get(field, "") for field in self.checked_fields])
+        if self.disallowed_characters.search(checked_text):
+            return False
+        return self.link_pattern.match(job.get("link", "")) is not None
+
+    def failed_rules(self, job: Dict[str, str]) -> List[str]:
+        """Return the names of every rule the row breaks (empty list when valid)."""
+        failures = []
+        for field in self.required_fields:
+            if not job.get(field, "").strip():
+                failures.append(f"missing_{field}")
+        for field, max_length in self.max_lengths:
+            if len(job.get(field, "")) > max_length:
+                failures.append(f"too_long_{field}")
+        for field in self.checked_fields:
+            if self.disallowed_characters.search(job.get(field, "")):
+                failures.append(f"disallowed_characters_{field}")
+        if not self.link_pattern.match(job.get("link", "")):
+            failures.append("invalid_link")
+        return failures
+
+_job_row_rules: Optional[JobRowRules] = None
+_job_row_rules_version: Optional[int] = None
+
+def get_job_row_rules() -> JobRowRules:
+    """Get the compiled job row rules for the active configuration version."""
+    global _job_row_rules, _job_row_rules_version
+
+    if _job_row_rules is None or _job_row_rules_version != config_loader.version:
+        _job_row_rules = JobRowRules(config_loader['validation'])
+        _job_row_rules_version = config_loader.version
+    return _job_row_rules
+
+def validate_job_rows(jobs: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+    """
+    Validate all job rows of a snapshot in a single pass.
+
+    Rows breaking any rule are dropped, except rows whose only problem is the
+    link ("N/A", "apply by email"): their link is replaced with the "#"
+    placeholder, so no posting is lost. Every broken rule of a dropped row is
+    counted, so one row can contribute to several counters.
+
+    Parameters:
+        jobs: Parsed job rows.
+
+    Returns:
+        Tuple of the kept rows (in input order) and a report with the number
+        of checked and rejected rows, the rejection count per rule and the
+        number of links replaced with "#".
+    """
+    rules = get_job_row_rules()
+    valid_jobs = []
+    rejections: Dict[str, int] = {}
+    replaced_links = 0
+    is_valid = rules.is_valid
+    for job in jobs:
+        if is_valid(job):
+            valid_jobs.append(job)
+            continue
+        failures = rules.failed_rules(job)
+        if LINK_RULES.issuperset(failures):
+            valid_jobs.append({**job, "link": "#"})
+            replaced_links += 1
+            continue
+        for rule in failures:
+            rejections[rule] = rejections.get(rule, 0) + 1
+
+    rejected = len(jobs) - len(valid_jobs)
+    if rejected:
+        log_handler.warning(f"Rejected {rejected} of {len(jobs)} job rows: {rejections}")
+    if replaced_links:
+        log_handler.warning(f"Replaced {replaced_links} invalid job links with '#'")
+    return valid_jobs, {
+        "checked_rows": len(jobs),
+        "rejected_rows": rejected,
+        "rejections": rejections,
+        "replaced_links": replaced_links
+    }
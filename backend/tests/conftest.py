@@ -0,0 +1,83 @@
+################################################################################
+# Test Fixtures
+##
+# @file conftest.py
+# @date: 2025
+################################################################################
+"""
+Shared fixtures: a private copy of the configuration per test, empty sheet
+caches and a fake Google Sheets export, so no test touches the network, the
+history database or the state left behind by another test.
+"""
+
+# Native imports
+import os
+import copy
+import time
+import threading
+from collections import OrderedDict
+
+# Third-party imports
+import pytest
+
+# A sheet ID must be configured before the configuration is loaded
+os.environ.setdefault("GOOGLE_SHEET_ID", "test-sheet")
+
+# Other files imports
+from src.core_specs.configuration.config_loader import config_loader
+import src.api_endpoints.routers.jobs_info.jobs_utils as jobs_utils
+
+@pytest.fixture
+def config(monkeypatch):
+    """Copy of the active configuration that the test may change freely."""
+    settings = copy.deepcopy(config_loader.load())
+    settings["history"]["enabled"] = False
+    settings["enrichment"]["enabled"] = False
+    monkeypatch.setattr(config_loader, "_config", settings)
+    return settings
+
+@pytest.fixture
+def sheet_caches(monkeypatch, config):
+    """Empty sheet caches, fetch locks and upstream statuses."""
+    default_cache = jobs_utils._new_sheet_cache()
+    monkeypatch.setattr(jobs_utils, "_sheet_caches",
+                        OrderedDict({jobs_utils.DEFAULT_SHEET: default_cache}))
+    monkeypatch.setattr(jobs_utils, "_jobs_cache", default_cache)
+    monkeypatch.setattr(jobs_utils, "_fetch_locks", {})
+    monkeypatch.setattr(jobs_utils, "_upstream_statuses",
+                        {jobs_utils.DEFAULT_SHEET: jobs_utils._new_upstream_status()})
+    monkeypatch.setattr(jobs_utils, "_circuit_opened_monotonic", {})
+    return jobs_utils._sheet_caches
+
+class FakeSheetResponse:
+    """Minimal stand-in for the requests.Response of a CSV export."""
+
+    def __init__(self, text: str) -> None:
+        self.ok = True
+        self.status_code = 200
+        self.text = text
+
+@pytest.fixture
+def fake_sheet(monkeypatch, sheet_caches):
+    """
+    Replace the Google Sheets download with a local CSV export.
+
+    Returns a dict holding the served "csv" text (tests may change it), the
+    number of "calls" and the "delay" in seconds of each download.
+    """
+    upstream = {
+        "csv": "Company,Position,Link\nAcme,Backend Developer,https://acme.example.com/jobs/1\n"
+               "Globex,Data Engineer,https://globex.example.com/jobs/2",
+        "calls": 0,
+        "delay": 0.0
+    }
+    calls_lock = threading.Lock()
+
+    def fake_get(url, **kwargs):
+        with calls_lock:
+            upstream["calls"] += 1
+        time.sleep(upstream["delay"])
+        return FakeSheetResponse(upstream["csv"])
+
+    monkeypatch.setattr(jobs_utils.requests, "get", fake_get)
+    return upstream
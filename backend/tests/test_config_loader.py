@@ -0,0 +1,81 @@
+################################################################################
+# Config Loader Tests
+##
+# @file test_config_loader.py
+# @date: 2025
+################################################################################
+"""
+Tests for configuration validation and hot reload: an invalid file is
+rejected and the previous configuration stays active.
+"""
+
+# Native imports
+import copy
+import json
+
+# Third-party imports
+import pytest
+
+# Other files imports
+from src.core_specs.configuration.config_loader import (
+    ConfigLoader, read_config_file, validate_config
+)
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Copy of the shipped configuration file in a temporary directory."""
+    path = tmp_path / "config_file.json"
+    path.write_text(json.dumps(read_config_file()), encoding="utf-8")
+    return path
+
+def write_config(path, settings):
+    """Write settings to the config file with a new size, so the change is always detected."""
+    path.write_text(json.dumps(settings, indent=1), encoding="utf-8")
+
+def test_shipped_config_is_valid():
+    validate_config(read_config_file())
+
+@pytest.mark.parametrize("mutate", [
+    lambda settings: settings.pop("validation"),
+    lambda settings: settings["jobs_cache"].update(cache_duration=-1),
+    lambda settings: settings["refresh_tasks"].update(max_retained="50"),
+    lambda settings: settings["validation"].update(link_pattern="(unclosed"),
+    lambda settings: settings["sheets"].update(
+        allowlist={"archive": {"doc_id": "doc", "cache_duration": -1}}
+    ),
+])
+def test_invalid_values_are_rejected(mutate):
+    settings = read_config_file()
+    mutate(settings)
+    with pytest.raises(ValueError):
+        validate_config(settings)
+
+def test_reload_rejects_invalid_config(config_file):
+    loader = ConfigLoader(str(config_file))
+    original = copy.deepcopy(loader.snapshot())
+    assert loader.version == 1
+
+    broken = copy.deepcopy(original)
+    broken["jobs_cache"]["cache_duration"] = -5
+    write_config(config_file, broken)
+    assert loader.reload_if_changed() is False
+    assert loader.version == 1
+    assert loader["jobs_cache"]["cache_duration"] == original["jobs_cache"]["cache_duration"]
+
+    config_file.write_text("{ not json", encoding="utf-8")
+    assert loader.reload() is False
+    assert loader.version == 1
+
+def test_reload_applies_valid_config(config_file):
+    loader = ConfigLoader(str(config_file))
+    previous = loader.snapshot()
+
+    changed = copy.deepcopy(previous)
+    changed["jobs_cache"]["cache_duration"] = previous["jobs_cache"]["cache_duration"] + 60
+    write_config(config_file, changed)
+    assert loader.reload_if_changed() is True
+    assert loader.version == 2
+    assert loader["jobs_cache"]["cache_duration"] == changed["jobs_cache"]["cache_duration"]
+    # Readers holding the previous snapshot keep a consistent view
+    assert previous["jobs_cache"]["cache_duration"] != loader["jobs_cache"]["cache_duration"]
+    assert loader.reload_if_changed() is False
@@ -0,0 +1,67 @@
+################################################################################
+# CSV Parsing Tests
+##
+# @file test_csv_parsing.py
+# @date: 2025
+################################################################################
+"""
+Tests for parallel CSV parsing: record-aligned splitting and identical
+results to the inline parser.
+"""
+
+# Third-party imports
+import pytest
+
+# Other files imports
+import src.api_endpoints.routers.jobs_info.jobs_utils as jobs_utils
+
+def make_export(rows: int) -> str:
+    """CSV export mixing plain, quoted, multi-line and non-ASCII values."""
+    lines = ["Company,Position,Link"]
+    for index in range(rows):
+        if index % 4 == 0:
+            lines.append(f'"Acme, Inc.",Developer {index},https://acme.example.com/jobs/{index}')
+        elif index % 4 == 1:
+            lines.append(f'"Globex\nHoldings","Engineer ""{index}""",'
+                         f'https://globex.example.com/{index}')
+        elif index % 4 == 2:
+            lines.append(f"Zürich Versicherung,Aktuar:in {index},#")
+        else:
+            lines.append("")
+    return "\n".join(lines) + "\n\n"
+
+@pytest.fixture
+def parse_pool():
+    """Shut the process pool down after the test."""
+    yield
+    jobs_utils.shutdown_parse_pool()
+
+def test_split_keeps_quoted_newlines_together():
+    body = make_export(400).strip().split("\n", 1)[1]
+    chunks = jobs_utils.split_csv_records(body, 13)
+
+    assert len(chunks) > 1
+    assert "\n".join(chunks) == body
+    assert all(chunk.count('"') % 2 == 0 for chunk in chunks)
+
+@pytest.mark.parametrize("workers, chunks_per_worker", [(2, 1), (2, 4), (3, 7)])
+def test_parallel_parse_matches_inline_parse(parse_pool, workers, chunks_per_worker):
+    export = make_export(2000)
+    parallel_jobs = jobs_utils.parse_csv_parallel(export, workers, chunks_per_worker)
+    assert parallel_jobs == jobs_utils.parse_csv_to_jobs(export)
+
+def test_parallel_parse_of_header_only_export(parse_pool):
+    assert jobs_utils.parse_csv_parallel("Company,Position,Link", 2) == []
+
+def test_large_exports_use_the_pool(parse_pool, config):
+    config["parsing"].update(parallel_min_chars=1000, max_workers=2)
+    export = make_export(2000)
+
+    jobs, parallel = jobs_utils.parse_csv(export)
+    assert parallel
+    assert jobs == jobs_utils.parse_csv_to_jobs(export)
+
+    small_export = make_export(8)
+    small_jobs, small_parallel = jobs_utils.parse_csv(small_export)
+    assert not small_parallel
+    assert small_jobs == jobs_utils.parse_csv_to_jobs(small_export)
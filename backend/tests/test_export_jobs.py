@@ -0,0 +1,75 @@
+################################################################################
+# Export Jobs Tests
+##
+# @file test_export_jobs.py
+# @date: 2025
+################################################################################
+"""
+Tests for resumable CSV exports: parsing of the Range header and the
+Range/If-Range handling of the export endpoint.
+"""
+
+# Third-party imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Other files imports
+from main import app
+from src.api_endpoints.routers.jobs_info.export_jobs import parse_range_header
+
+EXPORT_PATH = "/api/v1/jobs/export?format=csv"
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=10-", (10, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+    ("bytes=90-500", (90, 99)),
+    (" bytes = 5-5", (5, 5)),
+])
+def test_satisfiable_ranges(header, expected):
+    assert parse_range_header(header, 100) == expected
+
+@pytest.mark.parametrize("header", [
+    "items=0-9",       # Unknown unit
+    "bytes=0-9,20-29", # Multiple ranges are not supported
+    "bytes=abc-",      # Malformed
+    "bytes=100-",      # Starts past the end
+    "bytes=9-3",       # Ends before it starts
+])
+def test_unsatisfiable_ranges(header):
+    assert parse_range_header(header, 100) is None
+
+@pytest.fixture
+def client(fake_sheet, config):
+    """Test client for an export of generated jobs, without the rate limit getting in the way."""
+    config["endpoints"]["export_jobs_endpoint"]["request_limit"] = 1000
+    rows = [f"Company {index},Engineer {index},https://jobs.example.com/{index}"
+            for index in range(200)]
+    fake_sheet["csv"] = "Company,Position,Link\n" + "\n".join(rows)
+    return TestClient(app)
+
+def test_range_request_resumes_download(client):
+    full = client.get(EXPORT_PATH)
+    assert full.status_code == 200
+    assert full.headers["accept-ranges"] == "bytes"
+    assert int(full.headers["content-length"]) == len(full.content)
+
+    size = len(full.content)
+    partial = client.get(EXPORT_PATH,
+                         headers={"Range": "bytes=100-", "If-Range": full.headers["etag"]})
+    assert partial.status_code == 206
+    assert partial.headers["content-range"] == f"bytes 100-{size - 1}/{size}"
+    assert full.content[:100] + partial.content == full.content
+
+def test_stale_if_range_returns_full_export(client):
+    full = client.get(EXPORT_PATH)
+    response = client.get(EXPORT_PATH, headers={"Range": "bytes=100-", "If-Range": '"stale-etag"'})
+    assert response.status_code == 200
+    assert response.content == full.content
+
+def test_unsatisfiable_range_is_rejected(client):
+    size = len(client.get(EXPORT_PATH).content)
+    response = client.get(EXPORT_PATH, headers={"Range": f"bytes={size}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{size}"
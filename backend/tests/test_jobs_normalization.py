@@ -0,0 +1,79 @@
+################################################################################
+# Jobs Normalization Tests
+##
+# @file test_jobs_normalization.py
+# @date: 2025
+################################################################################
+"""
+Tests for normalization and merging of exact and near duplicate job rows.
+"""
+
+# Other files imports
+from src.api_endpoints.routers.jobs_info.jobs_normalization import (
+    canonical_url, comparison_key, normalize_and_deduplicate
+)
+
+def job(company, title, link="#"):
+    return {"company": company, "job_title": title, "link": link}
+
+def test_comparison_key_keeps_language_names():
+    assert comparison_key("Senior  C# / C++ Developer") == "senior c# c++ developer"
+    assert comparison_key(".NET Engineer") == ".net engineer"
+    assert comparison_key("Sr. Node.js Dev") == "sr node js dev"
+
+def test_canonical_url_drops_tracking_and_defaults():
+    tracking, prefixes = frozenset(("gclid",)), ("utm_",)
+    link = "HTTPS://Jobs.Example.com:443/a/?utm_source=x&id=2&gclid=y#apply"
+    assert canonical_url(link, tracking, prefixes) == "https://jobs.example.com/a?id=2"
+    # Client-side routes identify the posting and are kept
+    link = "https://careers.example.com/#/job/1"
+    assert canonical_url(link, tracking, prefixes) == "https://careers.example.com#/job/1"
+
+def test_exact_duplicates_are_merged(config):
+    jobs = [
+        job("Acme  GmbH.", "Backend Developer", "https://acme.example.com/jobs/1?utm_source=board"),
+        job("ACME GmbH", "backend developer", "https://acme.example.com/jobs/1"),
+        job("Acme GmbH", "Backend Developer", "https://acme.example.com/jobs/2"),
+    ]
+    deduplicated, stats = normalize_and_deduplicate(jobs)
+
+    assert stats["exact_duplicates"] == 1
+    assert stats["output_rows"] == 2
+    # The first occurrence is kept, normalized for display, with its link as listed
+    assert deduplicated[0] == job("Acme GmbH", "Backend Developer",
+                                  "https://acme.example.com/jobs/1?utm_source=board")
+
+def test_near_duplicates_are_merged(config):
+    jobs = [
+        job("Acme", "Senior Python Developer Berlin Remote", "https://acme.example.com/jobs/1"),
+        job("Acme", "Senior Python Developer (Berlin, Remote) m/w/d", "#"),
+        job("Acme", "Senior Python Developer Munich", "https://acme.example.com/jobs/1"),
+        job("Globex", "Senior Python Developer Berlin Remote", "https://globex.example.com/jobs/1"),
+    ]
+    deduplicated, stats = normalize_and_deduplicate(jobs)
+
+    assert stats["exact_duplicates"] == 0
+    assert stats["near_duplicates"] == 1
+    assert [(entry["company"], entry["job_title"]) for entry in deduplicated] == [
+        ("Acme", "Senior Python Developer Berlin Remote"),
+        ("Acme", "Senior Python Developer Munich"),
+        ("Globex", "Senior Python Developer Berlin Remote"),
+    ]
+
+def test_near_duplicates_with_different_links_are_kept(config):
+    jobs = [
+        job("Acme", "Senior Python Developer Berlin Remote", "https://acme.example.com/jobs/1"),
+        job("Acme", "Senior Python Developer (Berlin, Remote)", "https://acme.example.com/jobs/2"),
+    ]
+    _, stats = normalize_and_deduplicate(jobs)
+    assert stats["near_duplicates"] == 0
+
+def test_near_duplicates_can_be_disabled(config):
+    config["normalization"]["near_duplicates"]["enabled"] = False
+    jobs = [
+        job("Acme", "Senior Python Developer Berlin Remote"),
+        job("Acme", "Senior Python Developer (Berlin, Remote) m/w/d"),
+    ]
+    deduplicated, stats = normalize_and_deduplicate(jobs)
+    assert stats["near_duplicates"] == 0
+    assert len(deduplicated) == 2
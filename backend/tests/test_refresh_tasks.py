@@ -0,0 +1,130 @@
+################################################################################
+# Refresh Tasks Tests
+##
+# @file test_refresh_tasks.py
+# @date: 2025
+################################################################################
+"""
+Tests for the background refresh registry: status transitions, attaching to
+a running refresh and eviction of old status records.
+"""
+
+# Native imports
+import asyncio
+from collections import OrderedDict
+
+# Third-party imports
+import pytest
+from fastapi import HTTPException
+
+# Other files imports
+import src.api_endpoints.routers.jobs_info.jobs_refresh_tasks as refresh_tasks
+
+@pytest.fixture
+def registry(monkeypatch, config):
+    """Empty refresh registry."""
+    monkeypatch.setattr(refresh_tasks, "_refreshes", OrderedDict())
+    monkeypatch.setattr(refresh_tasks, "_refresh_tasks", {})
+    monkeypatch.setattr(refresh_tasks, "_active_refresh_ids", {})
+    return refresh_tasks._refreshes
+
+@pytest.fixture
+def fake_fetch(monkeypatch, registry):
+    """Replace the sheet fetch with one that waits for the test to release it."""
+    fetch = {"release": None, "error": None, "calls": 0}
+
+    async def fetch_jobs_from_sheets(force_refresh=False, on_progress=None, sheet=None):
+        fetch["calls"] += 1
+        on_progress("parsing", {"attempt": 1})
+        await fetch["release"].wait()
+        if fetch["error"] is not None:
+            raise fetch["error"]
+        return [{"company": "Acme", "job_title": "Developer", "link": "#"}]
+
+    monkeypatch.setattr(refresh_tasks, "fetch_jobs_from_sheets", fetch_jobs_from_sheets)
+    monkeypatch.setattr(refresh_tasks, "get_jobs_cache", lambda sheet: {"version": 7})
+    return fetch
+
+def test_refresh_status_transitions(fake_fetch):
+    async def scenario():
+        fake_fetch["release"] = asyncio.Event()
+        record, started = refresh_tasks.start_refresh()
+        assert started and record["status"] == "queued"
+
+        await asyncio.sleep(0)
+        assert record["status"] == "running"
+        assert record["phase"] == "parsing"
+        assert refresh_tasks.get_refresh_task(record["refresh_id"]) is not None
+
+        # A second request attaches to the running refresh
+        attached, started_again = refresh_tasks.start_refresh()
+        assert attached is record and not started_again
+
+        fake_fetch["release"].set()
+        await refresh_tasks.get_refresh_task(record["refresh_id"])
+        return record
+
+    record = asyncio.run(scenario())
+    assert record["status"] == "succeeded"
+    assert record["phase"] == "done"
+    assert record["count"] == 1
+    assert record["snapshot_version"] == 7
+    assert record["finished_at"] is not None
+    assert fake_fetch["calls"] == 1
+    assert refresh_tasks.get_refresh_task(record["refresh_id"]) is None
+
+def test_failed_refresh_keeps_error(fake_fetch):
+    async def scenario():
+        fake_fetch["release"] = asyncio.Event()
+        fake_fetch["error"] = HTTPException(status_code=503,
+                                            detail="Google Sheets is temporarily unavailable")
+        record, _ = refresh_tasks.start_refresh()
+        fake_fetch["release"].set()
+        with pytest.raises(HTTPException):
+            await refresh_tasks.get_refresh_task(record["refresh_id"])
+        # The finished refresh no longer blocks a new one
+        _, started = refresh_tasks.start_refresh()
+        assert started
+        return record
+
+    record = asyncio.run(scenario())
+    assert record["status"] == "failed"
+    assert record["error"] == "Google Sheets is temporarily unavailable"
+
+def test_oldest_finished_refreshes_are_evicted(fake_fetch, config):
+    config["refresh_tasks"]["max_retained"] = 2
+
+    async def scenario():
+        fake_fetch["release"] = asyncio.Event()
+        fake_fetch["release"].set()
+        records = []
+        for _ in range(3):
+            record, _ = refresh_tasks.start_refresh()
+            await refresh_tasks.get_refresh_task(record["refresh_id"])
+            records.append(record)
+        return records
+
+    first, second, third = asyncio.run(scenario())
+    assert refresh_tasks.get_refresh(first["refresh_id"]) is None
+    assert refresh_tasks.get_refresh(second["refresh_id"]) is second
+    assert refresh_tasks.get_refresh(third["refresh_id"]) is third
+
+def test_running_refresh_is_not_evicted(fake_fetch, config):
+    config["refresh_tasks"]["max_retained"] = 1
+    config["sheets"]["allowlist"] = {"archive": {"doc_id": "archive-doc"}}
+
+    async def scenario():
+        fake_fetch["release"] = asyncio.Event()
+        running, _ = refresh_tasks.start_refresh()
+        other, _ = refresh_tasks.start_refresh(sheet="archive")
+        # Over the limit, but the oldest record belongs to a refresh still in flight
+        retained = (refresh_tasks.get_refresh(running["refresh_id"]),
+                    refresh_tasks.get_refresh(other["refresh_id"]))
+        fake_fetch["release"].set()
+        await asyncio.gather(refresh_tasks.get_refresh_task(running["refresh_id"]),
+                             refresh_tasks.get_refresh_task(other["refresh_id"]))
+        return running, other, retained
+
+    running, other, retained = asyncio.run(scenario())
+    assert retained == (running, other)
+    assert other["sheet"] == "archive"
@@ -0,0 +1,58 @@
+################################################################################
+# Sheet Fetch Tests
+##
+# @file test_sheet_fetch.py
+# @date: 2025
+################################################################################
+"""
+Tests for fetching sheets through the cache: concurrent requests share one
+upstream call and a sheet pointed at another document is fetched again.
+"""
+
+# Native imports
+import asyncio
+
+# Other files imports
+from src.api_endpoints.routers.jobs_info.jobs_utils import fetch_jobs_from_sheets, get_jobs_cache
+
+def test_concurrent_fetches_share_one_download(fake_sheet):
+    fake_sheet["delay"] = 0.2
+
+    async def scenario():
+        return await asyncio.gather(*(fetch_jobs_from_sheets() for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert fake_sheet["calls"] == 1
+    assert all(jobs is results[0] for jobs in results)
+    assert [job["company"] for job in results[0]] == ["Acme", "Globex"]
+
+def test_sheets_are_fetched_separately(fake_sheet, config):
+    config["sheets"]["allowlist"] = {"archive": {"doc_id": "archive-doc"}}
+
+    async def scenario():
+        return await asyncio.gather(fetch_jobs_from_sheets(),
+                                    fetch_jobs_from_sheets(sheet="archive"))
+
+    default_jobs, archive_jobs = asyncio.run(scenario())
+    assert fake_sheet["calls"] == 2
+    assert get_jobs_cache()["version"] != get_jobs_cache("archive")["version"]
+    assert default_jobs == archive_jobs
+
+def test_cached_sheet_is_not_downloaded_again(fake_sheet):
+    asyncio.run(fetch_jobs_from_sheets())
+    asyncio.run(fetch_jobs_from_sheets())
+    assert fake_sheet["calls"] == 1
+
+def test_changed_source_is_fetched_again(fake_sheet, config):
+    config["sheets"]["allowlist"] = {"archive": {"doc_id": "archive-doc"}}
+    asyncio.run(fetch_jobs_from_sheets(sheet="archive"))
+
+    # A reload points the sheet at another document, the cached jobs must not be served
+    config["sheets"]["allowlist"] = {"archive": {"doc_id": "other-doc"}}
+    fake_sheet["csv"] = ("Company,Position,Link\n"
+                         "Initech,QA Engineer,https://initech.example.com/jobs/3")
+    jobs = asyncio.run(fetch_jobs_from_sheets(sheet="archive"))
+
+    assert fake_sheet["calls"] == 2
+    assert [job["company"] for job in jobs] == ["Initech"]
+    assert get_jobs_cache("archive")["source"][0] == "other-doc"
@@ -0,0 +1,64 @@
+################################################################################
+# Job Row Validation Tests
+##
+# @file test_validators.py
+# @date: 2025
+################################################################################
+"""
+Tests for batch validation of job rows: kept and rejected rows, counters per
+rule and links replaced with the "#" placeholder.
+"""
+
+# Other files imports
+from src.utils.validators import validate_job_rows
+
+def job(company, title, link):
+    return {"company": company, "job_title": title, "link": link}
+
+def test_valid_rows_are_kept_unchanged(config):
+    jobs = [
+        job("Acme", "Backend Developer", "https://acme.example.com/jobs/1"),
+        job("Globex", "Data Engineer", "globex.example.com/jobs/2"),
+        job("Initech", "QA Engineer", "#"),
+    ]
+    valid_jobs, stats = validate_job_rows(jobs)
+
+    assert valid_jobs == jobs
+    assert stats == {"checked_rows": 3, "rejected_rows": 0, "rejections": {}, "replaced_links": 0}
+
+def test_link_only_failures_keep_the_posting(config):
+    jobs = [
+        job("Acme", "Backend Developer", "N/A"),
+        job("Globex", "Data Engineer", "apply by email"),
+        job("Initech", "QA Engineer", "https://initech.example.com/" + "x" * 2048),
+    ]
+    valid_jobs, stats = validate_job_rows(jobs)
+
+    assert [entry["link"] for entry in valid_jobs] == ["#", "#", "#"]
+    assert [entry["company"] for entry in valid_jobs] == ["Acme", "Globex", "Initech"]
+    assert stats["replaced_links"] == 3
+    assert stats["rejected_rows"] == 0
+    # The input rows are not modified
+    assert jobs[0]["link"] == "N/A"
+
+def test_rejections_are_counted_per_rule(config):
+    jobs = [
+        job("Acme", "Backend Developer", "https://acme.example.com/jobs/1"),
+        job("", "Data Engineer", "https://globex.example.com/jobs/2"),
+        job("Initech", "Q" * 301, "not a link"),
+        job("Umbrella\x00", "Chemist", "https://umbrella.example.com/jobs/3"),
+        job("Hooli", "Developer", "N/A"),
+    ]
+    valid_jobs, stats = validate_job_rows(jobs)
+
+    assert [entry["company"] for entry in valid_jobs] == ["Acme", "Hooli"]
+    assert stats["checked_rows"] == 5
+    assert stats["rejected_rows"] == 3
+    assert stats["replaced_links"] == 1
+    # A row breaking several rules counts for each of them
+    assert stats["rejections"] == {
+        "missing_company": 1,
+        "too_long_job_title": 1,
+        "invalid_link": 1,
+        "disallowed_characters_company": 1
+    }